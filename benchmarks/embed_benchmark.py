@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Embed Benchmark
+Speichere als: benchmarks/embed_benchmark.py
+
+Misst den Durchsatz der Embed-Erstellung (Match- und Streamer-Embeds aus utils/embeds) mit der
+echten config.json und vergleicht die Config-Zugriffe pro Embed:
+  - legacy:   hasattr(bot, 'config') + verschachtelte dict.get() pro Aufruf (alter TimezoneHelper/ConfigHelper)
+  - settings: vorkompilierte Attribute aus bot.settings (utils/bot_settings.py)
+
+Aufruf:  python benchmarks/embed_benchmark.py [--iterations 20000] [--json ergebnis.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from database.db_manager import DatabaseManager  # noqa: E402
+from utils.bot_settings import BotSettings  # noqa: E402
+from utils.match_time import MatchClock  # noqa: E402
+from utils.embeds.match_embeds import MatchEmbeds  # noqa: E402
+from utils.embeds.streamer_embeds import StreamerEmbeds  # noqa: E402
+
+MATCH_TUPLE = (
+    42, 1, 2, '2025-08-09', '20:30', 'Carentan', 'US', 'GER', None, None,
+    'pending', None, None, 3, None, None, 'Alpha Squad', 'Bravo Company'
+)
+MATCH_DICT = {
+    'match_id': 42, 'team1_name': 'Alpha Squad', 'team2_name': 'Bravo Company',
+    'match_date': '2025-08-09', 'match_time': '20:30', 'map_name': 'Carentan',
+    'team1_side': 'US', 'team2_side': 'GER', 'week': 3
+}
+STREAMERS = [
+    {'streamer_id': 1001, 'team_side': 'team1', 'stream_url': 'https://twitch.tv/one'},
+    {'streamer_id': 1002, 'team_side': 'team2', 'stream_url': 'https://twitch.tv/two'}
+]
+
+
+def legacy_values(bot, team1_side: str, team2_side: str, match_time: str):
+    """Die Config-Zugriffe eines Embeds so, wie sie vor bot.settings pro Aufruf liefen"""
+    def side(team_side):
+        if bot and hasattr(bot, 'config') and bot.config:
+            icon = bot.config.get('team_icons', {}).get(team_side.upper(), '')
+            if icon:
+                return f"{team_side} {icon}"
+        return team_side
+
+    def server(key, default):
+        if bot and hasattr(bot, 'config') and bot.config:
+            return bot.config.get('server', {}).get(key, default)
+        return default
+
+    rules_url = bot.config.get('rules', {}).get('onm_url', '#') if bot and hasattr(bot, 'config') and bot.config else '#'
+    return (
+        side(team1_side), side(team2_side),
+        f"{match_time} {server('timezone', 'UTC')}",
+        f"⏰ **{server('timezone_info', 'All times are in UTC')}**",
+        rules_url
+    )
+
+
+def settings_values(bot, team1_side: str, team2_side: str, match_time: str):
+    settings = bot.settings
+    return (
+        settings.side_label(team1_side), settings.side_label(team2_side),
+        settings.format_time(match_time), settings.timezone_warning, settings.rules_url
+    )
+
+
+def per_second(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Durchsatz der Embed-Erstellung mit vorkompilierten Settings")
+    parser.add_argument('--iterations', type=int, default=20000, help="Durchläufe pro Messung")
+    parser.add_argument('--json', dest='json_path', help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    with open(os.path.join(REPO_ROOT, 'config.json'), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    bot = SimpleNamespace(
+        config=config,
+        settings=BotSettings.from_config(config),
+        db=DatabaseManager(':memory:'),
+        display_names=SimpleNamespace(resolve=lambda user_id: f"Streamer {user_id}")
+    )
+    # Match 42 mit gespeichertem UTC Zeitpunkt -> Embeds rendern <t:epoch:F>
+    team1_id = bot.db.create_team('Alpha Squad', 1)
+    team2_id = bot.db.create_team('Bravo Company', 2)
+    for _ in range(MATCH_TUPLE[0]):
+        match_id = bot.db.create_match(team1_id, team2_id, MATCH_TUPLE[3], MATCH_TUPLE[5], 'US', 'GER', 0, 3)
+    bot.match_clock = MatchClock(bot)
+    bot.match_clock.set_match_time(match_id, MATCH_TUPLE[3], MATCH_TUPLE[4])
+    assert legacy_values(bot, 'US', 'GER', '20:30') == settings_values(bot, 'US', 'GER', '20:30')
+
+    cases = {
+        'config_values_legacy': lambda: legacy_values(bot, 'US', 'GER', '20:30'),
+        'config_values_settings': lambda: settings_values(bot, 'US', 'GER', '20:30'),
+        'private_match_embed': lambda: MatchEmbeds.create_updated_private_match_embed(MATCH_TUPLE, bot),
+        'public_match_embed': lambda: MatchEmbeds.create_updated_public_match_embed(MATCH_TUPLE, bot),
+        'streamer_match_embed': lambda: StreamerEmbeds.create_streamer_match_embed(MATCH_DICT, STREAMERS, bot),
+        'public_embed_with_streamers': lambda: StreamerEmbeds.create_public_embed_with_streamers(MATCH_DICT, STREAMERS, bot),
+    }
+
+    results = {'iterations': args.iterations, 'per_second': {}}
+    print(f"{'case':<30} {'ops/s':>12}")
+    for name, func in cases.items():
+        func()
+        rate = per_second(func, args.iterations)
+        results['per_second'][name] = round(rate)
+        print(f"{name:<30} {rate:>12,.0f}")
+
+    legacy = results['per_second']['config_values_legacy']
+    compiled = results['per_second']['config_values_settings']
+    print(f"\n⚙️ Config lookups per embed: {compiled / legacy:.1f}x faster with bot.settings")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.json_path}")
+
+
+if __name__ == '__main__':
+    main()
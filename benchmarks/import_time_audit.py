@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Import-Time Audit
+Speichere als: benchmarks/import_time_audit.py
+
+Startet `python -X importtime -c "import main"` in einem frischen Prozess, wertet den
+Import-Graphen aus und prüft ihn gegen benchmarks/import_budget.json:
+  - Gesamtzeit (kumulativ) des Entry-Moduls
+  - Budgets für einzelne Module
+  - Module, die beim Start NICHT geladen werden dürfen (Lazy Loading)
+
+Aufruf:  python benchmarks/import_time_audit.py [--top 25] [--json ergebnis.json]
+Exit-Code 1, wenn ein Budget überschritten wird.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'import_budget.json')
+
+
+def run_importtime(entry_module: str) -> str:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {entry_module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:], file=sys.stderr)
+        raise SystemExit(f"❌ import {entry_module} failed (exit {result.returncode})")
+    return result.stderr
+
+
+def parse_importtime(output: str) -> dict:
+    """
+    Zeilen haben das Format: 'import time:  self [us] | cumulative | imported package'
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            _, payload = line.split(':', 1)
+            self_us, cumulative_us, name = payload.split('|', 2)
+            module_name = name.strip()
+            modules[module_name] = {
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000,
+                'depth': (len(name) - len(name.lstrip())) // 2
+            }
+        except ValueError:
+            continue
+    return modules
+
+
+def check_budget(modules: dict, budget: dict) -> list:
+    violations = []
+
+    entry = modules.get(budget['entry_module'])
+    if entry and entry['cumulative_ms'] > budget['total_cumulative_ms']:
+        violations.append(f"{budget['entry_module']}: {entry['cumulative_ms']:.1f}ms > {budget['total_cumulative_ms']}ms total budget")
+
+    for module_name, limit_ms in budget.get('module_budgets_ms', {}).items():
+        stats = modules.get(module_name)
+        if stats and stats['cumulative_ms'] > limit_ms:
+            violations.append(f"{module_name}: {stats['cumulative_ms']:.1f}ms > {limit_ms}ms budget")
+
+    for module_name in budget.get('deferred_modules', []):
+        if module_name in modules:
+            violations.append(f"{module_name}: imported at startup but should be lazy-loaded")
+
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-Time Audit gegen benchmarks/import_budget.json")
+    parser.add_argument('--top', type=int, default=25, help="Anzahl der teuersten Module in der Ausgabe")
+    parser.add_argument('--json', dest='json_path', help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    modules = parse_importtime(run_importtime(budget['entry_module']))
+    violations = check_budget(modules, budget)
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    ranked = sorted(modules.items(), key=lambda item: item[1]['cumulative_ms'], reverse=True)
+    for module_name, stats in ranked[:args.top]:
+        print(f"{stats['cumulative_ms']:>14.1f} {stats['self_ms']:>9.1f}  {module_name}")
+
+    entry = modules.get(budget['entry_module'], {})
+    print(f"\n📦 {len(modules)} modules imported, {budget['entry_module']} cumulative: {entry.get('cumulative_ms', 0):.1f}ms")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'modules': modules, 'violations': violations}, f, indent=2)
+
+    if violations:
+        print("\n❌ Import budget violations:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+
+    print("✅ Import budget OK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
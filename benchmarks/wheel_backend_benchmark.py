@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Wheel Backend Benchmark
+Speichere als: benchmarks/wheel_backend_benchmark.py
+
+Vergleicht Frames pro Sekunde der Render-Backends (Pillow vs. NumPy) für das Map Wheel
+des aktuellen Map Pools. Die einmaligen Caches (Basis-Scheibe, Polar-Lookup) werden vorher
+aufgebaut und separat als Setup-Zeit ausgewiesen.
+
+Aufruf:  python benchmarks/wheel_backend_benchmark.py [--frames 100] [--json ergebnis.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from wheel.config_loader import WheelConfigLoader  # noqa: E402
+from wheel.numpy_renderer import NumpyWheelRenderer, NUMPY_AVAILABLE  # noqa: E402
+from wheel.wheel_renderer import WheelRenderer  # noqa: E402
+
+
+def measure(render_frame, options: tuple, frame_count: int) -> dict:
+    start = time.perf_counter()
+    render_frame(options, 0.0)
+    setup_ms = (time.perf_counter() - start) * 1000
+
+    # Nicht quantisierungs-gleiche Winkel, damit kein Frame doppelt ist
+    angles = [(i * 7.3 + 0.5) % 360 for i in range(frame_count)]
+    start = time.perf_counter()
+    for angle in angles:
+        render_frame(options, angle)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'setup_ms': round(setup_ms, 1),
+        'frames': frame_count,
+        'total_ms': round(elapsed * 1000, 1),
+        'fps': round(frame_count / elapsed, 1) if elapsed else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frames pro Sekunde: Pillow vs. NumPy Wheel Backend")
+    parser.add_argument('--frames', type=int, default=100, help="Anzahl gerenderter Frames pro Backend")
+    parser.add_argument('--json', dest='json_path', help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    options = tuple(WheelConfigLoader.load_maps())
+    backends = {'pillow': WheelRenderer.render_frame}
+    if NUMPY_AVAILABLE:
+        backends['numpy'] = NumpyWheelRenderer.render_frame
+    else:
+        print("⚠️ numpy not installed - only the Pillow backend is measured")
+
+    results = {}
+    print(f"{'backend':<8} {'setup ms':>9} {'total ms':>9} {'fps':>8}")
+    for name, render_frame in backends.items():
+        results[name] = measure(render_frame, options, args.frames)
+        stats = results[name]
+        print(f"{name:<8} {stats['setup_ms']:>9.1f} {stats['total_ms']:>9.1f} {stats['fps']:>8.1f}")
+
+    if 'numpy' in results and results['pillow']['fps']:
+        print(f"\n⚡ NumPy speedup: {results['numpy']['fps'] / results['pillow']['fps']:.2f}x")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
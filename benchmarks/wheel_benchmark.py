@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Wheel Benchmark + Regression Suite
+Speichere als: benchmarks/wheel_benchmark.py
+
+Rendert Wheels mit 2, 3, 9 und 24 Optionen und misst pro Größe:
+  - Zeit pro Frame (create_wheel_frame bei wechselnden Winkeln, Basis-Scheibe bereits gecacht)
+  - Gesamtzeit für das fertige GIF (Rendern + Encoding mit den Settings aus config.json)
+  - Peak Memory (tracemalloc) während des GIF Renderings
+  - Output Bytes
+  - Event-Loop Blocking: maximale Heartbeat-Verzögerung, einmal inline gerendert und
+    einmal über den Render Pool
+Golden Images: feste Frames pro Größe werden gegen benchmarks/golden/ verglichen, damit
+Performance-Refactorings das Aussehen nicht verändern. Die eingecheckten Goldens stammen vom
+ursprünglichen create_wheel_frame (pro Frame neu gezeichnet, ea11fae). Fehlt ein Golden, schlägt
+der Vergleich fehl - nur --update-golden schreibt sie neu.
+
+Ergebnisse landen als JSON in benchmarks/results/<git-rev>.json; --compare alt.json zeigt
+die Veränderung gegenüber einem früheren Commit.
+
+Aufruf:  python benchmarks/wheel_benchmark.py [--sizes 2 3 9 24] [--backend pillow|numpy]
+                                             [--update-golden] [--no-pool] [--compare alt.json]
+Exit-Code 1, wenn ein Golden-Image-Vergleich fehlschlägt.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from PIL import Image, ImageChops, ImageFilter  # noqa: E402
+
+from wheel.config_loader import WheelConfigLoader  # noqa: E402
+from wheel.gif_encoder import encoder_settings  # noqa: E402
+from wheel.render_pool import WheelRenderPool  # noqa: E402
+from wheel.wheel_generator import WheelGenerator  # noqa: E402
+from wheel.wheel_renderer import WheelRenderer  # noqa: E402
+
+GOLDEN_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'golden')
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+DEFAULT_SIZES = (2, 3, 9, 24)
+GOLDEN_ANGLES = (0.0, 37.5, 211.25)
+# Ein Pixel gilt als abweichend, wenn er um mehr als GOLDEN_PIXEL_THRESHOLD (0-255) außerhalb von
+# Minimum/Maximum der 3x3-Nachbarschaft des anderen Bildes liegt - 1px Versatz an Kanten (Rotation
+# statt Neuzeichnen) zählt so nicht, geänderte Farben, Labels oder Winkel schon
+GOLDEN_PIXEL_THRESHOLD = 48
+# Anteil abweichender Pixel in Prozent, ab dem ein Frame als verändert gilt
+GOLDEN_TOLERANCE = 0.75
+FRAME_SAMPLES = 30
+HEARTBEAT_INTERVAL = 0.005
+
+
+def options_for(size: int) -> list:
+    maps = WheelConfigLoader.load_maps()
+    if size == len(maps):
+        return maps
+    return [f"Option {i + 1}" for i in range(size)]
+
+
+def load_render_config() -> dict:
+    try:
+        with open(os.path.join(REPO_ROOT, 'config.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('wheel_render', {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def measure_frames(options: list, frame_renderer) -> float:
+    frame_renderer(tuple(options), 0.0)
+    angles = [(i * 11.7 + 0.3) % 360 for i in range(FRAME_SAMPLES)]
+    start = time.perf_counter()
+    for angle in angles:
+        frame_renderer(tuple(options), angle)
+    return (time.perf_counter() - start) * 1000 / FRAME_SAMPLES
+
+
+def measure_gif(options: list, encoder: dict) -> dict:
+    total_rotation, final_angle = WheelGenerator.spin_parameters_for_variant(options, 0, 3, 5)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    buffer, extension = WheelRenderer.render_animation(options, 0, total_rotation, final_angle, encoder)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'gif_ms': round(elapsed_ms, 1),
+        'peak_memory_mb': round(peak / 1024 / 1024, 1),
+        'bytes': len(buffer.getvalue()),
+        'extension': extension
+    }
+
+
+async def _max_heartbeat_lag(work) -> float:
+    """Maximale Verspätung eines 5ms-Heartbeats, während `work` läuft"""
+    lags = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        loop = asyncio.get_running_loop()
+        while not done.is_set():
+            expected = loop.time() + HEARTBEAT_INTERVAL
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lags.append(max(0.0, loop.time() - expected))
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await work()
+    finally:
+        done.set()
+        await beat
+    return round(max(lags, default=0.0) * 1000, 1)
+
+
+async def measure_loop_blocking(options: list, encoder: dict, pool) -> dict:
+    total_rotation, final_angle = WheelGenerator.spin_parameters_for_variant(options, 0, 3, 5)
+
+    async def inline():
+        WheelRenderer.render_animation(options, 0, total_rotation, final_angle, encoder)
+
+    result = {'inline_max_block_ms': await _max_heartbeat_lag(inline)}
+
+    if pool is not None:
+        async def pooled():
+            await pool.render(options, 0, total_rotation, final_angle)
+        result['pool_max_block_ms'] = await _max_heartbeat_lag(pooled)
+
+    return result
+
+
+def golden_frame_renderer(backend: str):
+    """
+    Pillow: geprüft wird WheelGenerator.create_wheel_frame selbst (öffentlicher Einstiegspunkt).
+    NumPy: gleiche Golden Images, damit beide Backends gegeneinander abgesichert sind
+    """
+    if WheelRenderer.frame_renderer_for(backend) is WheelRenderer.render_frame:
+        return lambda options, angle, winner: WheelGenerator.create_wheel_frame(
+            options, angle, show_winner=winner is not None, selected_option=winner)
+
+    renderer = WheelRenderer.frame_renderer_for(backend)
+    return lambda options, angle, winner: renderer(
+        tuple(options), angle, highlight_index=options.index(winner) if winner is not None else -1)
+
+
+def _outside_neighbourhood(image: Image.Image, reference: Image.Image) -> Image.Image:
+    low = reference.filter(ImageFilter.MinFilter(3))
+    high = reference.filter(ImageFilter.MaxFilter(3))
+    return ImageChops.add(ImageChops.subtract(image, high), ImageChops.subtract(low, image))
+
+
+def golden_diff_percent(frame: Image.Image, golden: Image.Image) -> float:
+    """Anteil der Pixel (%), die in keinem der beiden Bilder in der 3x3-Nachbarschaft vorkommen"""
+    difference = ImageChops.lighter(_outside_neighbourhood(frame, golden), _outside_neighbourhood(golden, frame))
+    histogram = difference.convert('L').histogram()
+    return sum(histogram[GOLDEN_PIXEL_THRESHOLD + 1:]) * 100 / sum(histogram)
+
+
+def check_golden(size: int, options: list, golden_renderer, update: bool) -> dict:
+    checks = []
+    frames = [(angle, None) for angle in GOLDEN_ANGLES] + [(GOLDEN_ANGLES[-1], options[0])]
+
+    for position, (angle, winner) in enumerate(frames):
+        frame = golden_renderer(options, angle, winner).convert('RGB')
+        golden_path = os.path.join(GOLDEN_DIR, f"wheel_{size}_{position}.png")
+
+        if update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            frame.save(golden_path, format='PNG', optimize=True)
+            checks.append({'frame': position, 'status': 'written'})
+            continue
+
+        if not os.path.exists(golden_path):
+            checks.append({'frame': position, 'status': 'failed', 'reason': f'missing golden {golden_path}'})
+            continue
+
+        with Image.open(golden_path) as golden:
+            golden_rgb = golden.convert('RGB')
+        if golden_rgb.size != frame.size:
+            checks.append({'frame': position, 'status': 'failed', 'reason': f'size {frame.size} != {golden_rgb.size}'})
+            continue
+
+        diff_percent = golden_diff_percent(frame, golden_rgb)
+        checks.append({
+            'frame': position,
+            'status': 'ok' if diff_percent <= GOLDEN_TOLERANCE else 'failed',
+            'diff_percent': round(diff_percent, 3)
+        })
+
+    return {'checks': checks, 'passed': all(check['status'] != 'failed' for check in checks)}
+
+
+def compare(results: dict, previous_path: str):
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        previous = json.load(f)
+
+    print(f"\n📈 Compared with {previous.get('revision', '?')} ({previous_path})")
+    for size, stats in results['sizes'].items():
+        before = previous.get('sizes', {}).get(size)
+        if not before:
+            continue
+        changes = []
+        for metric in ('frame_ms', 'gif_ms', 'peak_memory_mb', 'bytes'):
+            if before.get(metric):
+                delta = (stats[metric] - before[metric]) / before[metric] * 100
+                changes.append(f"{metric} {delta:+.1f}%")
+        print(f"  {size:>3} options: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark + Golden-Image Regression für wheel/")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Anzahl Optionen pro Wheel")
+    parser.add_argument('--backend', choices=('pillow', 'numpy'), help="Render-Backend (Default: config.json)")
+    parser.add_argument('--update-golden', action='store_true',
+                        help="Golden Images neu schreiben (nur bei gewollten Änderungen am Aussehen)")
+    parser.add_argument('--no-pool', action='store_true', help="Event-Loop Messung ohne Render Pool")
+    parser.add_argument('--compare', help="Früheres Ergebnis-JSON zum Vergleich")
+    parser.add_argument('--output', help="Pfad für das Ergebnis-JSON (Default: benchmarks/results/<rev>.json)")
+    args = parser.parse_args()
+
+    render_config = load_render_config()
+    if args.backend:
+        render_config['backend'] = args.backend
+    encoder = encoder_settings(render_config)
+    frame_renderer = WheelRenderer.frame_renderer_for(encoder['backend'])
+    golden_renderer = golden_frame_renderer(encoder['backend'])
+
+    pool = None
+    if not args.no_pool:
+        pool = WheelRenderPool(workers=1, max_queue_depth=1, timeout_seconds=120, encoder=encoder)
+        pool.start()
+
+    results = {
+        'revision': git_revision(),
+        'created_at': datetime.now().isoformat(),
+        'encoder': encoder,
+        'sizes': {}
+    }
+    golden_passed = True
+
+    print(f"{'options':>7} {'frame ms':>9} {'gif ms':>8} {'peak MB':>8} {'bytes':>9} {'block ms':>9} {'pool block':>10}  golden")
+    try:
+        for size in args.sizes:
+            options = options_for(size)
+            stats = {'frame_ms': round(measure_frames(options, frame_renderer), 2)}
+            stats.update(measure_gif(options, encoder))
+            stats.update(asyncio.run(measure_loop_blocking(options, encoder, pool)))
+            stats['golden'] = check_golden(size, options, golden_renderer, args.update_golden)
+            golden_passed = golden_passed and stats['golden']['passed']
+            results['sizes'][str(size)] = stats
+
+            golden_label = 'ok' if stats['golden']['passed'] else 'FAILED'
+            print(f"{size:>7} {stats['frame_ms']:>9.2f} {stats['gif_ms']:>8.1f} {stats['peak_memory_mb']:>8.1f} "
+                  f"{stats['bytes']:>9} {stats['inline_max_block_ms']:>9.1f} {stats.get('pool_max_block_ms', '-'):>10}  {golden_label}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    output_path = args.output or os.path.join(RESULTS_DIR, f"{results['revision']}.json")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results written to {output_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    if not golden_passed:
+        print("\n❌ Golden image check failed - the wheel looks different than before")
+        for size, stats in results['sizes'].items():
+            for check in stats['golden']['checks']:
+                if check['status'] == 'failed':
+                    detail = check.get('reason') or f"{check['diff_percent']}% pixels differ"
+                    print(f"  {size:>3} options, frame {check['frame']}: {detail}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
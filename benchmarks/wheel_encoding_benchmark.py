@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Wheel Encoding Benchmark
+Speichere als: benchmarks/wheel_encoding_benchmark.py
+
+Rendert ein Map Wheel (aktueller Map Pool aus map_config.json) einmal und vergleicht die
+Encoder-Modi aus wheel/gif_encoder.py:
+  - Bytes der Datei
+  - Encode-Zeit
+  - Upload-Zeit: geschätzt über --mbps oder gemessen per HTTP POST an --upload-url
+    (z.B. ein Discord Webhook eines Test-Channels)
+
+Aufruf:  python benchmarks/wheel_encoding_benchmark.py [--runs 3] [--mbps 10] [--upload-url URL] [--json ergebnis.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+import uuid
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from PIL import features  # noqa: E402
+
+from wheel.config_loader import WheelConfigLoader  # noqa: E402
+from wheel.gif_encoder import WheelEncoder, encoder_settings  # noqa: E402
+from wheel.wheel_generator import WheelGenerator  # noqa: E402
+from wheel.wheel_renderer import WheelRenderer  # noqa: E402
+
+
+def upload_seconds(data: bytes, filename: str, url: str) -> float:
+    """Multipart POST (Discord Webhook kompatibel), gemessen inkl. Antwort"""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode('utf-8') + data + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+    request = urllib.request.Request(url, data=body, method='POST', headers={
+        'Content-Type': f'multipart/form-data; boundary={boundary}',
+        'User-Agent': 'wheel-encoding-benchmark'
+    })
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vergleicht Bytes, Encode- und Upload-Zeit der Wheel-Encoder")
+    parser.add_argument('--runs', type=int, default=3, help="Encode-Durchläufe pro Modus (Median wird berichtet)")
+    parser.add_argument('--mbps', type=float, default=10.0, help="Upload-Bandbreite für die Schätzung")
+    parser.add_argument('--upload-url', help="Tatsächlicher Upload per HTTP POST (z.B. Test-Webhook)")
+    parser.add_argument('--json', dest='json_path', help="Ergebnis zusätzlich als JSON speichern")
+    args = parser.parse_args()
+
+    maps = WheelConfigLoader.load_maps()
+    total_rotation, final_angle = WheelGenerator.spin_parameters_for_variant(maps, 0, 4, 5)
+
+    start = time.perf_counter()
+    frames, durations = WheelRenderer.render_frames(maps, 0, total_rotation, final_angle)
+    render_ms = (time.perf_counter() - start) * 1000
+
+    modes = {
+        'pillow': {'encoder': 'pillow', 'format': 'gif'},
+        'compact': {'encoder': 'compact', 'format': 'gif'},
+    }
+    if features.check('webp_anim'):
+        modes['webp'] = {'encoder': 'compact', 'format': 'webp'}
+
+    results = {'render_ms': round(render_ms, 1), 'frames': len(frames), 'modes': {}}
+
+    print(f"🎨 Rendered {len(frames)} frames in {render_ms:.1f}ms\n")
+    print(f"{'mode':<10} {'bytes':>10} {'encode ms':>10} {'upload ms':>10}")
+
+    for mode, settings in modes.items():
+        timings = []
+        for _ in range(max(1, args.runs)):
+            start = time.perf_counter()
+            data, extension = WheelEncoder.encode(frames, durations, encoder_settings(settings))
+            timings.append((time.perf_counter() - start) * 1000)
+        encode_ms = sorted(timings)[len(timings) // 2]
+
+        if args.upload_url:
+            upload_ms = upload_seconds(data, f'benchmark_{mode}.{extension}', args.upload_url) * 1000
+            upload_kind = 'measured'
+        else:
+            upload_ms = len(data) * 8 / (args.mbps * 1_000_000) * 1000
+            upload_kind = f'estimated@{args.mbps}Mbps'
+
+        results['modes'][mode] = {
+            'bytes': len(data),
+            'extension': extension,
+            'encode_ms': round(encode_ms, 1),
+            'upload_ms': round(upload_ms, 1),
+            'upload': upload_kind
+        }
+        print(f"{mode:<10} {len(data):>10} {encode_ms:>10.1f} {upload_ms:>10.1f}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,37 +4,57 @@ import discord
 from discord.ext import commands
 import logging
 import asyncio
+import hashlib
+import json
 from datetime import datetime
 from typing import Dict, Any, Optional, List
+from functools import cached_property
 from database.db_manager import DatabaseManager
-from utils.lazy_persistence_service import LazyPersistenceService
-from utils.fast_startup_persistence import FastStartupPersistence
 from utils.team_config_loader import TeamConfigLoader
-from utils.public_channel_status_manager import PublicChannelStatusManager
-from utils.timezone_helper import TimezoneHelper
+from utils.bot_settings import BotSettings
+from utils.member_cache import MemberCache
+from utils.role_index import RoleIndex
+from utils.display_name_resolver import DisplayNameResolver
+from utils.startup_profiler import StartupProfiler, DEFAULT_KEEP_REPORTS, peak_rss_mb
 
 logger = logging.getLogger(__name__)
 
+COMMAND_TREE_HASH_KEY = 'app_command_tree_hash'
+
 class TournamentBot(commands.Bot):
-    def __init__(self, config):
+    def __init__(self, config, profiler: Optional[StartupProfiler] = None):
         intents = discord.Intents.default()
         intents.message_content = True
         intents.reactions = True
         intents.members = True  
-        super().__init__(command_prefix=config['bot']['prefix'], intents=intents)
+        # member_cache.policy 'lazy' deaktiviert das Member-Chunking beim Startup
+        super().__init__(command_prefix=config['bot']['prefix'], intents=intents, **MemberCache.client_options(config))
         
         self.config = config
-        self.db = DatabaseManager()
-        self.lazy_persistence = LazyPersistenceService(self)
-        self.fast_startup = FastStartupPersistence(self)
-        self.team_loader = TeamConfigLoader(self)
+        # Vorkompilierte Embed-Werte (Timezone, Rules URL, Team-Icons) - Hot Reload tauscht sie aus
+        self.settings = BotSettings.from_config(config)
+        self.startup_profiler = profiler or StartupProfiler()
         
-        # Public Embed Updater hinzufügen
-        from utils.public_embed_updater import PublicEmbedUpdater
-        self.public_updater = PublicEmbedUpdater(self)
+        with self.startup_profiler.phase('database_init'):
+            self.db = DatabaseManager()
+        self.startup_profiler.attach_database(self.db)
         
-        self.status_manager = PublicChannelStatusManager(self)
+        self.team_loader = TeamConfigLoader(self)
+        self.member_cache = MemberCache(self)
+        self.role_index = RoleIndex(self)
+        self.display_names = DisplayNameResolver(self)
         
+        self._apply_config_attributes(config)
+        
+        self.restoration_complete = False
+        self.startup_complete = False
+        self.restoration_stats = None
+        self.startup_tasks = []
+    
+    def _apply_config_attributes(self, config):
+        """
+        Werte aus config.json, die als Attribute gelesen werden - auch beim Hot Reload (config_reloader.py)
+        """
         self.STREAMER_ROLE_ID = config['roles'].get('streamer_role_id')
         self.EVENT_ORGA_ROLE_ID = config['roles'].get('event_orga_role_id')
         self.MATCH_CATEGORY_ID = config['categories'].get('match_category_id')
@@ -42,9 +62,68 @@ class TournamentBot(commands.Bot):
         self.PUBLIC_MATCHES_CATEGORY_ID = config['categories'].get('public_matches_category_id')
         self.TOURNAMENT_NAME = config['tournament'].get('name', 'Tournament')
         self.CURRENT_WEEK = config['tournament'].get('current_week', 1)
-        
-        self.restoration_complete = False
-        self.startup_tasks = []
+    
+    # Persistence Services und Updater werden erst beim ersten Zugriff importiert und erstellt,
+    # damit die Gateway-Verbindung nicht auf deren Imports warten muss.
+    @cached_property
+    def config_reloader(self):
+        from utils.config_reloader import ConfigReloader
+        return ConfigReloader(self)
+    
+    @cached_property
+    def scheduler(self):
+        from utils.scheduler import JobScheduler
+        return JobScheduler(self)
+    
+    @cached_property
+    def match_jobs(self):
+        from utils.match_jobs import MatchJobs
+        return MatchJobs(self)
+    
+    @cached_property
+    def outbox(self):
+        from utils.outbox import Outbox
+        return Outbox(self)
+    
+    @cached_property
+    def match_effects(self):
+        from utils.match_effects import MatchEffects
+        return MatchEffects(self)
+    
+    @cached_property
+    def match_locks(self):
+        from utils.match_locks import MatchLocks
+        return MatchLocks(self)
+    
+    @cached_property
+    def match_clock(self):
+        from utils.match_time import MatchClock
+        return MatchClock(self)
+    
+    @cached_property
+    def lazy_persistence(self):
+        from utils.lazy_persistence_service import LazyPersistenceService
+        return LazyPersistenceService(self)
+    
+    @cached_property
+    def fast_startup(self):
+        from utils.fast_startup_persistence import FastStartupPersistence
+        return FastStartupPersistence(self)
+    
+    @cached_property
+    def public_updater(self):
+        from utils.public_embed_updater import PublicEmbedUpdater
+        return PublicEmbedUpdater(self)
+    
+    @cached_property
+    def status_manager(self):
+        from utils.public_channel_status_manager import PublicChannelStatusManager
+        return PublicChannelStatusManager(self)
+    
+    async def on_connect(self):
+        # Zeitpunkt der ersten Gateway-Verbindung für den Startup Report
+        if not self.startup_profiler.finished and not any(phase['name'] == 'gateway_connect' for phase in self.startup_profiler.phases):
+            self.startup_profiler.record_phase('gateway_connect', 0)
     
     async def create_public_match_channel(self, guild: discord.Guild, match_id: int, team1_name: str, team2_name: str, week: int, prefix: str = "") -> Optional[discord.TextChannel]:
         """
@@ -207,7 +286,7 @@ class TournamentBot(commands.Bot):
                     )
                     
                     # TIMEZONE SUPPORT: Timezone-Info in Archive-Message
-                    timezone_warning = TimezoneHelper.get_timezone_warning_text(self)
+                    timezone_warning = self.settings.timezone_warning
                     
                     # Archiv-Nachricht senden
                     if result_data:
@@ -256,18 +335,18 @@ class TournamentBot(commands.Bot):
             except Exception as embed_error:
                 logger.error(f"Error creating embed: {embed_error}")
                 formatted_date = self._format_date_display(match_data.get('match_date', 'TBA'))
-                team1_side_with_icon = self._format_team_side_with_icon(match_data['team1_side'])
-                team2_side_with_icon = self._format_team_side_with_icon(match_data['team2_side'])
+                team1_side_with_icon = self.settings.side_label(match_data['team1_side'])
+                team2_side_with_icon = self.settings.side_label(match_data['team2_side'])
                 
                 # TIMEZONE SUPPORT: Zeit mit Timezone formatieren für Fallback-Embed
                 raw_match_time = match_data.get('match_time', '*TBA*')
                 if raw_match_time and raw_match_time != '*TBA*':
-                    formatted_time = TimezoneHelper.format_time_with_timezone(raw_match_time, self)
+                    formatted_time = self.match_clock.render(match_id, raw_match_time, match_data.get('match_date'))
                 else:
                     formatted_time = '*TBA*'
                 
                 # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-                timezone_warning = TimezoneHelper.get_timezone_warning_text(self)
+                timezone_warning = self.settings.local_time_note
                 
                 embed = discord.Embed(
                     title=f"🏆 Week {match_data.get('week', 'N/A')}: {match_data['team1_name']} vs {match_data['team2_name']}",
@@ -283,8 +362,7 @@ class TournamentBot(commands.Bot):
                 )
                 embed.add_field(name="👥 Teams", value=f"{team1_role.mention} vs {team2_role.mention}", inline=False)
                 
-                rules_url = self.config.get('rules', {}).get('onm_url', '#')
-                embed.add_field(name="📖 Rules", value=f"[ONM]({rules_url})", inline=False)
+                embed.add_field(name="📖 Rules", value=f"[ONM]({self.settings.rules_url})", inline=False)
                 embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
                 embed.add_field(name="ℹ️ Status", value="Waiting for match time coordination", inline=False)
                 embed.set_footer(text=f"Match ID: {match_id}")
@@ -310,63 +388,113 @@ class TournamentBot(commands.Bot):
         except:
             return date_str
 
-    def _format_team_side_with_icon(self, team_side: str) -> str:
-        try:
-            if not team_side or team_side == 'TBA':
-                return 'TBA'
-            
-            team_icons = self.config.get('team_icons', {})
-            icon = team_icons.get(team_side.upper(), '')
-            
-            if icon:
-                return f"{team_side} {icon}"
-            else:
-                return team_side
-                
-        except Exception as e:
-            logger.error(f"Error formatting team side with icon: {e}")
-            return team_side
-        
     async def on_ready(self):
+        # on_ready feuert nach jedem Gateway-Reconnect erneut - Restore & Background Tasks nur einmal
+        if self.startup_complete:
+            logger.info(f'🔌 {self.user} reconnected - startup already done, skipping restoration')
+            return
+        self.startup_complete = True
+        
         logger.info(f'{self.user} ist online!')
         logger.info(f'Tournament: {self.TOURNAMENT_NAME}')
         logger.info(f'Aktuelle Woche: {self.CURRENT_WEEK}')
         
         # TIMEZONE SUPPORT: Timezone-Info beim Startup loggen
-        timezone_display = TimezoneHelper.get_timezone_display(self)
-        timezone_info = TimezoneHelper.get_timezone_info(self)
-        logger.info(f'Timezone: {timezone_display} - {timezone_info}')
+        logger.info(f'Timezone: {self.settings.timezone_display} - {self.settings.timezone_info}')
         
-        self._check_configuration()
-        self._validate_teams_configuration()
+        profiler = self.startup_profiler
+        profiler.record_phase('gateway_ready', 0)
+        
+        with profiler.phase('check_configuration'):
+            self._check_configuration()
+        with profiler.phase('validate_teams_configuration'):
+            self._validate_teams_configuration()
+        # Vor Role Index + Restore: Team-Namen und Team-Rollen der Matches laufen über die DB-ID Zuordnung
+        with profiler.phase('sync_config_teams'):
+            self.sync_config_teams_to_database()
+        with profiler.phase('build_role_index'):
+            self.role_index.rebuild()
+        with profiler.phase('backfill_match_schedule'):
+            self.match_clock.backfill()
         
         logger.info("🚀 Starting FAST startup (NO MESSAGE EDITS)...")
         
-        await self.fast_startup.fast_restore_all_components()
+        with profiler.phase('fast_restore_all_components'):
+            self.restoration_stats = await self.fast_startup.fast_restore_all_components()
         
         self.restoration_complete = True
         
         stats = self.fast_startup.get_restoration_stats()
         logger.info(f"📊 FAST startup stats: {stats}")
         
-        await self._start_background_tasks()
+        with profiler.phase('start_background_tasks'):
+            await self._start_background_tasks()
         
         logger.info("✅ Bot startup complete with FAST RESTORATION!")
 
-        asyncio.create_task(self._sync_slash_commands_async())
+        asyncio.create_task(self._initial_command_sync())
+    
+    def compute_command_tree_hash(self) -> str:
+        """
+        Stabiler Hash über alle global registrierten App-Commands (inkl. Context Menus)
+        """
+        payloads = []
+        for command in self.tree.get_commands():
+            try:
+                payloads.append(command.to_dict(self.tree))
+            except TypeError:
+                # Ältere discord.py Versionen: to_dict() ohne Tree
+                payloads.append(command.to_dict())
+        
+        payloads.sort(key=lambda payload: (payload.get('type', 1), payload.get('name', '')))
+        canonical = json.dumps({'application_id': self.application_id, 'commands': payloads}, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
     
-    async def _sync_slash_commands_async(self):
+    async def _sync_slash_commands_async(self, force: bool = False):
         try:
+            tree_hash = self.compute_command_tree_hash()
+            stored_hash = self.db.get_setting(COMMAND_TREE_HASH_KEY)
+            
+            if not force and stored_hash == tree_hash:
+                logger.info(f"✅ Slash commands unchanged (hash {tree_hash[:12]}) - skipping tree sync")
+                return []
+            
             logger.info("🔄 Syncing slash commands in background...")
             
-            synced = await asyncio.wait_for(self.tree.sync(), timeout=30.0)
-            logger.info(f"✅ Synced {len(synced)} slash command(s)")
+            with self.startup_profiler.phase('tree_sync'):
+                synced = await asyncio.wait_for(self.tree.sync(), timeout=30.0)
+            self.db.set_setting(COMMAND_TREE_HASH_KEY, tree_hash)
+            logger.info(f"✅ Synced {len(synced)} slash command(s) (hash {tree_hash[:12]})")
+            return synced
             
         except asyncio.TimeoutError:
             logger.warning("⏰ Slash command sync timed out after 30s - continuing without sync")
         except Exception as e:
             logger.error(f"❌ Failed to sync slash commands: {e}")
             logger.info("📝 Bot will work normally, only slash commands may not be available")
+        return None
+    
+    async def _initial_command_sync(self):
+        try:
+            await self._sync_slash_commands_async()
+        finally:
+            self._finish_startup_report()
+    
+    def _finish_startup_report(self):
+        try:
+            keep = self.config.get('startup', {}).get('keep_reports', DEFAULT_KEEP_REPORTS)
+            restoration_stats = getattr(self, 'restoration_stats', None) or {}
+            self.startup_profiler.finish(
+                self.db, keep=keep,
+                restored=restoration_stats.get('restored', 0),
+                failed=restoration_stats.get('failed', 0),
+                guilds=len(self.guilds),
+                cached_members=sum(len(guild.members) for guild in self.guilds),
+                member_cache=self.member_cache.get_stats(),
+                peak_rss_mb=peak_rss_mb()
+            )
+        except Exception as e:
+            logger.error(f"Error finishing startup report: {e}")
     
     def _validate_teams_configuration(self):
         try:
@@ -389,6 +517,11 @@ class TournamentBot(commands.Bot):
         except Exception as e:
             logger.error(f"Error validating teams configuration: {e}")
     
+    @property
+    def team_registry(self):
+        """Aktuelle, unveränderliche Team Registry (O(1) Lookups) - einmal lesen, dann verwenden"""
+        return self.team_loader.registry
+    
     def get_all_teams(self):
         return self.team_loader.get_all_teams()
     
@@ -404,45 +537,84 @@ class TournamentBot(commands.Bot):
     def get_team_by_name(self, name: str):
         return self.team_loader.get_team_by_name(name)
     
+    def get_team_by_config_id(self, config_id: int):
+        return self.team_loader.get_team_by_config_id(config_id)
+    
+    def get_team_by_db_id(self, db_id: int):
+        return self.team_loader.get_team_by_db_id(db_id)
+    
     def create_legacy_team_in_db(self, team_config_tuple):
+        """
+        DB Team-ID eines Config Teams - aus der beim Startup abgeglichenen Zuordnung (kein SQLite).
+        Nur Teams, die seit dem letzten Abgleich neu in der Config sind, werden nachsynchronisiert
+        """
         try:
-            team_id, name, role_id, members, active = team_config_tuple
-            
-            cursor = self.db.conn.cursor()
-            cursor.execute('SELECT id FROM teams WHERE captain_id = ?', (role_id,))
-            existing = cursor.fetchone()
+            config_id = team_config_tuple[0]
+            registry = self.team_registry
             
-            if not existing:
-                db_team_id = self.db.create_team(name, role_id)
-                logger.info(f"Created legacy database entry for team {name}")
+            db_team_id = registry.db_id_for(config_id)
+            if db_team_id and registry.get_by_config_id(config_id) == tuple(team_config_tuple):
                 return db_team_id
-            else:
-                return existing[0]
+            
+            logger.info(f"Team {team_config_tuple[1]} not in team id map yet - syncing")
+            self.sync_config_teams_to_database()
+            return self.team_registry.db_id_for(config_id)
                 
         except Exception as e:
             logger.error(f"Error creating legacy team entry: {e}")
             return None
     
     def sync_config_teams_to_database(self):
+        """
+        Abgleich aller Config Teams mit der DB in einer Transaktion (team_id_map);
+        die Config-ID -> DB-ID Zuordnung wird danach im Speicher gehalten
+        """
         try:
-            config_teams = self.get_all_teams()
-            synced_count = 0
+            registry = self.team_registry
+            role_to_db_id = self.db.reconcile_config_teams(registry.teams)
             
-            for team_tuple in config_teams:
-                if self.create_legacy_team_in_db(team_tuple):
-                    synced_count += 1
+            db_ids = {team.config_id: role_to_db_id[team.role_id] for team in registry.teams if team.role_id in role_to_db_id}
+            self.team_loader.set_db_ids(db_ids)
             
-            logger.info(f"✅ Synced {synced_count} teams from config to database")
+            logger.info(f"✅ Synced {len(db_ids)} teams from config to database")
             
         except Exception as e:
             logger.error(f"Error syncing config teams to database: {e}")
     
     async def _start_background_tasks(self):
         try:
-            self.sync_config_teams_to_database()
+            if any(not task.done() for task in self.startup_tasks):
+                logger.info("ℹ️ Background tasks already running - not starting them twice")
+                return
+            
+            if self.member_cache.is_lazy:
+                warm_up_task = asyncio.create_task(self.member_cache.warm_up())
+                self.startup_tasks.append(warm_up_task)
+            
+            # Entropy Pool vorbefüllen, damit die erste Match-Erstellung nicht auf random.org wartet
+            from wheel.entropy_pool import get_entropy_pool
+            await get_entropy_pool(self.config).start()
+            
+            # Wheel Render Worker vorwärmen, damit das erste Match nicht auf den Prozessstart wartet
+            # Die Worker wärmen Font + Label-Sprites selbst vor (_init_worker) - PIL bleibt aus dem Bot-Prozess
+            from wheel.render_pool import get_render_pool
+            get_render_pool(self.config).start()
+            
+            # config.json / map_config.json Änderungen ohne Neustart übernehmen
+            watch_task = self.config_reloader.start_watching()
+            if watch_task:
+                self.startup_tasks.append(watch_task)
             
-            cleanup_task = asyncio.create_task(self._periodic_cleanup())
-            self.startup_tasks.append(cleanup_task)
+            # Offer-Ablauf, Match-Reminder, Archivierung und Cleanup zum exakten Zeitpunkt (persistent)
+            self.match_jobs.register()
+            scheduler_task = self.scheduler.start()
+            self.startup_tasks.append(scheduler_task)
+            self.match_jobs.ensure_cleanup_job()
+            
+            # Ausstehende Discord-Effekte (auch aus dem letzten Lauf) abarbeiten
+            self.match_effects.register()
+            outbox_task = self.outbox.start()
+            self.startup_tasks.append(outbox_task)
             
             stats_task = asyncio.create_task(self._periodic_stats_logging())
             self.startup_tasks.append(stats_task)
@@ -452,25 +624,6 @@ class TournamentBot(commands.Bot):
         except Exception as e:
             logger.error(f"Error starting background tasks: {e}")
     
-    async def _periodic_cleanup(self):
-        while not self.is_closed():
-            try:
-                await asyncio.sleep(3600)
-                
-                logger.info("🧹 Running periodic cleanup...")
-                
-                self.db.cleanup_expired_data()
-                await self.lazy_persistence.cleanup_orphaned_messages()
-                self.sync_config_teams_to_database()
-                
-                logger.info("✅ Periodic cleanup complete")
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in periodic cleanup: {e}")
-                await asyncio.sleep(300)
-    
     def get_fast_persistence_stats(self) -> Dict[str, Any]:
         try:
             return self.fast_startup.get_restoration_stats()
@@ -488,6 +641,11 @@ class TournamentBot(commands.Bot):
                 
                 team_stats = self.team_loader.get_team_statistics()
                 logger.info(f"👥 Team stats: {team_stats}")
+                logger.info(f"🔐 Role index stats: {self.role_index.get_stats()}")
+                logger.info(f"🏷️ Display name stats: {self.display_names.get_stats()}")
+                logger.info(f"⏱️ Scheduler stats: {self.scheduler.get_stats()}")
+                logger.info(f"🔒 Match lock stats: {self.match_locks.get_stats()}")
+                logger.info(f"📬 Outbox stats: {self.outbox.get_stats()}")
                 
                 active_guilds = len(self.guilds)
                 total_members = sum(guild.member_count for guild in self.guilds)
@@ -718,25 +876,74 @@ class TournamentBot(commands.Bot):
                 break
             await asyncio.sleep(0.5)
     
-    async def on_message_delete(self, message):
+    def _drop_cached_views(self, message_ids):
+        # In-Memory View-Caches nur bereinigen, wenn die Services bereits erzeugt wurden (cached_property)
+        for service_name, attribute in (('lazy_persistence', 'active_views'), ('fast_startup', 'restored_views')):
+            service = self.__dict__.get(service_name)
+            if service is not None:
+                views = getattr(service, attribute)
+                for message_id in message_ids:
+                    views.pop(message_id, None)
+    
+    async def on_raw_message_delete(self, payload):
+        # Raw Event feuert auch für Messages, die nicht im Message Cache liegen (z.B. nach Restart)
+        cached_message = payload.cached_message
+        if cached_message is not None and cached_message.author != self.user:
+            return
         try:
-            if message.author == self.user:
-                self.db.deactivate_ui_message(message.id)
-                logger.info(f"🗑️ Deactivated persistence for deleted message {message.id}")
+            if self.db.deactivate_ui_messages([payload.message_id]):
+                self._drop_cached_views([payload.message_id])
+                logger.info(f"🗑️ Deactivated persistence for deleted message {payload.message_id}")
                 
         except Exception as e:
             logger.error(f"Error handling message deletion: {e}")
     
+    async def on_raw_bulk_message_delete(self, payload):
+        try:
+            message_ids = list(payload.message_ids)
+            deactivated = self.db.deactivate_ui_messages(message_ids)
+            if deactivated:
+                self._drop_cached_views(message_ids)
+                logger.info(f"🗑️ Deactivated {deactivated} messages due to bulk deletion in channel {payload.channel_id}")
+                
+        except Exception as e:
+            logger.error(f"Error handling bulk message deletion: {e}")
+    
+    async def on_member_update(self, before, after):
+        # remember() übernimmt auch einen geänderten Nickname / Display Name
+        if self.member_cache.should_track(after):
+            self.member_cache.remember(after)
+        if before.roles != after.roles:
+            self.role_index.index_member(after)
+    
+    async def on_member_remove(self, member):
+        self.display_names.invalidate(member.id)
+        self.role_index.remove_member(member.guild.id, member.id)
+    
+    async def on_guild_role_delete(self, role):
+        self.role_index.remove_role(role.id)
+    
+    async def on_user_update(self, before, after):
+        # Global Name / Username geändert - Eintrag neu laden lassen
+        self.display_names.invalidate(after.id)
+    
+    async def on_interaction(self, interaction):
+        # Aktive Nutzer im Member Cache halten (Interaction liefert das Member-Objekt ohne Chunking)
+        if isinstance(interaction.user, discord.Member):
+            self.member_cache.remember(interaction.user)
+            # Das Interaction-Payload ist der aktuelle Stand - Index für spätere User-Lookups (DMs) auffrischen
+            self.role_index.index_member(interaction.user)
+    
     async def on_guild_channel_delete(self, channel):
         try:
             cursor = self.db.conn.cursor()
-            cursor.execute('SELECT message_id FROM ui_messages WHERE channel_id = ?', (channel.id,))
-            message_ids = cursor.fetchall()
+            cursor.execute('SELECT message_id FROM ui_messages WHERE channel_id = ? AND is_active = 1', (channel.id,))
+            message_ids = [row[0] for row in cursor.fetchall()]
             
-            for (message_id,) in message_ids:
-                self.db.deactivate_ui_message(message_id)
+            deactivated = self.db.deactivate_ui_messages_by_channel(channel.id)
+            self._drop_cached_views(message_ids)
             
-            logger.info(f"🗑️ Deactivated {len(message_ids)} messages due to channel deletion")
+            logger.info(f"🗑️ Deactivated {deactivated} messages due to channel deletion")
             
         except Exception as e:
             logger.error(f"Error handling channel deletion: {e}")
@@ -751,28 +958,14 @@ class TournamentBot(commands.Bot):
         if self.startup_tasks:
             await asyncio.gather(*self.startup_tasks, return_exceptions=True)
         
+        from wheel.render_pool import shutdown_render_pool
+        from wheel.entropy_pool import close_entropy_pool
+        shutdown_render_pool()
+        await close_entropy_pool()
+        
         if hasattr(self, 'db'):
             self.db.close()
             
         await super().close()
-    def _get_streamer_display_name(self, streamer_id: int) -> str:
-        """
-        Holt den Server-Nickname oder fällt auf Display-Name zurück (FIXED)
-        """
-        try:
-            # Versuche Member zu finden (hat Server-Nickname)
-            for guild in self.guilds:
-                member = guild.get_member(streamer_id)
-                if member:
-                    # Priorität: Server-Nickname > Global Display Name > Username
-                    return member.nick or member.global_name or member.name
-            
-            # Fallback auf User
-            user = self.get_user(streamer_id)
-            return user.global_name or user.name if user else f"User {streamer_id}"
-            
-        except Exception as e:
-            logger.error(f"Error getting streamer display name: {e}")
-            return f"User {streamer_id}"
         
         logger.info("✅ Bot shutdown complete")
\ No newline at end of file
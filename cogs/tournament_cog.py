@@ -9,7 +9,6 @@ import json
 import logging
 from datetime import datetime
 from utils.embed_builder import EmbedBuilder
-from utils.timezone_helper import TimezoneHelper
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +17,8 @@ class TournamentCog(commands.Cog):
         self.bot = bot
         
     def has_orga_role(self, user) -> bool:
-        if not self.bot.EVENT_ORGA_ROLE_ID:
-            return False
-        return any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in user.roles)
+        """ctx.author ist in Guild-Channels ein Member - geprüft werden dessen aktuelle Rollen"""
+        return self.bot.role_index.authorize(user, orga=True)
 
     @commands.command(name='send_orga_panel')
     async def send_orga_panel(self, ctx):
@@ -71,6 +69,120 @@ class TournamentCog(commands.Cog):
             await ctx.send(f"❌ Fehler beim Senden des Orga Panels: {e}")
             logger.error(f"Fehler beim Orga Panel senden: {e}")
 
+    @commands.command(name='startup_report')
+    async def startup_report(self, ctx, count: int = 5):
+        if not self.has_orga_role(ctx.author):
+            await ctx.send("❌ Du benötigst die Event Orga Rolle!")
+            return
+
+        try:
+            reports = self.bot.db.get_startup_reports(limit=max(1, min(count, 20)))
+            if not reports:
+                await ctx.send("ℹ️ Noch keine Startup Reports vorhanden.")
+                return
+
+            lines = []
+            for report in reports:
+                phases = ", ".join(f"{phase['name']}={phase['ms']}ms/{phase['db_queries']}q" for phase in report.get('phases', []))
+                lines.append(f"{report.get('created_at', '?')[:19]}  total={report.get('total_ms')}ms  {phases}")
+
+            await ctx.send("```\n" + "\n".join(lines)[:1900] + "\n```")
+
+        except Exception as e:
+            await ctx.send(f"❌ Fehler beim Laden der Startup Reports: {e}")
+            logger.error(f"Fehler beim Startup Report: {e}")
+
+    @commands.command(name='sync_commands')
+    async def sync_commands(self, ctx):
+        if not self.has_orga_role(ctx.author):
+            await ctx.send("❌ Du benötigst die Event Orga Rolle!")
+            return
+
+        synced = await self.bot._sync_slash_commands_async(force=True)
+        if synced is None:
+            await ctx.send("❌ Slash Command Sync fehlgeschlagen - siehe Log")
+        else:
+            await ctx.send(f"✅ {len(synced)} Slash Command(s) synchronisiert")
+
+    @commands.command(name='prewarm_wheels')
+    async def prewarm_wheels(self, ctx):
+        if not self.has_orga_role(ctx.author):
+            await ctx.send("❌ Du benötigst die Event Orga Rolle!")
+            return
+
+        try:
+            from wheel.wheel_generator import WheelGenerator
+
+            await ctx.send("🔥 Wheel GIFs für den aktuellen Map Pool werden vorgerendert - das kann einige Minuten dauern...")
+            stats = await WheelGenerator.prewarm_cache(self.bot.config)
+
+            if stats.get('error'):
+                await ctx.send(f"❌ Pre-Warm nicht möglich: {stats['error']}")
+            else:
+                message = f"✅ Pre-Warm fertig: {stats['rendered']} gerendert, {stats['cached']} bereits im Cache, {stats['failed']} fehlgeschlagen"
+                if stats['skipped']:
+                    message += f"\n⚠️ {stats['skipped']} Varianten übersprungen - Cache-Budget (wheel_cache.max_mb) reicht nicht"
+                await ctx.send(message)
+
+        except Exception as e:
+            await ctx.send(f"❌ Fehler beim Pre-Warm der Wheel GIFs: {e}")
+            logger.error(f"Fehler beim Wheel Pre-Warm: {e}")
+
+    @commands.command(name='reload_config')
+    async def reload_config(self, ctx):
+        if not self.has_orga_role(ctx.author):
+            await ctx.send("❌ Du benötigst die Event Orga Rolle!")
+            return
+
+        try:
+            from utils.config_reloader import ConfigReloader
+
+            result = await self.bot.config_reloader.reload(source=f"command by {ctx.author}")
+            if not result['ok']:
+                await ctx.send(f"❌ Config nicht übernommen, alter Stand bleibt aktiv:\n```\n{result['error'][:1800]}\n```")
+                return
+
+            lines = ConfigReloader.format_diff(result['diff'])
+            if not lines:
+                await ctx.send("ℹ️ Config neu geladen - keine Änderungen")
+            else:
+                await ctx.send("✅ Config neu geladen:\n```\n" + "\n".join(lines)[:1800] + "\n```")
+
+        except Exception as e:
+            await ctx.send(f"❌ Fehler beim Config Reload: {e}")
+            logger.error(f"Fehler beim Config Reload: {e}")
+
+    @commands.command(name='upcoming')
+    async def upcoming_matches(self, ctx, hours: int = 24):
+        try:
+            from utils.embeds import ConfigHelper
+            from utils.match_time import discord_timestamp
+
+            hours = max(1, min(hours, 24 * 14))
+            upcoming = self.bot.match_clock.upcoming(hours)
+            if not upcoming:
+                await ctx.send(f"📅 Keine Matches in den nächsten {hours}h")
+                return
+
+            lines = []
+            for match_id, starts_at in upcoming[:25]:
+                match_details = self.bot.db.get_match_details(match_id)
+                if not match_details:
+                    continue
+                team1_name, team2_name = ConfigHelper.safe_get_team_names(match_details)
+                lines.append(f"{discord_timestamp(starts_at, 'F')} ({discord_timestamp(starts_at, 'R')}) - **{team1_name}** vs **{team2_name}** (ID {match_id})")
+
+            embed = discord.Embed(
+                title=f"📅 Matches in the next {hours}h",
+                description="\n".join(lines) or "—",
+                color=discord.Color.blue()
+            )
+            await ctx.send(embed=embed)
+
+        except Exception as e:
+            await ctx.send(f"❌ Fehler beim Laden der Matches: {e}")
+            logger.error(f"Fehler bei !upcoming: {e}")
+
     def _create_match_data_dict(self, match_details):
         try:
             return {
@@ -90,20 +202,21 @@ class TournamentCog(commands.Cog):
 
     def _create_private_embed_with_dynamic_status(self, match_data):
         try:
+            settings = self.bot.settings
             formatted_date = self._format_date_display(match_data.get('match_date', 'TBA'))
             
-            team1_side_with_icon = self._format_team_side_with_icon(match_data.get('team1_side', 'TBA'))
-            team2_side_with_icon = self._format_team_side_with_icon(match_data.get('team2_side', 'TBA'))
+            team1_side_with_icon = settings.side_label(match_data.get('team1_side', 'TBA'))
+            team2_side_with_icon = settings.side_label(match_data.get('team2_side', 'TBA'))
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
             raw_match_time = match_data.get('match_time', '*TBA*')
             if raw_match_time and raw_match_time != '*TBA*':
-                formatted_time = TimezoneHelper.format_time_with_timezone(raw_match_time, self.bot)
+                formatted_time = self.bot.match_clock.render(match_data.get('match_id'), raw_match_time, match_data.get('match_date'))
             else:
                 formatted_time = '*TBA*'
             
             # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            timezone_warning = settings.local_time_note
             
             embed = discord.Embed(
                 title=f"🏆 Week {match_data.get('week', 'N/A')}: {match_data['team1_name']} vs {match_data['team2_name']}",
@@ -119,8 +232,7 @@ class TournamentCog(commands.Cog):
                 inline=False
             )
             
-            rules_url = self.bot.config.get('rules', {}).get('onm_url', '#')
-            embed.add_field(name="📖 Rules", value=f"[ONM]({rules_url})", inline=False)
+            embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
             
             # TIMEZONE SUPPORT: Timezone-Info hinzufügen
             embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -132,7 +244,7 @@ class TournamentCog(commands.Cog):
                 embed.add_field(name="ℹ️ Status", value="⏳ Teams agreed - Awaiting Event Orga confirmation", inline=False)
             elif match_data.get('match_time'):
                 # TIMEZONE SUPPORT: Zeit im Status mit Timezone
-                status_time = TimezoneHelper.format_time_with_timezone(match_data['match_time'], self.bot)
+                status_time = self.bot.match_clock.render(match_data.get('match_id'), match_data['match_time'], match_data.get('match_date'))
                 embed.add_field(name="ℹ️ Status", value=f"⏳ Scheduled for {status_time} - Waiting for results", inline=False)
             else:
                 embed.add_field(name="ℹ️ Status", value="Waiting for match time coordination", inline=False)
@@ -145,23 +257,6 @@ class TournamentCog(commands.Cog):
             logger.error(f"Error creating private embed with dynamic status: {e}")
             return discord.Embed(title="Match Error", color=discord.Color.red())
 
-    def _format_team_side_with_icon(self, team_side: str) -> str:
-        try:
-            if not team_side or team_side == 'TBA':
-                return 'TBA'
-            
-            team_icons = self.bot.config.get('team_icons', {})
-            icon = team_icons.get(team_side.upper(), '')
-            
-            if icon:
-                return f"{team_side} {icon}"
-            else:
-                return team_side
-                
-        except Exception as e:
-            logger.error(f"Error formatting team side with icon: {e}")
-            return team_side
-
     def _format_date_display(self, date_str: str) -> str:
         if not date_str or date_str == 'TBA':
             return "TBA"
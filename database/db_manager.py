@@ -15,8 +15,14 @@ class DatabaseManager:
     def __init__(self, db_path: str = 'tournament.db'):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
+        # Zählt jedes ausgeführte Statement (für den Startup Profiler)
+        self.query_count = 0
+        self.conn.set_trace_callback(self._count_query)
         self.setup_database()
         logger.info(f"Datenbank initialisiert: {db_path}")
+    
+    def _count_query(self, statement: str):
+        self.query_count += 1
         
     def migrate_ui_messages_table(self):
         try:
@@ -198,10 +204,87 @@ class DatabaseManager:
             )
         ''')
         
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS startup_reports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                total_ms REAL,
+                report TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Zuordnung config.json Team (Role ID) -> teams.id, abgeglichen beim Startup
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS team_id_map (
+                role_id INTEGER PRIMARY KEY,
+                db_team_id INTEGER NOT NULL,
+                config_id INTEGER,
+                display_name TEXT,
+                synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (db_team_id) REFERENCES teams (id)
+            )
+        ''')
+        
+        # Match-Zeitpunkt als UTC Epoch (matches.match_time bleibt der lokale "HH:MM" Text)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS match_schedule (
+                match_id INTEGER PRIMARY KEY,
+                starts_at INTEGER NOT NULL,
+                timezone TEXT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (match_id) REFERENCES matches (id)
+            )
+        ''')
+        
+        # Persistente Jobs für den Scheduler (utils/scheduler.py) - erledigte Jobs werden gelöscht
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                job_key TEXT PRIMARY KEY,
+                job_type TEXT NOT NULL,
+                due_at REAL NOT NULL,
+                payload TEXT,
+                match_id INTEGER,
+                status TEXT DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Outbox (utils/outbox.py): ausstehende Discord-Effekte, in derselben Transaktion wie die
+        # Zustandsänderung geschrieben. effect_key = "<effect_type>:<match_id>" (ein Effekt pro Typ und Match)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS outbox_effects (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                effect_key TEXT UNIQUE NOT NULL,
+                effect_type TEXT NOT NULL,
+                match_id INTEGER,
+                payload TEXT,
+                status TEXT DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                available_at REAL DEFAULT 0,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                done_at TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_teams_captain ON teams (captain_id)')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_outbox_effects_pending ON outbox_effects (available_at, id) WHERE status = 'pending'")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_pending ON scheduled_jobs (due_at) WHERE status = 'pending'")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_match ON scheduled_jobs (match_id) WHERE match_id IS NOT NULL')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_active_views_expires ON active_views (expires_at) WHERE is_active = 1')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ongoing_interactions_expires ON ongoing_interactions (expires_at) WHERE is_active = 1')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_schedule_starts_at ON match_schedule (starts_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_active_views_message ON active_views (message_id)')
+        
         self._add_missing_columns()
         
         self.migrate_ui_messages_table()
         
+        # Erst nach der Migration - sie baut ui_messages neu auf und verwirft dabei die Indizes
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ui_messages_channel ON ui_messages (channel_id)')
+        
         self.conn.commit()
         logger.info("✅ Database setup complete with persistence tables")
     
@@ -346,6 +429,60 @@ class DatabaseManager:
         self.conn.commit()
         logger.info(f"✅ UI Message {message_id} deaktiviert")
     
+    def deactivate_ui_messages_by_channel(self, channel_id: int) -> int:
+        """
+        Set-basiert: deaktiviert alle UI Messages + Views eines Channels in einer Transaktion
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute('''
+                UPDATE active_views SET is_active = 0 
+                WHERE is_active = 1 
+                AND message_id IN (SELECT message_id FROM ui_messages WHERE channel_id = ?)
+            ''', (channel_id,))
+            cursor.execute('UPDATE ui_messages SET is_active = 0 WHERE channel_id = ? AND is_active = 1', (channel_id,))
+            deactivated = cursor.rowcount
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        logger.info(f"✅ {deactivated} UI Messages in Channel {channel_id} deaktiviert")
+        return deactivated
+    
+    def deactivate_ui_messages(self, message_ids: List[int]) -> int:
+        """
+        Set-basiert: deaktiviert mehrere UI Messages + Views in einer Transaktion (z.B. Bulk Delete)
+        """
+        message_ids = list(message_ids)
+        if not message_ids:
+            return 0
+        
+        cursor = self.conn.cursor()
+        deactivated = 0
+        changed = 0
+        try:
+            # SQLite erlaubt max. 999 Parameter pro Statement
+            for i in range(0, len(message_ids), 500):
+                batch = message_ids[i:i + 500]
+                placeholders = ','.join('?' * len(batch))
+                cursor.execute(f'UPDATE active_views SET is_active = 0 WHERE is_active = 1 AND message_id IN ({placeholders})', batch)
+                changed += cursor.rowcount
+                cursor.execute(f'UPDATE ui_messages SET is_active = 0 WHERE is_active = 1 AND message_id IN ({placeholders})', batch)
+                deactivated += cursor.rowcount
+            # Keine persistierte Message betroffen (der Normalfall bei Deletes) - kein Commit/fsync
+            if changed or deactivated:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        if deactivated:
+            logger.info(f"✅ {deactivated} UI Messages deaktiviert (Bulk)")
+        return deactivated
+    
     def complete_ongoing_interaction(self, interaction_id: int):
         cursor = self.conn.cursor()
         cursor.execute('UPDATE ongoing_interactions SET is_active = 0 WHERE id = ?', (interaction_id,))
@@ -356,9 +493,11 @@ class DatabaseManager:
         cursor = self.conn.cursor()
         now = datetime.now().isoformat()
         
-        cursor.execute('UPDATE active_views SET is_active = 0 WHERE expires_at < ?', (now,))
+        cursor.execute('UPDATE active_views SET is_active = 0 WHERE expires_at < ? AND is_active = 1', (now,))
+        
+        cursor.execute('UPDATE ongoing_interactions SET is_active = 0 WHERE expires_at < ? AND is_active = 1', (now,))
         
-        cursor.execute('UPDATE ongoing_interactions SET is_active = 0 WHERE expires_at < ?', (now,))
+        cursor.execute("DELETE FROM outbox_effects WHERE status = 'done' AND done_at < datetime('now', '-7 days')")
         
         self.conn.commit()
         logger.info("✅ Expired data cleaned up")
@@ -390,6 +529,70 @@ class DatabaseManager:
         cursor.execute('SELECT * FROM teams WHERE name = ? AND active = 1', (name,))
         return cursor.fetchone()
     
+    def reconcile_config_teams(self, config_teams: List[Tuple]) -> Dict[int, int]:
+        """
+        Gleicht alle config.json Teams (config_id, display_name, role_id, ...) in einer Transaktion
+        mit der teams Tabelle ab und pflegt team_id_map. Reihenfolge pro Team:
+        bestehende Zuordnung -> Team mit captain_id = role_id -> Team mit gleichem Namen -> neues Team.
+        Rückgabe: {role_id: teams.id}
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute('SELECT id, name, captain_id FROM teams')
+            teams_by_id = {}
+            teams_by_captain = {}
+            teams_by_name = {}
+            for team_id, name, captain_id in cursor.fetchall():
+                teams_by_id[team_id] = name
+                teams_by_captain.setdefault(captain_id, team_id)
+                teams_by_name[name] = team_id
+            
+            cursor.execute('SELECT role_id, db_team_id FROM team_id_map')
+            mapped = {role_id: db_team_id for role_id, db_team_id in cursor.fetchall() if db_team_id in teams_by_id}
+            
+            mapping = {}
+            created = 0
+            for team in config_teams:
+                display_name, role_id = team[1], team[2]
+                
+                db_team_id = mapped.get(role_id) or teams_by_captain.get(role_id) or teams_by_name.get(display_name)
+                if db_team_id is None:
+                    cursor.execute(
+                        'INSERT INTO teams (name, captain_id, members) VALUES (?, ?, ?)',
+                        (display_name, role_id, json.dumps([]))
+                    )
+                    db_team_id = cursor.lastrowid
+                    teams_by_id[db_team_id] = display_name
+                    teams_by_name[display_name] = db_team_id
+                    created += 1
+                elif teams_by_id[db_team_id] != display_name and display_name not in teams_by_name:
+                    # Display Name in config.json geändert - DB Namen nachziehen (Match-Joins zeigen ihn an)
+                    cursor.execute('UPDATE teams SET name = ? WHERE id = ?', (display_name, db_team_id))
+                    teams_by_name.pop(teams_by_id[db_team_id], None)
+                    teams_by_id[db_team_id] = display_name
+                    teams_by_name[display_name] = db_team_id
+                
+                mapping[role_id] = db_team_id
+            
+            cursor.executemany('''
+                INSERT INTO team_id_map (role_id, db_team_id, config_id, display_name, synced_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(role_id) DO UPDATE SET
+                    db_team_id = excluded.db_team_id,
+                    config_id = excluded.config_id,
+                    display_name = excluded.display_name,
+                    synced_at = excluded.synced_at
+            ''', [(team[2], mapping[team[2]], team[0], team[1]) for team in config_teams])
+            
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        
+        if created:
+            logger.info(f"✅ Created {created} database teams from config.json")
+        return mapping
+    
     def create_match(self, team1_id: int, team2_id: int, match_date: str, 
                     map_name: str, team1_side: str, team2_side: str, 
                     private_channel_id: int, week_number: int) -> int:
@@ -403,6 +606,26 @@ class DatabaseManager:
         self.conn.commit()
         return cursor.lastrowid
     
+    def get_team_role_ids(self, team_ids: List[int]) -> Dict[int, int]:
+        """
+        {teams.id: Role ID} aus team_id_map, sonst teams.captain_id - auch für Teams, die nicht
+        mehr in config.json stehen (entfernte Teams, Legacy-Einträge ohne Zuordnung)
+        """
+        team_ids = [team_id for team_id in dict.fromkeys(team_ids) if team_id]
+        if not team_ids:
+            return {}
+        
+        cursor = self.conn.cursor()
+        placeholders = ','.join('?' * len(team_ids))
+        cursor.execute(f'''
+            SELECT t.id, COALESCE(MIN(tm.role_id), t.captain_id)
+            FROM teams t
+            LEFT JOIN team_id_map tm ON tm.db_team_id = t.id
+            WHERE t.id IN ({placeholders})
+            GROUP BY t.id
+        ''', team_ids)
+        return {team_id: role_id for team_id, role_id in cursor.fetchall() if role_id}
+    
     def get_match_details(self, match_id: int) -> Optional[Tuple]:
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -416,13 +639,15 @@ class DatabaseManager:
     
     def get_matches_by_week(self, week_number: int) -> List[Tuple]:
         cursor = self.conn.cursor()
+        # Nach echtem Zeitpunkt sortiert, Matches ohne Zeit am Ende
         cursor.execute('''
             SELECT m.*, t1.name as team1_name, t2.name as team2_name
             FROM matches m
             JOIN teams t1 ON m.team1_id = t1.id
             JOIN teams t2 ON m.team2_id = t2.id
+            LEFT JOIN match_schedule s ON s.match_id = m.id
             WHERE m.week_number = ?
-            ORDER BY m.match_date, m.match_time
+            ORDER BY s.starts_at IS NULL, s.starts_at, m.match_date, m.match_time
         ''', (week_number,))
         return cursor.fetchall()
     
@@ -434,21 +659,100 @@ class DatabaseManager:
         )
         self.conn.commit()
     
-    def confirm_match_result(self, match_id: int):
+    def confirm_match_result(self, match_id: int, effects: List[Tuple[str, Dict]] = None):
+        """
+        Status 'confirmed' - mit effects [(effect_type, payload), ...] werden die Discord-Effekte in
+        derselben Transaktion in die Outbox geschrieben
+        """
         cursor = self.conn.cursor()
-        cursor.execute('UPDATE matches SET status = ? WHERE id = ?', ('confirmed', match_id))
-        self.conn.commit()
+        try:
+            cursor.execute('UPDATE matches SET status = ? WHERE id = ?', ('confirmed', match_id))
+            if effects:
+                self._enqueue_effects(cursor, match_id, effects)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
     
     def update_public_message_id(self, match_id: int, message_id: int):
         cursor = self.conn.cursor()
         cursor.execute('UPDATE matches SET public_message_id = ? WHERE id = ?', (message_id, match_id))
         self.conn.commit()
     
-    def update_match_time(self, match_id: int, match_time: str):
+    def update_match_time(self, match_id: int, match_time: str, starts_at: Optional[int] = None,
+                          timezone: Optional[str] = None, match_date: Optional[str] = None,
+                          map_name: Optional[str] = None):
+        """
+        Lokale Zeit (Text) und UTC Epoch in einer Transaktion - ohne starts_at wird der Zeitpunkt entfernt.
+        match_date / map_name werden im selben UPDATE mitgeschrieben, wenn angegeben (Orga Edit)
+        """
+        columns = {'match_time': match_time}
+        if match_date is not None:
+            columns['match_date'] = match_date
+        if map_name is not None:
+            columns['map_name'] = map_name
+        
         cursor = self.conn.cursor()
-        cursor.execute('UPDATE matches SET match_time = ? WHERE id = ?', (match_time, match_id))
-        self.conn.commit()
-        logger.info(f"✅ Match time updated for match {match_id}: {match_time}")
+        try:
+            assignments = ', '.join(f'{column} = ?' for column in columns)
+            cursor.execute(f'UPDATE matches SET {assignments} WHERE id = ?', (*columns.values(), match_id))
+            self._set_match_start(cursor, match_id, starts_at, timezone)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        logger.info(f"✅ Match time updated for match {match_id}: {match_time}" + (f" (<t:{starts_at}>)" if starts_at is not None else ""))
+    
+    def _set_match_start(self, cursor, match_id: int, starts_at: Optional[int], timezone: Optional[str]):
+        if starts_at is None:
+            cursor.execute('DELETE FROM match_schedule WHERE match_id = ?', (match_id,))
+        else:
+            cursor.execute('''
+                INSERT INTO match_schedule (match_id, starts_at, timezone) VALUES (?, ?, ?)
+                ON CONFLICT(match_id) DO UPDATE SET starts_at = excluded.starts_at,
+                    timezone = excluded.timezone, updated_at = CURRENT_TIMESTAMP
+            ''', (match_id, starts_at, timezone or 'UTC'))
+    
+    def set_match_starts(self, starts: List[Tuple[int, int, str]]):
+        """[(match_id, starts_at, timezone), ...] in einer Transaktion (Backfill)"""
+        cursor = self.conn.cursor()
+        try:
+            for match_id, starts_at, timezone in starts:
+                self._set_match_start(cursor, match_id, starts_at, timezone)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+    
+    def get_match_schedule(self) -> List[Tuple]:
+        """(match_id, starts_at, match_date, match_time) aller Matches mit Zeitpunkt"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.match_id, s.starts_at, m.match_date, m.match_time
+            FROM match_schedule s
+            JOIN matches m ON m.id = s.match_id
+        ''')
+        return cursor.fetchall()
+    
+    def get_unscheduled_match_times(self) -> List[Tuple]:
+        """(match_id, match_date, match_time) - Matches mit Zeit-Text, aber ohne UTC Zeitpunkt"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT m.id, m.match_date, m.match_time
+            FROM matches m
+            LEFT JOIN match_schedule s ON s.match_id = m.id
+            WHERE s.match_id IS NULL AND m.match_date IS NOT NULL AND m.match_time IS NOT NULL
+        ''')
+        return cursor.fetchall()
+    
+    def get_matches_starting_between(self, start_epoch: int, end_epoch: int) -> List[Tuple]:
+        """(match_id, starts_at) im Zeitraum [start, end) - Range Scan über idx_match_schedule_starts_at"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'SELECT match_id, starts_at FROM match_schedule WHERE starts_at >= ? AND starts_at < ? ORDER BY starts_at',
+            (start_epoch, end_epoch)
+        )
+        return cursor.fetchall()
     
     def add_match_streamer_with_side_url_and_steamid(self, match_id: int, streamer_id: int, team_side: str, stream_url: str, steam_id64: str):
         cursor = self.conn.cursor()
@@ -502,6 +806,125 @@ class DatabaseManager:
         result = cursor.fetchone()
         return result[0] if result else None
     
+    def upsert_scheduled_job(self, job_key: str, job_type: str, due_at: float, payload: Dict = None, match_id: int = None):
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            INSERT INTO scheduled_jobs (job_key, job_type, due_at, payload, match_id, status, attempts, last_error)
+            VALUES (?, ?, ?, ?, ?, 'pending', 0, NULL)
+            ON CONFLICT(job_key) DO UPDATE SET
+                job_type = excluded.job_type, due_at = excluded.due_at, payload = excluded.payload,
+                match_id = excluded.match_id, status = 'pending', attempts = 0, last_error = NULL
+        ''', (job_key, job_type, due_at, json.dumps(payload or {}), match_id))
+        self.conn.commit()
+    
+    def delete_scheduled_job(self, job_key: str) -> bool:
+        cursor = self.conn.cursor()
+        cursor.execute('DELETE FROM scheduled_jobs WHERE job_key = ?', (job_key,))
+        self.conn.commit()
+        return cursor.rowcount > 0
+    
+    def delete_scheduled_jobs_for_match(self, match_id: int) -> List[str]:
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT job_key FROM scheduled_jobs WHERE match_id = ?', (match_id,))
+        job_keys = [row[0] for row in cursor.fetchall()]
+        if job_keys:
+            cursor.execute('DELETE FROM scheduled_jobs WHERE match_id = ?', (match_id,))
+            self.conn.commit()
+        return job_keys
+    
+    def get_pending_scheduled_jobs(self) -> List[Tuple]:
+        """(job_key, job_type, due_at, payload, match_id, attempts) - über idx_scheduled_jobs_pending"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT job_key, job_type, due_at, payload, match_id, attempts
+            FROM scheduled_jobs WHERE status = 'pending' ORDER BY due_at
+        ''')
+        return cursor.fetchall()
+    
+    def reschedule_failed_job(self, job_key: str, due_at: float, attempts: int, error: str):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'UPDATE scheduled_jobs SET due_at = ?, attempts = ?, last_error = ? WHERE job_key = ?',
+            (due_at, attempts, error[:500], job_key)
+        )
+        self.conn.commit()
+    
+    def mark_scheduled_job_failed(self, job_key: str, attempts: int, error: str):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE scheduled_jobs SET status = 'failed', attempts = ?, last_error = ? WHERE job_key = ?",
+            (attempts, error[:500], job_key)
+        )
+        self.conn.commit()
+    
+    def _enqueue_effects(self, cursor, match_id: int, effects: List[Tuple[str, Dict]]):
+        """Ein noch offener Effekt gleichen Typs wird zusammengeführt, ein erledigter wieder geöffnet"""
+        cursor.executemany('''
+            INSERT INTO outbox_effects (effect_key, effect_type, match_id, payload, status, attempts, available_at, last_error)
+            VALUES (?, ?, ?, ?, 'pending', 0, 0, NULL)
+            ON CONFLICT(effect_key) DO UPDATE SET
+                payload = excluded.payload, status = 'pending', attempts = 0, available_at = 0,
+                last_error = NULL, done_at = NULL
+        ''', [
+            (f"{effect_type}:{match_id}", effect_type, match_id, json.dumps(payload or {}, default=str))
+            for effect_type, payload in effects
+        ])
+    
+    def enqueue_effects(self, match_id: int, effects: List[Tuple[str, Dict]]):
+        cursor = self.conn.cursor()
+        try:
+            self._enqueue_effects(cursor, match_id, effects)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+    
+    def get_due_outbox_effects(self, now: float, limit: int = 20) -> List[Tuple]:
+        """(id, effect_type, match_id, payload, attempts) in Einfüge-Reihenfolge - über idx_outbox_effects_pending"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT id, effect_type, match_id, payload, attempts
+            FROM outbox_effects WHERE status = 'pending' AND available_at <= ?
+            ORDER BY id LIMIT ?
+        ''', (now, limit))
+        return cursor.fetchall()
+    
+    def get_next_outbox_available_at(self) -> Optional[float]:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT MIN(available_at) FROM outbox_effects WHERE status = 'pending'")
+        result = cursor.fetchone()
+        return result[0] if result else None
+    
+    def count_pending_outbox_effects(self) -> int:
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM outbox_effects WHERE status = 'pending'")
+        return cursor.fetchone()[0]
+    
+    def mark_outbox_effect_done(self, effect_id: int, payload_json: str):
+        """Nur, wenn der Effekt nicht während der Ausführung neu eingereiht wurde (geänderter Payload)"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE outbox_effects SET status = 'done', done_at = CURRENT_TIMESTAMP WHERE id = ? AND payload IS ?",
+            (effect_id, payload_json)
+        )
+        self.conn.commit()
+    
+    def retry_outbox_effect(self, effect_id: int, available_at: float, attempts: int, error: str):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'UPDATE outbox_effects SET available_at = ?, attempts = ?, last_error = ? WHERE id = ?',
+            (available_at, attempts, error[:500], effect_id)
+        )
+        self.conn.commit()
+    
+    def mark_outbox_effect_failed(self, effect_id: int, attempts: int, error: str):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE outbox_effects SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+            (attempts, error[:500], effect_id)
+        )
+        self.conn.commit()
+    
     def set_setting(self, key: str, value: str):
         cursor = self.conn.cursor()
         cursor.execute(
@@ -516,6 +939,24 @@ class DatabaseManager:
         result = cursor.fetchone()
         return result[0] if result else None
     
+    def save_startup_report(self, report: Dict, keep: int = 10):
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'INSERT INTO startup_reports (total_ms, report) VALUES (?, ?)',
+            (report.get('total_ms'), json.dumps(report, default=str))
+        )
+        # Nur die letzten N Reports behalten
+        cursor.execute('''
+            DELETE FROM startup_reports 
+            WHERE id NOT IN (SELECT id FROM startup_reports ORDER BY id DESC LIMIT ?)
+        ''', (keep,))
+        self.conn.commit()
+    
+    def get_startup_reports(self, limit: int = 10) -> List[Dict]:
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT report FROM startup_reports ORDER BY id DESC LIMIT ?', (limit,))
+        return [json.loads(row[0]) for row in cursor.fetchall()]
+    
     def backup_database(self, backup_path: str):
         backup_conn = sqlite3.connect(backup_path)
         self.conn.backup(backup_conn)
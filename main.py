@@ -6,8 +6,15 @@ Startet den Bot und lädt alle Komponenten
 
 import json
 import logging
-from bot.tournament_bot import TournamentBot
-from cogs.tournament_cog import TournamentCog
+
+# Profiler zuerst laden, damit die Import-Zeiten der schweren Module erfasst werden
+from utils.startup_profiler import StartupProfiler
+profiler = StartupProfiler()
+profiler.install_import_timer()
+
+with profiler.phase('imports'):
+    from bot.tournament_bot import TournamentBot
+    from cogs.tournament_cog import TournamentCog
 
 from utils.colored_logger import setup_colored_logging
 
@@ -46,7 +53,7 @@ def main():
     config = load_config()
     Token = load_token()
     
-    bot = TournamentBot(config)
+    bot = TournamentBot(config, profiler=profiler)
     
     bot.setup_hook = lambda: setup_bot(bot)
     
@@ -1,39 +1,35 @@
 # ui/__init__.py
+# Lazy Exports (PEP 562): Die UI Module werden erst beim ersten Zugriff geladen,
+# damit der Startup nur die Views importiert, die tatsächlich restored werden.
 
-from .orga_view import *
+import importlib
 
-from .orga_panel import OrgaControlPanel
-from .orga_match_creation import (
-    MatchCreationHandler, 
-    MatchCreationModal, 
-    TeamSelectionView
-)
-from .orga_team_management import TeamManagementHandler, TeamRegistrationModal
-
-from .streamer_management import (
-    StreamerMatchManager, 
-    StreamerMatchView,
-    TeamSideSelectionView,
-    StreamURLModal
-)
-
-from .streamer_view import StreamerSignupView, StreamerManagementView
-
-__all__ = [
-    'OrgaControlPanel',
+_EXPORTS = {
+    'OrgaControlPanel': '.orga_panel',
     
-    'MatchCreationHandler',
-    'MatchCreationModal',
-    'TeamSelectionView',
+    'MatchCreationHandler': '.orga_match_creation',
+    'MatchCreationModal': '.orga_match_creation',
+    'TeamSelectionView': '.orga_match_creation',
     
-    'TeamManagementHandler',
-    'TeamRegistrationModal',
+    'TeamManagementHandler': '.orga_team_management',
+    'TeamRegistrationModal': '.orga_team_management',
     
-    'StreamerMatchManager',
-    'StreamerMatchView',
-    'TeamSideSelectionView',
-    'StreamURLModal',
+    'SettingsView': '.orga_settings',
+    'MatchOverviewView': '.orga_settings',
     
-    'StreamerSignupView',
-    'StreamerManagementView'
-]
\ No newline at end of file
+    'StreamerMatchManager': '.streamer_management',
+    'StreamerMatchView': '.streamer_management',
+    'TeamSideSelectionView': '.streamer_management',
+    'StreamURLModal': '.streamer_management',
+    
+    'StreamerSignupView': '.streamer_view',
+    'StreamerManagementView': '.streamer_view'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -1,22 +1,27 @@
 # ui/match_interactions/__init__.py
+# Lazy Exports (PEP 562): Selten genutzte Module wie orga_edit_system (Orga Edit,
+# Delete Confirmation) werden erst beim ersten Klick geladen.
 
-from .private_match_view import PrivateMatchView
-from .time_offer_system import TimeOfferModal, TimeOfferView
-from .server_offer_system import ServerOfferModal, ServerOfferView
-from .result_submission_system import SimpleResultView, ResultSubmissionView
-from .orga_result_confirmation import OrgaResultConfirmationView, OrgaResultEditView
-from .orga_edit_system import OrgaEditModal, OrgaEditView
+import importlib
 
-__all__ = [
-    'PrivateMatchView',
-    'TimeOfferModal',
-    'TimeOfferView',
-    'ServerOfferModal', 
-    'ServerOfferView',
-    'SimpleResultView',
-    'ResultSubmissionView',
-    'OrgaResultConfirmationView',
-    'OrgaResultEditView',
-    'OrgaEditModal',
-    'OrgaEditView'
-]
\ No newline at end of file
+_EXPORTS = {
+    'PrivateMatchView': '.private_match_view',
+    'TimeOfferModal': '.time_offer_system',
+    'TimeOfferView': '.time_offer_system',
+    'ServerOfferModal': '.server_offer_system',
+    'ServerOfferView': '.server_offer_system',
+    'SimpleResultView': '.result_submission_system',
+    'ResultSubmissionView': '.result_submission_system',
+    'OrgaResultConfirmationView': '.orga_result_confirmation',
+    'OrgaResultEditView': '.orga_result_confirmation',
+    'OrgaEditModal': '.orga_edit_system',
+    'OrgaEditView': '.orga_edit_system'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
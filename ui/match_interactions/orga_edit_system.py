@@ -12,6 +12,7 @@ import asyncio
 from datetime import datetime
 from typing import Dict, Any
 from utils.timezone_helper import TimezoneHelper
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,7 @@ class OrgaEditModal(discord.ui.Modal):
         self.add_item(self.match_time)
         self.add_item(self.map_name)
     
+    @match_action('orga_edit', per_user=True)
     async def on_submit(self, interaction: discord.Interaction):
         try:
             date_input = self.match_date.value.strip()
@@ -94,18 +96,11 @@ class OrgaEditModal(discord.ui.Modal):
                     )
                     return
             
-            cursor = self.bot.db.conn.cursor()
-            
-            cursor.execute('''
-                UPDATE matches 
-                SET match_date = ?, match_time = ?, map_name = ?
-                WHERE id = ?
-            ''', (date_str, time_str, map_name, self.match_id))
-            
-            self.bot.db.conn.commit()
+            # Map, Datum + Zeit zusammen mit dem UTC Zeitpunkt speichern (ein UPDATE + match_schedule, ein Commit)
+            self.bot.match_clock.set_match_time(self.match_id, date_str, time_str, update_date=True, map_name=map_name)
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren für Bestätigung
-            formatted_time = TimezoneHelper.format_time_with_timezone(time_str, self.bot) if time_str else "TBA"
+            formatted_time = self.bot.match_clock.render(self.match_id, time_str, date_str) if time_str else "TBA"
             
             embed = discord.Embed(
                 title="✅ Match Updated by Event Orga!",
@@ -193,8 +188,8 @@ class OrgaEditModal(discord.ui.Modal):
                         formatted_date = self._format_date_display(match_details[3])
                         
                         # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                        formatted_time = TimezoneHelper.format_time_with_timezone(
-                            match_details[4], self.bot
+                        formatted_time = self.bot.match_clock.render(
+                            self.match_id, match_details[4], match_details[3]
                         ) if match_details[4] else '*TBA*'
                         
                         for i, field in enumerate(embed.fields):
@@ -257,8 +252,8 @@ class OrgaEditModal(discord.ui.Modal):
                     formatted_date = self._format_date_display(match_details[3])
                     
                     # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                    formatted_time = TimezoneHelper.format_time_with_timezone(
-                        match_details[4], self.bot
+                    formatted_time = self.bot.match_clock.render(
+                        self.match_id, match_details[4], match_details[3]
                     ) if match_details[4] else "*TBA*"
                     
                     for i, field in enumerate(embed.fields):
@@ -300,8 +295,8 @@ class OrgaEditModal(discord.ui.Modal):
                             formatted_date = self._format_date_display(match_details[3])
                             
                             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                            formatted_time = TimezoneHelper.format_time_with_timezone(
-                                match_details[4], self.bot
+                            formatted_time = self.bot.match_clock.render(
+                                self.match_id, match_details[4], match_details[3]
                             ) if match_details[4] else "TBA"
                             
                             for i, field in enumerate(embed.fields):
@@ -387,6 +382,7 @@ class OrgaResultEditView(discord.ui.View):
         
         await interaction.response.edit_message(view=self)
     
+    @match_action('orga_result_edit')
     async def score_selected(self, interaction: discord.Interaction):
         self.selected_score = self.score_select.values[0]
         
@@ -765,6 +761,7 @@ class MatchDeleteConfirmationModal(discord.ui.Modal):
         
         self.add_item(self.code_input)
     
+    @match_action('match_delete', per_user=True)
     async def on_submit(self, interaction: discord.Interaction):
         try:
             entered_code = self.code_input.value.strip()
@@ -1034,12 +1031,15 @@ class MatchDeleteConfirmationModal(discord.ui.Modal):
                 cursor.execute("DELETE FROM tournament_settings WHERE key LIKE ?", (f'%public_match_{self.match_id}%',))
                 public_settings_deleted = cursor.rowcount
                 
-                # Match selbst löschen
+                # Match selbst löschen (inkl. UTC Zeitpunkt)
+                cursor.execute('DELETE FROM match_schedule WHERE match_id = ?', (self.match_id,))
                 cursor.execute('DELETE FROM matches WHERE id = ?', (self.match_id,))
                 match_deleted = cursor.rowcount
                 
                 # COMMIT am Ende
                 self.bot.db.conn.commit()
+                self.bot.match_clock.forget(self.match_id)
+                self.bot.scheduler.cancel_for_match(self.match_id)
                 
                 result['database_cleaned'] = True
                 logger.info(f"✅ Step 6 COMPLETE: Database cleaned - "
@@ -1089,7 +1089,7 @@ class OrgaEditView(discord.ui.View):
     
     @discord.ui.button(label='✏️ Edit Match Details', style=discord.ButtonStyle.primary)
     async def edit_match_details(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can edit match details!", ephemeral=True)
             return
         
@@ -1110,7 +1110,7 @@ class OrgaEditView(discord.ui.View):
     @discord.ui.button(label='📊 Edit Result', style=discord.ButtonStyle.success)
     async def edit_result(self, interaction: discord.Interaction, button: discord.ui.Button):
         """NEUER Button: Event Orga Result Editor"""
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can edit results!", ephemeral=True)
             return
         
@@ -1131,8 +1131,9 @@ class OrgaEditView(discord.ui.View):
         await interaction.response.send_message(embed=embed, view=edit_view, ephemeral=True)
     
     @discord.ui.button(label='🔄 Reset Server', style=discord.ButtonStyle.secondary)
+    @match_action('reset_server')
     async def reset_server(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can reset server details!", ephemeral=True)
             return
         
@@ -1159,7 +1160,7 @@ class OrgaEditView(discord.ui.View):
     @discord.ui.button(label='🗑️ DELETE MATCH', style=discord.ButtonStyle.danger)
     async def delete_match(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Button zum vollständigen Löschen eines Matches"""
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can delete matches!", ephemeral=True)
             return
         
@@ -1222,14 +1223,9 @@ class OrgaEditView(discord.ui.View):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.error(f"Could not get team names from config: {config_error}")
             
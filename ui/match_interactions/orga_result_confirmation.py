@@ -10,9 +10,14 @@ import json
 import asyncio
 from datetime import datetime
 from typing import Dict, Any
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_EMBED_TITLE = "📁 Match Archived"
+# Nach dem Verschieben ins Archiv passiert im Channel kaum noch etwas - das Embed steht weit oben
+ARCHIVE_EMBED_HISTORY_LIMIT = 25
+
 class OrgaResultConfirmationView(discord.ui.View):
  
     def __init__(self, bot, match_id: int, match_data: Dict[str, Any], result_data: Dict[str, Any]):
@@ -78,47 +83,36 @@ class OrgaResultConfirmationView(discord.ui.View):
             logger.error(f"Error restoring orga result confirmation view from persistence: {e}")
     
     @discord.ui.button(label='✅ Confirm Result', style=discord.ButtonStyle.success, custom_id='orga_confirm_result')
+    @match_action('result_confirm')
     async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can confirm results!", ephemeral=True)
             return
         
         try:
             await interaction.response.defer()
             
-            self.bot.db.confirm_match_result(self.match_id)
-            
-            match_details = self.bot.db.get_match_details(self.match_id)
-            
-            # GEÄNDERT: Update Public Match in separatem Channel
-            if match_details:
-                await self._update_public_match_in_separate_channel(match_details)
-            
-            await self._disable_submit_result_button()
-            
-            await self._update_private_embed_with_streamer_info()
-            
-            await self._archive_match_channel_preserve_server(interaction)
-            
-            await self._update_streamer_embeds_final_with_persistence()
+            # Status + Discord-Effekte (Public/Private/Streamer Embeds, Archivierung, Channel-Status) in einer
+            # Transaktion - die Outbox führt die Effekte danach aus, auch nach einem Neustart
+            from utils.match_effects import MatchEffects
+            self.bot.db.confirm_match_result(
+                self.match_id, effects=MatchEffects.result_confirmed(self.match_data, self.result_data, interaction.user.id)
+            )
+            self.bot.outbox.notify()
             
-            try:
-                await self.bot.status_manager.update_channel_status(self.match_id, 'completed')
-                logger.info(f"✅ Status updated to 'completed' for match {self.match_id}")
-            except Exception as status_error:
-                logger.error(f"Error updating status to completed for match {self.match_id}: {status_error}")
+            # Public Match Channel nach archive_delay_minutes archivieren (Scheduler, überlebt Neustarts)
+            self.bot.match_jobs.schedule_archive(self.match_id, self.result_data)
             
-            # FIXED: Embed erst nach allen Operationen erstellen
             embed = discord.Embed(
                 title="✅ Result Confirmed!",
-                description=f"Match result has been officially confirmed and archived.",
+                description=f"Match result has been confirmed. Embeds and the private channel archive are updated shortly.",
                 color=discord.Color.green()
             )
             embed.add_field(name="🏆 Match", value=f"{self.match_data['team1_name']} vs {self.match_data['team2_name']}", inline=False)
             embed.add_field(name="🥇 Winner", value=f"**{self.result_data['winner']}**", inline=True)
             embed.add_field(name="📊 Score", value=f"**{self.result_data['score']}**", inline=True)
             embed.add_field(name="👤 Confirmed by", value=interaction.user.mention, inline=True)
-            embed.add_field(name="ℹ️ Status", value="✅ Public embed updated\n✅ Private channel archived\n✅ Private button disabled\n✅ Streamer embeds updated\n✅ Server details preserved\n✅ Persistence synchronized", inline=False)
+            embed.add_field(name="ℹ️ Status", value="✅ Result saved\n📬 Public embed, private channel archive and streamer embeds are being updated\n✅ Server details preserved", inline=False)
             
             for item in self.children:
                 item.disabled = True
@@ -128,7 +122,7 @@ class OrgaResultConfirmationView(discord.ui.View):
             if hasattr(self, 'supersede_view') and self.supersede_view:
                 await self._disable_superseded_view_after_confirmation()
             
-            logger.info(f"Match {self.match_id} result confirmed by {interaction.user} - COMPLETE WITH PUBLIC EMBED UPDATE")
+            logger.info(f"Match {self.match_id} result confirmed by {interaction.user} - Discord updates queued in outbox")
             
         except Exception as e:
             import traceback
@@ -159,16 +153,17 @@ class OrgaResultConfirmationView(discord.ui.View):
                 except:
                     pass
     
-    async def _update_public_match_in_separate_channel(self, match_details):
+    async def _update_public_match_in_separate_channel(self, match_details) -> bool:
         """
         NEUE Methode: Update Public Match Embed in separatem Channel
+        Rückgabe: True wenn aktualisiert (oder kein Public Channel angelegt), sonst False
         """
         try:
             # Channel ID für dieses Match aus Datenbank holen
             stored_channel_id = self.bot.db.get_setting(f'public_match_{self.match_id}_channel_id')
             if not stored_channel_id:
                 logger.warning(f"No public match channel found for match {self.match_id}")
-                return
+                return True
             
             # Channel finden
             channel = None
@@ -179,7 +174,7 @@ class OrgaResultConfirmationView(discord.ui.View):
             
             if not channel:
                 logger.warning(f"Public match channel {stored_channel_id} not found for match {self.match_id}")
-                return
+                return False
             
             # Letzte Message in diesem Channel finden (sollte das Match Embed sein)
             async for message in channel.history(limit=10):
@@ -207,12 +202,16 @@ class OrgaResultConfirmationView(discord.ui.View):
                     
                     await message.edit(embed=embed)
                     logger.info(f"✅ Public match embed updated in separate channel for match {self.match_id}")
-                    break
+                    return True
+            
+            logger.warning(f"Public match embed not found in channel {stored_channel_id} for match {self.match_id}")
+            return False
             
         except Exception as e:
             import traceback
             logger.error(f"❌ Error updating public match in separate channel: {e}")
             logger.error(f"❌ Traceback: {traceback.format_exc()}")
+            return False
     
     async def _disable_superseded_view_after_confirmation(self):
         try:
@@ -229,7 +228,7 @@ class OrgaResultConfirmationView(discord.ui.View):
             )
             embed.add_field(name="🥇 Final Winner", value=self.result_data['winner'], inline=True)
             embed.add_field(name="📊 Final Score", value=self.result_data['score'], inline=True)
-            embed.add_field(name="ℹ️ Status", value="Confirmed and archived by Event Orga", inline=True)
+            embed.add_field(name="ℹ️ Status", value="Confirmed by Event Orga", inline=True)
             
             superseded_message = None
             
@@ -300,16 +299,22 @@ class OrgaResultConfirmationView(discord.ui.View):
             import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
     
-    async def _update_streamer_embeds_final_with_persistence(self):
+    async def _update_streamer_embeds_final_with_persistence(self) -> bool:
+        """
+        Rückgabe: True wenn aktualisiert (oder keine Streamer Message registriert), sonst False
+        """
         try:
+            if not self.bot.db.get_match_streamer_message_id(self.match_id):
+                return True
+            
             message, channel = await self._find_streamer_message()
             
             if not message or not channel:
-                logger.info(f"No streamer message found for match {self.match_id}")
-                return
+                logger.warning(f"Streamer message for match {self.match_id} not found")
+                return False
             
             if not message.embeds:
-                return
+                return True
             
             embed = message.embeds[0]
             
@@ -322,7 +327,7 @@ class OrgaResultConfirmationView(discord.ui.View):
             
             result_field_found = False
             for i, field in enumerate(embed.fields):
-                if "Status" in field.name or ("📺" in field.name and "Status" in field.name):
+                if "Status" in field.name or "Final Result" in field.name:
                     embed.set_field_at(i, name="📺 Final Result", value=f"✅ **COMPLETED**\n{result_text}", inline=field.inline)
                     result_field_found = True
                     break
@@ -333,11 +338,13 @@ class OrgaResultConfirmationView(discord.ui.View):
             await message.edit(embed=embed)
             
             logger.info(f"✅ Streamer embed updated WITHOUT changing buttons for match {self.match_id}")
+            return True
             
         except Exception as e:
             import traceback
             logger.error(f"❌ Error updating streamer embed: {e}")
             logger.error(f"❌ Traceback: {traceback.format_exc()}")
+            return False
     
     async def _find_streamer_message(self):
         try:
@@ -365,18 +372,22 @@ class OrgaResultConfirmationView(discord.ui.View):
         except Exception as e:
             return None, None
     
-    async def _disable_submit_result_button(self):
+    async def _disable_submit_result_button(self) -> bool:
+        """
+        Rückgabe: True wenn deaktiviert (oder kein Private Channel), sonst False
+        """
         try:
             cursor = self.bot.db.conn.cursor()
             cursor.execute('SELECT private_channel_id FROM matches WHERE id = ?', (self.match_id,))
             result = cursor.fetchone()
             
             if not result or not result[0]:
-                return
+                return True
             
             private_channel = self.bot.get_channel(result[0])
             if not private_channel:
-                return
+                logger.warning(f"Private channel {result[0]} not found for match {self.match_id}")
+                return False
             
             async for message in private_channel.history(limit=50, oldest_first=True):
                 if (message.author == self.bot.user and 
@@ -403,23 +414,31 @@ class OrgaResultConfirmationView(discord.ui.View):
                         
                         await message.edit(embed=embed, view=view)
                         logger.info(f"Submit Result button disabled for match {self.match_id}")
-                        break
+                        return True
+            
+            logger.warning(f"Private match embed not found for match {self.match_id}")
+            return False
             
         except Exception as e:
             logger.error(f"Error disabling submit result button: {e}")
+            return False
     
-    async def _update_private_embed_with_streamer_info(self):
+    async def _update_private_embed_with_streamer_info(self) -> bool:
+        """
+        Rückgabe: True wenn aktualisiert (oder kein Private Channel), sonst False
+        """
         try:
             cursor = self.bot.db.conn.cursor()
             cursor.execute('SELECT private_channel_id FROM matches WHERE id = ?', (self.match_id,))
             result = cursor.fetchone()
             
             if not result or not result[0]:
-                return
+                return True
             
             private_channel = self.bot.get_channel(result[0])
             if not private_channel:
-                return
+                logger.warning(f"Private channel {result[0]} not found for match {self.match_id}")
+                return False
             
             streamers = self.bot.db.get_match_streamers_detailed(self.match_id)
             
@@ -476,45 +495,88 @@ class OrgaResultConfirmationView(discord.ui.View):
                     
                     await message.edit(embed=embed)
                     logger.info(f"Private embed updated with streamer info for match {self.match_id}")
-                    break
+                    return True
+            
+            logger.warning(f"Private match embed not found for match {self.match_id}")
+            return False
             
         except Exception as e:
             logger.error(f"Error updating private embed with streamer info: {e}")
+            return False
     
-    async def _archive_match_channel_preserve_server(self, interaction):
+    async def _archive_embed_posted(self, channel: discord.TextChannel) -> bool:
+        """Steht das "📁 Match Archived" Embed des Bots schon in den letzten Messages des Channels?"""
+        async for message in channel.history(limit=ARCHIVE_EMBED_HISTORY_LIMIT):
+            if message.author.id == self.bot.user.id and any(embed.title == ARCHIVE_EMBED_TITLE for embed in message.embeds):
+                return True
+        return False
+    
+    def _build_archive_embed(self, confirmed_by_id: int = None) -> discord.Embed:
+        server_details = None
+        server_data_json = self.bot.db.get_setting(f'match_{self.match_id}_server')
+        if server_data_json:
+            try:
+                server_details = json.loads(server_data_json)
+            except:
+                pass
+        
+        archive_embed = discord.Embed(
+            title=ARCHIVE_EMBED_TITLE,
+            description="This match has been completed and archived.",
+            color=discord.Color.dark_grey()
+        )
+        archive_embed.add_field(name="🏆 Final Result", value=f"**{self.result_data['winner']}** wins {self.result_data['score']}", inline=False)
+        if confirmed_by_id:
+            archive_embed.add_field(name="👤 Confirmed by", value=f"<@{confirmed_by_id}>", inline=True)
+        
+        if server_details:
+            server_text = f"**{server_details['server_name']}**\nPassword: `{server_details['server_password']}`\nProvided by: {server_details['offering_team']}"
+            archive_embed.add_field(name="🖥️ Server Details", value=server_text, inline=False)
+        return archive_embed
+    
+    async def _archive_match_channel_preserve_server(self, confirmed_by_id: int = None) -> bool:
+        """
+        Zwei idempotente Schritte: Channel ins Archiv verschieben, dann das Archiv-Embed posten.
+        Ein Replay nach Abbruch zwischen beiden Schritten holt das fehlende Embed nach.
+        Rückgabe: True wenn archiviert (oder nichts zu archivieren), sonst False
+        """
         try:
             archive_category_id = self.bot.config['categories'].get('archive_category_id')
             if not archive_category_id:
                 logger.warning("No archive category configured in config.json")
-                return
+                return True
             
-            archive_category = interaction.guild.get_channel(archive_category_id)
+            archive_category = self.bot.get_channel(archive_category_id)
             if not archive_category:
                 logger.warning(f"Archive category {archive_category_id} not found")
-                return
+                return False
             
             cursor = self.bot.db.conn.cursor()
             cursor.execute('SELECT private_channel_id FROM matches WHERE id = ?', (self.match_id,))
             result = cursor.fetchone()
             
             if not result or not result[0]:
-                return
+                return True
             
-            private_channel = interaction.guild.get_channel(result[0])
+            private_channel = self.bot.get_channel(result[0])
             if not private_channel:
-                return
+                logger.warning(f"Private channel {result[0]} not found for match {self.match_id}")
+                return False
             
-            server_data_json = self.bot.db.get_setting(f'match_{self.match_id}_server')
-            server_details = None
-            if server_data_json:
-                try:
-                    server_details = json.loads(server_data_json)
-                except:
-                    pass
+            # Bereits verschoben (Outbox-Replay nach Neustart) - nur noch das Embed sicherstellen
+            if private_channel.category_id == archive_category.id:
+                if await self._archive_embed_posted(private_channel):
+                    logger.info(f"Match {self.match_id} channel already archived")
+                    return True
+                await private_channel.send(embed=self._build_archive_embed(confirmed_by_id))
+                logger.info(f"Match {self.match_id} channel was already moved - posted missing archive embed")
+                return True
+            
+            guild = private_channel.guild
             
             match_details = self.bot.db.get_match_details(self.match_id)
             if not match_details:
-                return
+                return True
             
             team1_id = match_details[1]
             team2_id = match_details[2]
@@ -532,12 +594,12 @@ class OrgaResultConfirmationView(discord.ui.View):
             overwrites = private_channel.overwrites
             
             if team1_role_id:
-                team1_role = interaction.guild.get_role(team1_role_id)
+                team1_role = guild.get_role(team1_role_id)
                 if team1_role and team1_role in overwrites:
                     del overwrites[team1_role]
             
             if team2_role_id:
-                team2_role = interaction.guild.get_role(team2_role_id)
+                team2_role = guild.get_role(team2_role_id)
                 if team2_role and team2_role in overwrites:
                     del overwrites[team2_role]
             
@@ -547,28 +609,18 @@ class OrgaResultConfirmationView(discord.ui.View):
                 name=f"archived-{private_channel.name}"
             )
             
-            archive_embed = discord.Embed(
-                title="📁 Match Archived",
-                description="This match has been completed and archived.",
-                color=discord.Color.dark_grey()
-            )
-            archive_embed.add_field(name="🏆 Final Result", value=f"**{self.result_data['winner']}** wins {self.result_data['score']}", inline=False)
-            archive_embed.add_field(name="👤 Confirmed by", value=interaction.user.mention, inline=True)
-            
-            if server_details:
-                server_text = f"**{server_details['server_name']}**\nPassword: `{server_details['server_password']}`\nProvided by: {server_details['offering_team']}"
-                archive_embed.add_field(name="🖥️ Server Details", value=server_text, inline=False)
-            
-            await private_channel.send(embed=archive_embed)
+            await private_channel.send(embed=self._build_archive_embed(confirmed_by_id))
             
             logger.info(f"Match {self.match_id} channel archived successfully with server preservation")
+            return True
             
         except Exception as e:
             logger.error(f"Error archiving match channel: {e}")
+            return False
     
     @discord.ui.button(label='✏️ Edit Result', style=discord.ButtonStyle.secondary, custom_id='orga_edit_result')
     async def edit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can edit results!", ephemeral=True)
             return
         
@@ -652,14 +704,9 @@ class OrgaResultConfirmationView(discord.ui.View):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.error(f"Could not get team names from config: {config_error}")
             
@@ -744,6 +791,7 @@ class OrgaResultEditView(discord.ui.View):
         
         await interaction.response.edit_message(view=self)
     
+    @match_action('result_correct')
     async def score_selected(self, interaction: discord.Interaction):
         self.selected_score = self.score_select.values[0]
         
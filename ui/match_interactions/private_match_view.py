@@ -158,7 +158,7 @@ class PrivateMatchView(discord.ui.View):
     
     @discord.ui.button(label='⚙️ Orga Edit', style=discord.ButtonStyle.danger, row=1, custom_id='orga_edit_btn')
     async def orga_edit_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if not any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in interaction.user.roles):
+        if not self.bot.role_index.authorize(interaction.user, orga=True):
             await interaction.response.send_message("❌ Only Event Orga can edit match details!", ephemeral=True)
             return
         
@@ -178,30 +178,7 @@ class PrivateMatchView(discord.ui.View):
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     
     def _user_in_match_teams(self, user: discord.Member) -> bool:
-        try:
-            match_details = self.bot.db.get_match_details(self.match_id)
-            if not match_details:
-                return False
-            
-            team1_id = match_details[1]
-            team2_id = match_details[2] 
-            
-            teams = self.bot.get_all_teams()
-            team1_role_id = None
-            team2_role_id = None
-            
-            for team in teams:
-                if team[0] == team1_id:
-                    team1_role_id = team[2]
-                elif team[0] == team2_id:
-                    team2_role_id = team[2]
-            
-            user_role_ids = [role.id for role in user.roles]
-            return team1_role_id in user_role_ids or team2_role_id in user_role_ids
-            
-        except Exception as e:
-            logger.error(f"Error checking user team membership: {e}")
-            return False
+        return self.bot.role_index.authorize(user, match_id=self.match_id)
     
     @classmethod
     def restore_from_persistence_data(cls, bot, persistence_data: Dict[str, Any]):
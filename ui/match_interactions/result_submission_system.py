@@ -9,6 +9,7 @@ import logging
 import json
 from datetime import datetime
 from typing import Dict, Any, List
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -83,14 +84,9 @@ class SimpleResultView(discord.ui.View):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
@@ -118,6 +114,7 @@ class SimpleResultView(discord.ui.View):
         
         await interaction.response.edit_message(view=self)
     
+    @match_action('result_submit')
     async def score_selected(self, interaction: discord.Interaction):
         
         self.selected_score = self.score_select.values[0]
@@ -392,56 +389,24 @@ class SimpleResultView(discord.ui.View):
     def _get_user_team_info_with_real_names(self, user: discord.Member):
         
         try:
-            match_details = self.bot.db.get_match_details(self.match_id)
-            if not match_details:
+            role_index = self.bot.role_index
+            match_teams = role_index.match_teams(self.match_id)
+            if not match_teams:
                 return None
             
-            team1_id = match_details[1]
-            team2_id = match_details[2]
-            
-            
-            team1_name = "Team 1"  
-            team2_name = "Team 2"  
-            
-            
-            try:
-                all_teams = self.bot.get_all_teams()
-                for team_tuple in all_teams:
-                    team_config_id, name, role_id, members, active = team_tuple
-                    
-                    if team_config_id == team1_id:
-                        team1_name = name
-                    elif team_config_id == team2_id:
-                        team2_name = name
-                        
-                logger.info(f"🏆 REAL team names from config: Team1={team1_name}, Team2={team2_name}")
-                        
-            except Exception as config_error:
-                logger.error(f"Could not get team names from config: {config_error}")
-                
-                if len(match_details) > 16:
-                    team1_name = match_details[16] or f"Team {team1_id}"
-                if len(match_details) > 17:
-                    team2_name = match_details[17] or f"Team {team2_id}"
-            
-            
-            teams = self.bot.db.get_all_teams()
-            team1_role_id = None
-            team2_role_id = None
-            
-            for team in teams:
-                if team[0] == team1_id:
-                    team1_role_id = team[2]
-                elif team[0] == team2_id:
-                    team2_role_id = team[2]
+            team1_id, team2_id = match_teams
             
+            teams = self.bot.team_registry
+            team1_name = teams.display_name_for_db_id(team1_id, "Team 1")
+            team2_name = teams.display_name_for_db_id(team2_id, "Team 2")
+            team1_role_id, team2_role_id = role_index.match_team_role_ids(self.match_id)
             
-            user_role_ids = [role.id for role in user.roles]
+            side = role_index.match_side(user, self.match_id)
             
-            if team1_role_id in user_role_ids:
+            if side == 'team1':
                 logger.info(f"✅ User {user} is in team1: {team1_name}")
                 return team1_name, team2_name, team2_role_id
-            elif team2_role_id in user_role_ids:
+            elif side == 'team2':
                 logger.info(f"✅ User {user} is in team2: {team2_name}")
                 return team2_name, team1_name, team1_role_id
             
@@ -558,6 +523,7 @@ class ResultSubmissionView(discord.ui.View):
             return None
     
     @discord.ui.button(label='✅ Confirm Result', style=discord.ButtonStyle.success, custom_id='confirm_result')
+    @match_action('result_team_confirm')
     async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         
         
@@ -766,6 +732,7 @@ class ResultSubmissionView(discord.ui.View):
             logger.error(f"Error notifying Event Orga with buttons: {e}")
     
     @discord.ui.button(label='🔄 Dispute & Counter', style=discord.ButtonStyle.danger, custom_id='dispute_result')
+    @match_action('result_dispute')
     async def dispute_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         
         
@@ -919,8 +886,7 @@ class ResultSubmissionView(discord.ui.View):
     
     def _user_in_responding_team(self, user: discord.Member) -> bool:
         
-        user_role_ids = [role.id for role in user.roles]
-        return self.responding_team_role_id in user_role_ids
+        return self.bot.role_index.authorize(user, role_ids=(self.responding_team_role_id,))
     
     def restore_from_persistence_data(self, persistence_data: Dict[str, Any]):
         
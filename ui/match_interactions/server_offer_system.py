@@ -9,6 +9,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from utils.timezone_helper import TimezoneHelper
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class ServerOfferModal(discord.ui.Modal):
         self.add_item(self.server_name)
         self.add_item(self.server_password)
     
+    @match_action('server_offer', per_user=True)
     async def on_submit(self, interaction: discord.Interaction):
         
         try:
@@ -107,6 +109,16 @@ class ServerOfferModal(discord.ui.Modal):
                     'expires_in_hours': 24
                 })
                 
+                # Ablauf nach offer_expiry_hours über den Scheduler (überlebt Neustarts)
+                self.bot.match_jobs.schedule_offer_expiry('server_offer', actual_message, self.match_id, {
+                    'server_name': server_name,
+                    'server_password': server_password,
+                    'offering_team': offering_team_name,
+                    'responding_team': other_team_name,
+                    'responding_team_role_id': other_team_role_id,
+                    'match_data': self.match_data
+                })
+                
                 
                 ui_data = {
                     'view_type': 'server_offer',
@@ -173,56 +185,24 @@ class ServerOfferModal(discord.ui.Modal):
     def _get_user_team_info_with_real_names(self, user: discord.Member):
         
         try:
-            match_details = self.bot.db.get_match_details(self.match_id)
-            if not match_details:
+            role_index = self.bot.role_index
+            match_teams = role_index.match_teams(self.match_id)
+            if not match_teams:
                 return None
             
-            team1_id = match_details[1]
-            team2_id = match_details[2]
+            team1_id, team2_id = match_teams
             
+            teams = self.bot.team_registry
+            team1_name = teams.display_name_for_db_id(team1_id, "Team 1")
+            team2_name = teams.display_name_for_db_id(team2_id, "Team 2")
+            team1_role_id, team2_role_id = role_index.match_team_role_ids(self.match_id)
             
-            team1_name = "Team 1"  
-            team2_name = "Team 2"  
+            side = role_index.match_side(user, self.match_id)
             
-            
-            try:
-                all_teams = self.bot.get_all_teams()
-                for team_tuple in all_teams:
-                    team_config_id, name, role_id, members, active = team_tuple
-                    
-                    if team_config_id == team1_id:
-                        team1_name = name
-                    elif team_config_id == team2_id:
-                        team2_name = name
-                        
-                logger.info(f"🏆 REAL team names from config: Team1={team1_name}, Team2={team2_name}")
-                        
-            except Exception as config_error:
-                logger.error(f"Could not get team names from config: {config_error}")
-                
-                if len(match_details) > 16:
-                    team1_name = match_details[16] or f"Team {team1_id}"
-                if len(match_details) > 17:
-                    team2_name = match_details[17] or f"Team {team2_id}"
-            
-            
-            teams = self.bot.db.get_all_teams()
-            team1_role_id = None
-            team2_role_id = None
-            
-            for team in teams:
-                if team[0] == team1_id:
-                    team1_role_id = team[2]
-                elif team[0] == team2_id:
-                    team2_role_id = team[2]
-            
-            
-            user_role_ids = [role.id for role in user.roles]
-            
-            if team1_role_id in user_role_ids:
+            if side == 'team1':
                 logger.info(f"✅ User {user} is in team1: {team1_name}")
                 return team1_name, team2_name, team2_role_id
-            elif team2_role_id in user_role_ids:
+            elif side == 'team2':
                 logger.info(f"✅ User {user} is in team2: {team2_name}")
                 return team2_name, team1_name, team1_role_id
             
@@ -360,6 +340,7 @@ class ServerOfferModal(discord.ui.Modal):
                 
                 
                 self.bot.db.complete_ongoing_interaction(superseded_message.id)
+                self.bot.match_jobs.cancel_offer_expiry(superseded_message.id)
                 
                 logger.info(f"✅ Successfully disabled superseded server offer view: {superseded_message.id}")
             else:
@@ -430,6 +411,7 @@ class ServerOfferView(discord.ui.View):
             return None
     
     @discord.ui.button(label='✅ Accept Server', style=discord.ButtonStyle.success, custom_id='server_accept')
+    @match_action('server_accept')
     async def accept_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         
         
@@ -486,6 +468,7 @@ class ServerOfferView(discord.ui.View):
             message = await self._get_message_from_stored_ids()
             if message:
                 self.bot.db.complete_ongoing_interaction(message.id)
+            self.bot.match_jobs.cancel_offer_expiry(message.id if message else self.message_id)
             
             logger.info(f"✅ TIMEZONE: Server '{self.server_name}' accepted for match {self.match_id} - FIXED DM sent to streamer with REAL team name: {self.offering_team}")
             
@@ -528,8 +511,7 @@ class ServerOfferView(discord.ui.View):
     
     def _user_in_responding_team(self, user: discord.Member) -> bool:
         
-        user_role_ids = [role.id for role in user.roles]
-        return self.responding_team_role_id in user_role_ids
+        return self.bot.role_index.authorize(user, role_ids=(self.responding_team_role_id,))
     
     
     
@@ -580,14 +562,9 @@ class ServerOfferView(discord.ui.View):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
@@ -603,7 +580,7 @@ class ServerOfferView(discord.ui.View):
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren für DM
             if current_match_time and current_match_time != 'TBA':
-                formatted_time = TimezoneHelper.format_time_with_timezone(current_match_time, self.bot)
+                formatted_time = self.bot.match_clock.render(self.match_id, current_match_time, current_match_date)
             else:
                 formatted_time = 'TBA'
             
@@ -611,7 +588,7 @@ class ServerOfferView(discord.ui.View):
             real_offering_team = self.offering_team  
             
             # TIMEZONE SUPPORT: Timezone-Info für DM
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             dm_embed = discord.Embed(
                 title="🖥️ Server Details - Match Reminder",
@@ -10,6 +10,7 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from utils.timezone_helper import TimezoneHelper
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class TimeOfferModal(discord.ui.Modal):
         
         self.add_item(self.time_input)
     
+    @match_action('time_offer', per_user=True)
     async def on_submit(self, interaction: discord.Interaction):
         
         try:
@@ -68,8 +70,8 @@ class TimeOfferModal(discord.ui.Modal):
             await self._disable_time_offer_button_after_offer()
             
             # TIMEZONE SUPPORT: Embed mit Timezone-formatierter Zeit
-            formatted_time = TimezoneHelper.format_time_with_timezone(time_str, self.bot)
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            formatted_time = self.bot.match_clock.render(self.match_id, time_str, self.match_data.get('match_date'))
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             embed = discord.Embed(
                 title="🕒 Match Time Offer",
@@ -116,6 +118,15 @@ class TimeOfferModal(discord.ui.Modal):
                     'expires_in_hours': 24
                 })
                 
+                # Ablauf nach offer_expiry_hours über den Scheduler (überlebt Neustarts)
+                self.bot.match_jobs.schedule_offer_expiry('time_offer', actual_message, self.match_id, {
+                    'offered_time': time_str,
+                    'offering_team': offering_team_name,
+                    'responding_team': other_team_name,
+                    'responding_team_role_id': other_team_role_id,
+                    'match_data': self.match_data
+                })
+                
                 
                 ui_data = {
                     'view_type': 'time_offer',
@@ -181,56 +192,24 @@ class TimeOfferModal(discord.ui.Modal):
     def _get_user_team_info_with_real_names(self, user: discord.Member):
         
         try:
-            match_details = self.bot.db.get_match_details(self.match_id)
-            if not match_details:
+            role_index = self.bot.role_index
+            match_teams = role_index.match_teams(self.match_id)
+            if not match_teams:
                 return None
             
-            team1_id = match_details[1]
-            team2_id = match_details[2]
-            
-            
-            team1_name = "Team 1"  
-            team2_name = "Team 2"  
-            
-            
-            try:
-                all_teams = self.bot.get_all_teams()
-                for team_tuple in all_teams:
-                    team_config_id, name, role_id, members, active = team_tuple
-                    
-                    if team_config_id == team1_id:
-                        team1_name = name
-                    elif team_config_id == team2_id:
-                        team2_name = name
-                        
-                logger.info(f"🏆 REAL team names from config: Team1={team1_name}, Team2={team2_name}")
-                        
-            except Exception as config_error:
-                logger.error(f"Could not get team names from config: {config_error}")
-                
-                if len(match_details) > 16:
-                    team1_name = match_details[16] or f"Team {team1_id}"
-                if len(match_details) > 17:
-                    team2_name = match_details[17] or f"Team {team2_id}"
-            
-            
-            teams = self.bot.db.get_all_teams()
-            team1_role_id = None
-            team2_role_id = None
-            
-            for team in teams:
-                if team[0] == team1_id:
-                    team1_role_id = team[2]
-                elif team[0] == team2_id:
-                    team2_role_id = team[2]
+            team1_id, team2_id = match_teams
             
+            teams = self.bot.team_registry
+            team1_name = teams.display_name_for_db_id(team1_id, "Team 1")
+            team2_name = teams.display_name_for_db_id(team2_id, "Team 2")
+            team1_role_id, team2_role_id = role_index.match_team_role_ids(self.match_id)
             
-            user_role_ids = [role.id for role in user.roles]
+            side = role_index.match_side(user, self.match_id)
             
-            if team1_role_id in user_role_ids:
+            if side == 'team1':
                 logger.info(f"✅ User {user} is in team1: {team1_name}")
                 return team1_name, team2_name, team2_role_id
-            elif team2_role_id in user_role_ids:
+            elif side == 'team2':
                 logger.info(f"✅ User {user} is in team2: {team2_name}")
                 return team2_name, team1_name, team1_role_id
             
@@ -368,6 +347,7 @@ class TimeOfferModal(discord.ui.Modal):
                 
                 
                 self.bot.db.complete_ongoing_interaction(superseded_message.id)
+                self.bot.match_jobs.cancel_offer_expiry(superseded_message.id)
                 
                 logger.info(f"✅ Successfully disabled superseded time offer view: {superseded_message.id}")
             else:
@@ -439,6 +419,7 @@ class TimeOfferView(discord.ui.View):
             return None
     
     @discord.ui.button(label='✅ Accept Time', style=discord.ButtonStyle.success, custom_id='time_accept')
+    @match_action('time_accept')
     async def accept_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         
         
@@ -448,11 +429,11 @@ class TimeOfferView(discord.ui.View):
         
         try:
             
-            self.bot.db.update_match_time(self.match_id, self.offered_time)
+            self.bot.match_clock.set_match_time(self.match_id, None, self.offered_time)
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-            formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             
             embed = discord.Embed(
@@ -528,6 +509,7 @@ class TimeOfferView(discord.ui.View):
             message = await self._get_message_from_stored_ids()
             if message:
                 self.bot.db.complete_ongoing_interaction(message.id)
+            self.bot.match_jobs.cancel_offer_expiry(message.id if message else self.message_id)
             
             logger.info(f"✅ TIMEZONE: Time {self.offered_time} accepted for match {self.match_id} WITH TIMEZONE DISPLAY")
 
@@ -596,8 +578,8 @@ class TimeOfferView(discord.ui.View):
                 
                 if team1_role and team2_role:
                     # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                    formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
-                    timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+                    formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
+                    timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
                     
                     confirmation_embed = discord.Embed(
                         title="✅ Match Time Confirmed!",
@@ -621,8 +603,7 @@ class TimeOfferView(discord.ui.View):
     
     def _user_in_responding_team(self, user: discord.Member) -> bool:
         
-        user_role_ids = [role.id for role in user.roles]
-        return self.responding_team_role_id in user_role_ids
+        return self.bot.role_index.authorize(user, role_ids=(self.responding_team_role_id,))
     
     
     
@@ -659,9 +640,10 @@ class TimeOfferView(discord.ui.View):
                         
                         
                         # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                        formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
+                        formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
                         view.time_offer_button.disabled = True
-                        view.time_offer_button.label = f"✅ Time Set: {formatted_time}"
+                        # Button Labels rendern kein Markdown - <t:...> würde roh angezeigt
+                        view.time_offer_button.label = f"✅ Time Set: {self.bot.settings.format_time(self.offered_time)}"
                         view.time_offer_button.style = discord.ButtonStyle.success
                         
                         
@@ -830,7 +812,7 @@ class TimeOfferView(discord.ui.View):
                     embed = message.embeds[0]
                     
                     # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                    formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
+                    formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
                     
                     # Nur time field aktualisieren
                     for i, field in enumerate(embed.fields):
@@ -872,7 +854,7 @@ class TimeOfferView(discord.ui.View):
                             embed = message.embeds[0]
                             
                             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-                            formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
+                            formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
                             
                             
                             for i, field in enumerate(embed.fields):
@@ -924,8 +906,8 @@ class TimeOfferView(discord.ui.View):
                 return
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
-            formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             
             embed = discord.Embed(
@@ -943,7 +925,7 @@ class TimeOfferView(discord.ui.View):
    
             await streamer_notification_channel.send(f"{streamer_user.mention}", embed=embed, delete_after=60)
             
-            logger.info(f"TIMEZONE: Streamer {streamer_user} notified about match time {formatted_time} in notification channel")
+            logger.info(f"TIMEZONE: Streamer {streamer_user} notified about match time {self.bot.settings.format_time(self.offered_time)} in notification channel")
             
         except Exception as e:
             logger.error(f"Error notifying streamer: {e}")
@@ -955,7 +937,7 @@ class TimeOfferView(discord.ui.View):
                 item.disabled = True
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren für Timeout-Message
-            formatted_time = TimezoneHelper.format_time_with_timezone(self.offered_time, self.bot)
+            formatted_time = self.bot.match_clock.render(self.match_id, self.offered_time, self.match_data.get('match_date'))
             
             
             embed = discord.Embed(
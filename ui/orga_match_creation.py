@@ -4,6 +4,7 @@ WITH TIMEZONE SUPPORT
 Speichere als: ui/orga_match_creation.py
 """
 
+import asyncio
 import discord
 import logging
 from datetime import datetime
@@ -166,11 +167,12 @@ class TeamSelectionView(discord.ui.View):
     
     async def team2_selected(self, interaction: discord.Interaction):
         self.selected_team2 = int(self.team2_select.values[0])
+        wheel_files_task = None
         
         try:
-            all_teams = self.bot.get_all_teams()
-            team1_data = next((team for team in all_teams if team[0] == self.selected_team1), None)
-            team2_data = next((team for team in all_teams if team[0] == self.selected_team2), None)
+            teams = self.bot.team_registry
+            team1_data = teams.get_by_config_id(self.selected_team1)
+            team2_data = teams.get_by_config_id(self.selected_team2)
             
             if not team1_data or not team2_data:
                 await interaction.response.send_message("❌ Teams nicht in Config gefunden!", ephemeral=True)
@@ -201,6 +203,11 @@ class TeamSelectionView(discord.ui.View):
             
             logger.info(f"🎲 Wheel results: Map={selected_map}, {team1_data[1]}={team1_side}, {team2_data[1]}={team2_side}")
             
+            # Beide Wheels rendern parallel im Render Pool, während Channel + DB Einträge erstellt werden
+            wheel_files_task = asyncio.create_task(
+                MatchWheelService.create_wheel_files(map_wheel_data, sides_wheel_data, self.bot.config)
+            )
+            
             db_team1_id = self.bot.create_legacy_team_in_db(team1_data)
             db_team2_id = self.bot.create_legacy_team_in_db(team2_data)
             
@@ -216,6 +223,7 @@ class TeamSelectionView(discord.ui.View):
                 db_team1_id, db_team2_id, self.date_str, selected_map,
                 team1_side, team2_side, private_channel.id, self.week
             )
+            self.bot.role_index.remember_match(match_id, db_team1_id, db_team2_id)
             
             match_data = {
                 'match_id': match_id,
@@ -234,7 +242,9 @@ class TeamSelectionView(discord.ui.View):
                 private_channel, match_id, match_data, team1_role, team2_role
             )
             
-            await self._send_wheel_gifs_to_channel(private_channel, match_id, map_wheel_data, sides_wheel_data)
+            # Ab hier wartet _send_wheel_gifs_to_channel den Task ab
+            handed_off_task, wheel_files_task = wheel_files_task, None
+            await self._send_wheel_gifs_to_channel(private_channel, match_id, map_wheel_data, sides_wheel_data, handed_off_task)
             
             public_message = await self.bot.send_public_match_with_lazy_persistence(
                 interaction.guild, match_id, match_data, self.prefix
@@ -248,11 +258,11 @@ class TeamSelectionView(discord.ui.View):
             except:
                 formatted_date = self.date_str
             
-            team1_side_with_icon = self._format_team_side_with_icon(team1_side)
-            team2_side_with_icon = self._format_team_side_with_icon(team2_side)
+            team1_side_with_icon = self.bot.settings.side_label(team1_side)
+            team2_side_with_icon = self.bot.settings.side_label(team2_side)
             
             # TIMEZONE SUPPORT: Timezone-Info im Success Embed
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            timezone_warning = self.bot.settings.timezone_warning
             
             embed = discord.Embed(
                 title="✅ Match erfolgreich erstellt!",
@@ -286,20 +296,11 @@ class TeamSelectionView(discord.ui.View):
         except Exception as e:
             logger.error(f"Fehler beim Match erstellen: {e}")
             await interaction.response.send_message("❌ Fehler beim Erstellen des Matches!", ephemeral=True)
-    
-    def _format_team_side_with_icon(self, team_side: str) -> str:
-        try:
-            team_icons = self.bot.config.get('team_icons', {})
-            icon = team_icons.get(team_side.upper(), '')
-            
-            if icon:
-                return f"{team_side} {icon}"
-            else:
-                return team_side
-                
-        except Exception as e:
-            logger.error(f"Error formatting team side with icon: {e}")
-            return team_side
+        
+        finally:
+            # Abbruch vor der Übergabe (Fehler bei Channel/DB) - Render-Job nicht verwaist weiterlaufen lassen
+            if wheel_files_task is not None and not wheel_files_task.done():
+                wheel_files_task.cancel()
 
     async def _create_match_channel_with_roles(self, guild: discord.Guild, team1_name: str, team2_name: str, team1_role: discord.Role, team2_role: discord.Role, week: int, prefix: str = "") -> discord.TextChannel:
         try:
@@ -351,31 +352,46 @@ class TeamSelectionView(discord.ui.View):
             logger.error(f"Error creating match channel: {e}")
             raise
 
-    async def _send_wheel_gifs_to_channel(self, channel: discord.TextChannel, match_id: int, map_wheel_data: dict, sides_wheel_data: dict):
+    async def _send_wheel_gifs_to_channel(self, channel: discord.TextChannel, match_id: int, map_wheel_data: dict, sides_wheel_data: dict, wheel_files_task=None):
         try:
             from wheel.match_wheel_service import MatchWheelService
             
-            try:
-                map_gif = await MatchWheelService.create_map_wheel_gif(map_wheel_data)
-                map_embed = MatchWheelService.create_map_selection_embed(map_wheel_data)
-                
-                await channel.send(embed=map_embed, file=map_gif)
-                logger.info(f"✅ Map wheel GIF sent for match {match_id}")
-                
-            except Exception as map_error:
-                logger.error(f"Error sending map wheel GIF: {map_error}")
-                await channel.send(f"🗺️ **Map Selected:** {map_wheel_data['selected']}")
+            if wheel_files_task is None:
+                map_gif, sides_gif = await MatchWheelService.create_wheel_files(map_wheel_data, sides_wheel_data, self.bot.config)
+            else:
+                map_gif, sides_gif = await wheel_files_task
+            
+            # Eine Message mit beiden Attachments + Embeds statt zwei sequentieller Uploads
+            embeds = []
+            files = []
+            fallback_lines = []
+            
+            if map_gif:
+                embeds.append(MatchWheelService.create_map_selection_embed(map_wheel_data, filename=map_gif.filename))
+                files.append(map_gif)
+            else:
+                fallback_lines.append(f"🗺️ **Map Selected:** {map_wheel_data['selected']}")
+            
+            if sides_gif:
+                embeds.append(MatchWheelService.create_sides_selection_embed(sides_wheel_data, filename=sides_gif.filename))
+                files.append(sides_gif)
+            else:
+                fallback_lines.append(f"🔴 **Team Sides:** {sides_wheel_data['team1_name']}: {sides_wheel_data['selected']}, {sides_wheel_data['team2_name']}: {sides_wheel_data['team2_side']}")
             
             try:
-                sides_gif = await MatchWheelService.create_sides_wheel_gif(sides_wheel_data)
-                sides_embed = MatchWheelService.create_sides_selection_embed(sides_wheel_data)
-                
-                await channel.send(embed=sides_embed, file=sides_gif)
-                logger.info(f"✅ Sides wheel GIF sent for match {match_id}")
+                await channel.send(
+                    content="\n".join(fallback_lines) or None,
+                    embeds=embeds,
+                    files=files
+                )
+                logger.info(f"✅ Wheel GIFs sent for match {match_id} ({len(files)} attachments)")
                 
-            except Exception as sides_error:
-                logger.error(f"Error sending sides wheel GIF: {sides_error}")
-                await channel.send(f"🔴 **Team Sides:** {sides_wheel_data['team1_name']}: {sides_wheel_data['selected']}, {sides_wheel_data['team2_name']}: {sides_wheel_data['team2_side']}")
+            except Exception as send_error:
+                logger.error(f"Error sending wheel GIFs: {send_error}")
+                await channel.send(
+                    f"🗺️ **Map Selected:** {map_wheel_data['selected']}\n"
+                    f"🔴 **Team Sides:** {sides_wheel_data['team1_name']}: {sides_wheel_data['selected']}, {sides_wheel_data['team2_name']}: {sides_wheel_data['team2_side']}"
+                )
             
         except Exception as e:
             logger.error(f"Error sending wheel GIFs: {e}")
@@ -36,6 +36,4 @@ class OrgaControlPanel(discord.ui.View):
         await interaction.response.edit_message(embed=embed, view=self)
     
     def _has_orga_role(self, user) -> bool:
-        if not self.bot.EVENT_ORGA_ROLE_ID:
-            return False
-        return any(role.id == self.bot.EVENT_ORGA_ROLE_ID for role in user.roles)
\ No newline at end of file
+        return self.bot.role_index.authorize(user, orga=True)
\ No newline at end of file
@@ -1,13 +1,19 @@
 # ui/streamer_management/__init__.py
+# Lazy Exports (PEP 562) - siehe ui/__init__.py
 
-from .streamer_match_view import StreamerMatchView
-from .team_side_selection_view import TeamSideSelectionView
-from .stream_url_modal import StreamURLModal
-from .streamer_match_manager import StreamerMatchManager
-
-__all__ = [
-    'StreamerMatchView',
-    'TeamSideSelectionView', 
-    'StreamURLModal',
-    'StreamerMatchManager'
-]
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'StreamerMatchView': '.streamer_match_view',
+    'TeamSideSelectionView': '.team_side_selection_view',
+    'StreamURLModal': '.stream_url_modal',
+    'StreamerMatchManager': '.streamer_match_manager'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -9,6 +9,7 @@ import json
 from typing import Dict
 from datetime import datetime
 from utils.timezone_helper import TimezoneHelper
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -71,15 +72,9 @@ class StreamURLModal(discord.ui.Modal):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
@@ -96,6 +91,7 @@ class StreamURLModal(discord.ui.Modal):
             logger.error(f"Error getting real team name for side: {e}")
             return fallback_team_name
     
+    @match_action('streamer_register', per_user=True)
     async def on_submit(self, interaction: discord.Interaction):
         
         try:
@@ -141,7 +137,7 @@ class StreamURLModal(discord.ui.Modal):
             team_side_name = self._get_real_team_side_name(self.team_side)
             
             # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             
             embed = discord.Embed(
@@ -169,7 +165,7 @@ class StreamURLModal(discord.ui.Modal):
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
             raw_match_time = self.match_data.get('match_time', 'TBA')
             if raw_match_time and raw_match_time != 'TBA':
-                formatted_time = TimezoneHelper.format_time_with_timezone(raw_match_time, self.bot)
+                formatted_time = self.bot.match_clock.render(self.match_id, raw_match_time, self.match_data.get('match_date'))
             else:
                 formatted_time = 'TBA'
             
@@ -259,14 +255,9 @@ class StreamURLModal(discord.ui.Modal):
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
@@ -282,12 +273,12 @@ class StreamURLModal(discord.ui.Modal):
             
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren für DM
             if current_match_time and current_match_time != 'TBA':
-                formatted_time = TimezoneHelper.format_time_with_timezone(current_match_time, self.bot)
+                formatted_time = self.bot.match_clock.render(self.match_id, current_match_time, current_match_date)
             else:
                 formatted_time = 'TBA'
             
             # TIMEZONE SUPPORT: Timezone-Info für DM
-            timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
+            timezone_warning = TimezoneHelper.get_local_time_note_text(self.bot)
             
             
             dm_embed = discord.Embed(
@@ -414,14 +405,7 @@ class StreamURLModal(discord.ui.Modal):
             else:
                 side_name = self.match_data.get('team2_side', 'TBA')
             
-            
-            team_icons = self.bot.config.get('team_icons', {})
-            icon = team_icons.get(side_name.upper(), '')
-            
-            if icon:
-                return f"{side_name} {icon}"
-            else:
-                return side_name
+            return self.bot.settings.side_label(side_name)
                 
         except Exception as e:
             logger.error(f"Error formatting team side with icon: {e}")
@@ -15,18 +15,6 @@ class StreamerMatchManager:
     def __init__(self, bot):
         self.bot = bot
     
-    def _get_streamer_display_name(self, streamer_id: int) -> str:
-        """Get server nickname or fallback to global name/username"""
-        # Versuche Member zu finden (hat Server-Nickname)
-        for guild in self.bot.guilds:
-            member = guild.get_member(streamer_id)
-            if member:
-                return member.nick or member.global_name or member.name
-        
-        # Fallback auf User
-        user = self.bot.get_user(streamer_id)
-        return user.global_name or user.name if user else f"User {streamer_id}"
-    
     async def disable_streamer_buttons_for_completed_match(self, match_id: int):
         """
         Disable streamer buttons when match is submitted to orga for final confirmation
@@ -116,6 +104,9 @@ class StreamerMatchManager:
     async def update_all_match_posts_including_private(self, match_id: int):
         
         try:
+            # Fehlende Streamer-Member einmalig holen (Lazy Member Cache), damit alle Embeds Nicknames zeigen
+            streamers = self.bot.db.get_match_streamers_detailed(match_id)
+            await self.bot.display_names.prefetch(streamer['streamer_id'] for streamer in streamers)
             
             await self._update_first_private_match_embed_with_buttons(match_id)
             
@@ -232,7 +223,7 @@ class StreamerMatchManager:
                 steam_id64 = streamer_data.get('steam_id64', '')
                 
                 
-                username = self._get_streamer_display_name(streamer_data['streamer_id'])
+                username = self.bot.display_names.resolve(streamer_data['streamer_id'])
                 
                 
                 if streamer_data['team_side'] == 'team1':
@@ -435,15 +426,9 @@ class StreamerMatchManager:
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
@@ -480,7 +465,7 @@ class StreamerMatchManager:
                 stream_url = streamer_data.get('stream_url', '')
                 
                 
-                username = self._get_streamer_display_name(streamer_data['streamer_id'])
+                username = self.bot.display_names.resolve(streamer_data['streamer_id'])
                 
                 
                 if streamer_data['team_side'] == 'team1':
@@ -7,6 +7,7 @@ import discord
 import logging
 from typing import Optional, Dict, List, Any
 from datetime import datetime
+from utils.match_locks import match_action
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +90,7 @@ class StreamerMatchView(discord.ui.View):
         
         try:
             
-            if not any(role.id == self.bot.STREAMER_ROLE_ID for role in interaction.user.roles):
+            if not self.bot.role_index.authorize(interaction.user, streamer=True):
                 await self._safe_response(interaction, "❌ You need the Streamer role!", ephemeral=True)
                 return
             
@@ -127,6 +128,7 @@ class StreamerMatchView(discord.ui.View):
     
     @discord.ui.button(label='Unregister as Streamer', style=discord.ButtonStyle.danger, 
                       emoji='🚫', custom_id='unregister_streamer')
+    @match_action('streamer_unregister', per_user=True)
     async def unregister_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         
         try:
@@ -1,19 +1,35 @@
 # utils/__init__.py
+# Exports werden erst beim ersten Zugriff importiert (PEP 562), damit leichte Module
+# wie der StartupProfiler geladen werden können, ohne discord & Co. mitzuziehen.
 
-from .lazy_persistence_service import LazyPersistenceService
-from .team_config_loader import TeamConfigLoader
-from .embed_builder import EmbedBuilder
-from .fast_startup_persistence import FastStartupPersistence
-from .public_embed_updater import PublicEmbedUpdater
-from .public_channel_status_manager import PublicChannelStatusManager
-from .timezone_helper import TimezoneHelper
+import importlib
 
-__all__ = [
-    'LazyPersistenceService',
-    'TeamConfigLoader', 
-    'EmbedBuilder',
-    'FastStartupPersistence',
-    'PublicEmbedUpdater',
-    'PublicChannelStatusManager',
-    'TimezoneHelper'
-]
\ No newline at end of file
+_EXPORTS = {
+    'LazyPersistenceService': '.lazy_persistence_service',
+    'TeamConfigLoader': '.team_config_loader',
+    'TeamRegistry': '.team_config_loader',
+    'EmbedBuilder': '.embed_builder',
+    'FastStartupPersistence': '.fast_startup_persistence',
+    'PublicEmbedUpdater': '.public_embed_updater',
+    'PublicChannelStatusManager': '.public_channel_status_manager',
+    'TimezoneHelper': '.timezone_helper',
+    'StartupProfiler': '.startup_profiler',
+    'MemberCache': '.member_cache',
+    'RoleIndex': '.role_index',
+    'DisplayNameResolver': '.display_name_resolver',
+    'ConfigReloader': '.config_reloader',
+    'BotSettings': '.bot_settings',
+    'JobScheduler': '.scheduler',
+    'MatchJobs': '.match_jobs',
+    'MatchLocks': '.match_locks',
+    'Outbox': '.outbox',
+    'MatchEffects': '.match_effects'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
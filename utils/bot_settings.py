@@ -0,0 +1,88 @@
+"""
+Bot Settings - vorkompilierte, unveränderliche Werte aus config.json für Embeds
+Speichere als: utils/bot_settings.py
+
+Wird einmal beim Laden der Config gebaut (und beim Hot Reload in config_reloader.py neu
+erstellt und als Ganzes ausgetauscht). Embed-Builder lesen nur noch Attribute statt bei jedem
+Render hasattr(bot, 'config') + verschachtelte dict.get() Aufrufe auszuführen.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+TBA_VALUES = ('', 'TBA', '*TBA*')
+
+
+@dataclass(frozen=True)
+class BotSettings:
+    timezone: str = 'UTC'
+    timezone_display: str = 'UTC'
+    timezone_info: str = 'All times are in UTC'
+    # IANA Zone für die Umrechnung der Match-Zeiten in UTC (utils/match_time.py)
+    zone_name: str = 'UTC'
+    rules_url: str = '#'
+    # Team-Seite (upper) -> Icon
+    team_icons: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    # Vorberechnet aus den Werten oben
+    timezone_warning: str = ''
+    # Hinweis neben Discord Timestamps (<t:epoch:F>) - Discord zeigt sie in der Zone des Betrachters
+    local_time_note: str = ''
+    time_input_label: str = ''
+    time_input_placeholder: str = ''
+    # Team-Seite (upper) -> "US <:icon:...>"
+    team_side_labels: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> 'BotSettings':
+        config = config or {}
+        server_config = config.get('server') or {}
+        timezone = server_config.get('timezone', 'UTC')
+        timezone_display = server_config.get('timezone_display', 'UTC')
+        timezone_info = server_config.get('timezone_info', 'All times are in UTC')
+
+        team_icons = {str(side).upper(): icon for side, icon in (config.get('team_icons') or {}).items() if icon}
+
+        return cls(
+            timezone=timezone,
+            timezone_display=timezone_display,
+            timezone_info=timezone_info,
+            zone_name=server_config.get('iana_timezone') or timezone,
+            rules_url=(config.get('rules') or {}).get('onm_url', '#'),
+            team_icons=MappingProxyType(team_icons),
+            timezone_warning=f"⏰ **{timezone_info}**",
+            local_time_note=f"⏰ **Times are shown in your own timezone** (entered in {timezone_display})",
+            time_input_label=f"Match Time ({timezone_display})",
+            time_input_placeholder=f"20:30 ({timezone})",
+            team_side_labels=MappingProxyType({side: f"{side} {icon}" for side, icon in team_icons.items()})
+        )
+
+    @staticmethod
+    def of(bot=None) -> 'BotSettings':
+        """Settings des Bots - ohne Bot (oder vor dem Laden) die Defaults"""
+        return getattr(bot, 'settings', None) or DEFAULT_SETTINGS
+
+    def side_label(self, team_side: Optional[str]) -> str:
+        """Team-Seite mit Icon ("US <:icon:...>"), 'TBA' wenn keine Seite gesetzt ist"""
+        if not team_side or team_side == 'TBA':
+            return 'TBA'
+        label = self.team_side_labels.get(team_side)
+        if label is not None:
+            return label
+        # Seite in anderer Schreibweise als in team_icons
+        icon = self.team_icons.get(team_side.upper())
+        return f"{team_side} {icon}" if icon else team_side
+
+    def format_time(self, time_str: Optional[str]) -> str:
+        """"20:30" -> "20:30 CET", leere Zeiten -> "TBA" """
+        if not time_str or time_str in TBA_VALUES:
+            return 'TBA'
+        return f"{time_str} {self.timezone}"
+
+    def format_time_full(self, time_str: Optional[str]) -> str:
+        if not time_str or time_str in TBA_VALUES:
+            return 'TBA'
+        return f"{time_str} {self.timezone_display}"
+
+
+DEFAULT_SETTINGS = BotSettings.from_config({})
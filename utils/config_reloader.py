@@ -0,0 +1,335 @@
+"""
+Config Reloader - Hot Reload von config.json und map_config.json ohne Neustart
+Speichere als: utils/config_reloader.py
+
+Ablauf eines Reloads (!reload_config oder File Watcher):
+  1. Datei lesen, parsen und validieren - bei Fehlern bleibt der laufende Stand aktiv
+  2. Abgeleitete Strukturen im Thread bauen, die nur von den Dateien abhängen
+     (Team Registry, getrackte Rollen, Bot Settings, Map Catalog) - kein Zugriff auf discord.py State
+  3. Alles in einem Schritt ohne await dazwischen austauschen - kein Handler sieht einen Mischstand;
+     der Role Index (Guild-/Member-Cache) wird dabei auf dem Event Loop neu aufgebaut
+  4. Diff melden (geänderte Keys, Teams +/-, Maps +/-); DB-Abgleich der Teams nur bei Team-Änderungen
+Kein Restore-Replay, keine neuen Views - laufende Views lesen beim nächsten Zugriff die neuen Werte.
+
+Live wirksam: member_cache.max_entries / name_ttl_seconds / prefetch_timeout_seconds, outbox.* und
+scheduler.* (neue Jobs lesen die Werte beim Planen, der Periodic Cleanup wird neu geplant; bereits
+geplante Offer-/Reminder-/Archiv-Jobs behalten ihren Zeitpunkt). Siehe RESTART_REQUIRED_PREFIXES.
+
+config.json:
+    "config_reload": {"watch": true, "interval_seconds": 5}
+"""
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.bot_settings import BotSettings
+from utils.team_config_loader import TeamRegistry
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = 'config.json'
+DEFAULT_INTERVAL_SECONDS = 5
+REQUIRED_SECTIONS = ('bot', 'roles', 'categories', 'tournament')
+# Diese Keys werden erst nach einem Neustart wirksam (Gateway-Optionen, laufende Worker-Prozesse)
+RESTART_REQUIRED_PREFIXES = ('member_cache.policy', 'wheel_render.workers')
+# Nur Änderungen unter diesen Keys können die getrackten Rollen verändern
+ROLE_KEYS = ('roles', 'additional_match_role_ids', 'teams')
+CLEANUP_INTERVAL_KEY = 'scheduler.cleanup_interval_minutes'
+
+
+class ConfigValidationError(ValueError):
+    pass
+
+
+@dataclass
+class PreparedReload:
+    """Vollständig vorbereiteter neuer Stand - wird nur noch eingesetzt"""
+    config: Optional[Dict[str, Any]] = None
+    settings: Optional[BotSettings] = None
+    team_registry: Optional[TeamRegistry] = None
+    tracked_role_ids: Optional[frozenset] = None
+    reschedule_cleanup: bool = False
+    map_catalog: Any = None
+    diff: Dict[str, Any] = field(default_factory=dict)
+
+
+def flatten(data: Any, prefix: str = '') -> Dict[str, Any]:
+    """{'a': {'b': 1}} -> {'a.b': 1} - Listen bleiben Werte"""
+    if not isinstance(data, dict):
+        return {prefix: data}
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def touches(keys: List[str], roots: Tuple[str, ...]) -> bool:
+    """True wenn einer der (flachen) Keys einer der Wurzeln entspricht oder darunter liegt"""
+    return any(key == root or key.startswith(f"{root}.") for key in keys for root in roots)
+
+
+def diff_configs(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    old_flat = flatten(old)
+    new_flat = flatten(new)
+    return {
+        'added': sorted(key for key in new_flat if key not in old_flat),
+        'removed': sorted(key for key in old_flat if key not in new_flat),
+        'changed': sorted(key for key in new_flat if key in old_flat and old_flat[key] != new_flat[key])
+    }
+
+
+def validate_config(config: Any) -> List[str]:
+    """Liste der Fehler (leer = gültig)"""
+    if not isinstance(config, dict):
+        return ["config.json must contain a JSON object"]
+
+    errors = []
+    for section in REQUIRED_SECTIONS:
+        if not isinstance(config.get(section), dict):
+            errors.append(f"missing section '{section}'")
+    if isinstance(config.get('bot'), dict) and not config['bot'].get('prefix'):
+        errors.append("bot.prefix is empty")
+
+    week = config.get('tournament', {}).get('current_week', 1) if isinstance(config.get('tournament'), dict) else 1
+    if not isinstance(week, int) or week < 1:
+        errors.append(f"tournament.current_week must be a positive integer, got {week!r}")
+
+    teams = config.get('teams', {})
+    if not isinstance(teams, dict):
+        errors.append("'teams' must be an object")
+    else:
+        role_ids = {}
+        for team_key, team_data in teams.items():
+            if not isinstance(team_data, dict) or not team_data.get('role_id'):
+                errors.append(f"team '{team_key}' has no role_id")
+                continue
+            role_id = team_data['role_id']
+            if role_id in role_ids:
+                errors.append(f"teams '{role_ids[role_id]}' and '{team_key}' share role_id {role_id}")
+            role_ids[role_id] = team_key
+
+    return errors
+
+
+class ConfigReloader:
+
+    def __init__(self, bot, path: str = CONFIG_PATH):
+        self.bot = bot
+        self.path = path
+        self._lock = asyncio.Lock()
+        self._watch_task = None
+        self._signatures = {}
+        self.last_result = None
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        reload_config = config.get('config_reload', {}) if config else {}
+        return {
+            'watch': bool(reload_config.get('watch', False)),
+            'interval_seconds': float(reload_config.get('interval_seconds', DEFAULT_INTERVAL_SECONDS))
+        }
+
+    def _read_config(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            raise ConfigValidationError(f"{self.path} not found")
+        except json.JSONDecodeError as e:
+            raise ConfigValidationError(f"{self.path} is not valid JSON: {e}")
+
+        errors = validate_config(config)
+        if errors:
+            raise ConfigValidationError("; ".join(errors))
+        return config
+
+    def prepare(self) -> PreparedReload:
+        """
+        Läuft im Thread: liest, validiert und baut alle abgeleiteten Strukturen
+        """
+        from wheel.config_loader import MapCatalog, WheelConfigLoader
+
+        prepared = PreparedReload()
+        old_config = self.bot.config
+        new_config = self._read_config()
+
+        config_diff = diff_configs(old_config, new_config)
+        if any(config_diff.values()):
+            prepared.config = new_config
+            prepared.diff['config'] = config_diff
+            prepared.settings = BotSettings.from_config(new_config)
+
+            old_registry = self.bot.team_registry
+            registry = TeamRegistry.from_config(new_config.get('teams', {})).carry_db_ids(old_registry)
+            old_teams = {team.role_id: team for team in old_registry.teams}
+            new_teams = {team.role_id: team for team in registry.teams}
+            if old_teams != new_teams or [t.config_id for t in old_registry.teams] != [t.config_id for t in registry.teams]:
+                prepared.team_registry = registry
+                prepared.diff['teams'] = {
+                    'added': [team.display_name for role_id, team in new_teams.items() if role_id not in old_teams],
+                    'removed': [team.display_name for role_id, team in old_teams.items() if role_id not in new_teams],
+                    'changed': [
+                        team.display_name for role_id, team in new_teams.items()
+                        if role_id in old_teams and old_teams[role_id][1:] != team[1:]
+                    ]
+                }
+
+            changed_keys = config_diff['changed'] + config_diff['added'] + config_diff['removed']
+
+            # Getrackte Rollen + Role Index nur neu aufbauen, wenn sich Rollen-Keys tatsächlich auswirken
+            if touches(changed_keys, ROLE_KEYS):
+                tracked_role_ids = frozenset(self.bot.member_cache.tracked_role_ids(new_config))
+                if tracked_role_ids != frozenset(self.bot.member_cache.tracked_role_ids(old_config)):
+                    prepared.tracked_role_ids = tracked_role_ids
+
+            prepared.reschedule_cleanup = CLEANUP_INTERVAL_KEY in changed_keys
+
+            restart_keys = [key for key in changed_keys if key.startswith(RESTART_REQUIRED_PREFIXES)]
+            if restart_keys:
+                prepared.diff['restart_required'] = restart_keys
+
+        # map_config.json: neuer Catalog wird komplett im Thread geladen, gewechselt wird per Referenz
+        current_catalog = WheelConfigLoader.current_catalog()
+        if not current_catalog.loaded:
+            current_catalog = WheelConfigLoader.catalog()
+        catalog = MapCatalog(current_catalog.path)
+        catalog.refresh()
+        if catalog.version != current_catalog.version or catalog.maps != current_catalog.maps:
+            prepared.map_catalog = catalog
+            prepared.diff['maps'] = {
+                'version': f"{current_catalog.version} -> {catalog.version}",
+                'added': [name for name in catalog.maps if name not in current_catalog.maps],
+                'removed': [name for name in current_catalog.maps if name not in catalog.maps]
+            }
+
+        return prepared
+
+    def apply(self, prepared: PreparedReload):
+        """
+        Synchroner Austausch auf dem Event Loop - kein await, daher atomar für alle Handler
+        """
+        from wheel.config_loader import WheelConfigLoader
+
+        bot = self.bot
+        if prepared.config is not None:
+            bot.config = prepared.config
+            bot._apply_config_attributes(prepared.config)
+            bot.command_prefix = prepared.config['bot']['prefix']
+            bot.member_cache.apply_settings(prepared.config)
+            bot.display_names.apply_settings(prepared.config)
+        if prepared.settings is not None:
+            bot.settings = prepared.settings
+        if prepared.team_registry is not None:
+            bot.team_loader.swap(prepared.team_registry)
+        if prepared.tracked_role_ids is not None:
+            bot.member_cache.refresh_tracked_roles(set(prepared.tracked_role_ids))
+            # Auf dem Event Loop: liest bot.guilds / role.members, die nur der Loop verändert
+            bot.role_index.refresh_tracked_roles(prepared.tracked_role_ids)
+        if prepared.reschedule_cleanup:
+            bot.match_jobs.reschedule_cleanup()
+        if prepared.map_catalog is not None:
+            WheelConfigLoader.replace_catalog(prepared.map_catalog)
+
+    async def reload(self, source: str = 'command') -> Dict[str, Any]:
+        """
+        Rückgabe: {'ok': bool, 'diff': {...}, 'error': str}
+        """
+        async with self._lock:
+            try:
+                prepared = await asyncio.to_thread(self.prepare)
+            except ConfigValidationError as e:
+                logger.error(f"❌ Config reload rejected ({source}): {e} - keeping current config")
+                self.last_result = {'ok': False, 'error': str(e), 'diff': {}}
+                return self.last_result
+            except Exception as e:
+                logger.error(f"Error preparing config reload: {e}")
+                self.last_result = {'ok': False, 'error': str(e), 'diff': {}}
+                return self.last_result
+
+            self.apply(prepared)
+            self._remember_signatures()
+
+            if prepared.team_registry is not None:
+                # Neue/umbenannte Teams in der DB abgleichen (eine Transaktion)
+                self.bot.sync_config_teams_to_database()
+
+            self.last_result = {'ok': True, 'diff': prepared.diff, 'error': None}
+            if prepared.diff:
+                for line in ConfigReloader.format_diff(prepared.diff):
+                    logger.info(f"🔁 Config reload ({source}): {line}")
+            else:
+                logger.info(f"🔁 Config reload ({source}): no changes")
+            return self.last_result
+
+    @staticmethod
+    def format_diff(diff: Dict[str, Any]) -> List[str]:
+        lines = []
+        config_diff = diff.get('config', {})
+        for kind, symbol in (('added', '+'), ('removed', '-'), ('changed', '~')):
+            keys = config_diff.get(kind, [])
+            if keys:
+                lines.append(f"{symbol} {', '.join(keys[:15])}" + (f" (+{len(keys) - 15} more)" if len(keys) > 15 else ''))
+
+        teams = diff.get('teams')
+        if teams:
+            lines.append(f"teams: +{teams['added'] or '[]'} -{teams['removed'] or '[]'} ~{teams['changed'] or '[]'}")
+
+        maps = diff.get('maps')
+        if maps:
+            lines.append(f"maps {maps['version']}: +{maps['added'] or '[]'} -{maps['removed'] or '[]'}")
+
+        if diff.get('restart_required'):
+            lines.append(f"⚠️ restart required for: {', '.join(diff['restart_required'])}")
+        return lines
+
+    def _file_signatures(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        from wheel.config_loader import MAP_CONFIG_PATH
+
+        signatures = {}
+        for path in (self.path, MAP_CONFIG_PATH):
+            try:
+                stat = os.stat(path)
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                signatures[path] = None
+        return signatures
+
+    def _remember_signatures(self):
+        self._signatures = self._file_signatures()
+
+    def start_watching(self) -> Optional[asyncio.Task]:
+        settings = ConfigReloader.settings(self.bot.config)
+        if not settings['watch']:
+            return None
+        if self._watch_task and not self._watch_task.done():
+            return self._watch_task
+
+        self._remember_signatures()
+        self._watch_task = asyncio.create_task(self._watch(settings['interval_seconds']))
+        logger.info(f"👀 Watching config.json + map_config.json for changes (every {settings['interval_seconds']}s)")
+        return self._watch_task
+
+    async def _watch(self, interval: float):
+        while not self.bot.is_closed():
+            try:
+                await asyncio.sleep(interval)
+                signatures = self._file_signatures()
+                if signatures != self._signatures:
+                    # Editor schreibt evtl. noch - einmal kurz warten, dann laden
+                    await asyncio.sleep(min(1.0, interval))
+                    self._signatures = self._file_signatures()
+                    await self.reload(source='file watcher')
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in config file watcher: {e}")
+                await asyncio.sleep(interval)
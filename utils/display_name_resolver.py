@@ -0,0 +1,175 @@
+"""
+Display Name Resolver - ein Service für alle Streamer-/User-Namen in Embeds
+Speichere als: utils/display_name_resolver.py
+
+Dünne Batching-Schicht über dem Member Cache (utils/member_cache.py), der die Namen samt TTL und
+Invalidierung hält:
+- resolve() ist synchron und blockiert nie: Member Cache / discord.py Caches -> Platzhalter "User {id}".
+  Bei einem Platzhalter wird der User im Hintergrund nachgeholt (gesammelt in einem einzigen
+  query_members Burst), der nächste Render zeigt den Namen.
+- prefetch() holt vor dem Rendern mehrerer Streamer alle fehlenden Member in einem Burst,
+  wartet darauf aber höchstens prefetch_timeout_seconds.
+
+config.json (Abschnitt member_cache):
+    "prefetch_timeout_seconds": 1.5
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_PREFETCH_TIMEOUT_SECONDS = 1.5
+# Nicht auffindbare User nicht bei jedem Render erneut anfragen
+MISS_RETRY_SECONDS = 60
+FETCH_DEBOUNCE_SECONDS = 0.05
+
+
+class DisplayNameResolver:
+
+    def __init__(self, bot):
+        self.bot = bot
+        settings = DisplayNameResolver.settings(bot.config)
+        self.max_misses = settings['max_entries']
+        self.prefetch_timeout = settings['prefetch_timeout_seconds']
+        # user_id -> retry_after (User nicht gefunden, LRU begrenzt auf max_entries)
+        self._misses = OrderedDict()
+        self._pending = set()
+        self._fetch_task = None
+        self.stats = {'placeholders': 0, 'bursts': 0, 'prefetch_timeouts': 0}
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        member_cache_config = config.get('member_cache', {}) if config else {}
+        return {
+            'max_entries': int(member_cache_config.get('max_entries', DEFAULT_MAX_ENTRIES)),
+            'prefetch_timeout_seconds': float(member_cache_config.get('prefetch_timeout_seconds', DEFAULT_PREFETCH_TIMEOUT_SECONDS))
+        }
+
+    def apply_settings(self, config: Dict[str, Any]):
+        """Config Reload: Limits / Timeout sofort übernehmen"""
+        settings = DisplayNameResolver.settings(config)
+        self.max_misses = settings['max_entries']
+        self.prefetch_timeout = settings['prefetch_timeout_seconds']
+        while len(self._misses) > self.max_misses:
+            self._misses.popitem(last=False)
+
+    @staticmethod
+    def placeholder(user_id: int) -> str:
+        return f"User {user_id}"
+
+    def _retry_blocked(self, user_id: int, now: float) -> bool:
+        retry_after = self._misses.get(user_id)
+        if retry_after is None:
+            return False
+        if retry_after <= now:
+            del self._misses[user_id]
+            return False
+        return True
+
+    def _remember_misses(self, user_ids: Iterable[int]):
+        retry_after = time.monotonic() + MISS_RETRY_SECONDS
+        for user_id in user_ids:
+            self._misses[user_id] = retry_after
+            self._misses.move_to_end(user_id)
+        while len(self._misses) > self.max_misses:
+            self._misses.popitem(last=False)
+
+    def resolve(self, user_id: int) -> str:
+        """
+        Server-Nickname > Global Display Name > Username - oder Platzhalter (nie blockierend)
+        """
+        try:
+            name = self.bot.member_cache.get_display_name(user_id)
+            if name is not None:
+                return name
+
+            self.stats['placeholders'] += 1
+            self._queue_fetch(user_id)
+            return DisplayNameResolver.placeholder(user_id)
+
+        except Exception as e:
+            logger.error(f"Error resolving display name for {user_id}: {e}")
+            return DisplayNameResolver.placeholder(user_id)
+
+    def resolve_many(self, user_ids: Iterable[int]) -> Dict[int, str]:
+        return {user_id: self.resolve(user_id) for user_id in dict.fromkeys(user_ids)}
+
+    def _missing(self, user_ids: Iterable[int]) -> list:
+        now = time.monotonic()
+        return [
+            user_id for user_id in dict.fromkeys(user_ids)
+            if user_id and self.bot.member_cache.get_display_name(user_id) is None
+            and not self._retry_blocked(user_id, now)
+        ]
+
+    async def _fetch(self, user_ids: list) -> int:
+        """Ein query_members Burst für alle übergebenen IDs; nicht gefundene werden gemerkt"""
+        self.stats['bursts'] += 1
+        fetched = await self.bot.member_cache.fetch_members(user_ids)
+        self._remember_misses(
+            user_id for user_id in user_ids if self.bot.member_cache.get_display_name(user_id) is None
+        )
+        return fetched
+
+    async def prefetch(self, user_ids: Iterable[int], timeout: Optional[float] = None) -> int:
+        """
+        Vor dem Rendern vieler Namen: fehlende Member in einem Burst holen.
+        Nach `timeout` wird ohne sie gerendert, der Burst läuft im Hintergrund weiter.
+        """
+        missing = self._missing(user_ids)
+        if not missing:
+            return 0
+
+        fetch = asyncio.ensure_future(self._fetch(missing))
+        try:
+            return await asyncio.wait_for(asyncio.shield(fetch), timeout if timeout is not None else self.prefetch_timeout)
+        except asyncio.TimeoutError:
+            self.stats['prefetch_timeouts'] += 1
+            logger.warning(f"👥 Member prefetch for {len(missing)} users still running after {self.prefetch_timeout}s - rendering with placeholders")
+            return 0
+        except Exception as e:
+            logger.error(f"Error prefetching display names: {e}")
+            return 0
+
+    def _queue_fetch(self, user_id: int):
+        if self._retry_blocked(user_id, time.monotonic()):
+            return
+        self._pending.add(user_id)
+        if self._fetch_task and not self._fetch_task.done():
+            return
+        try:
+            self._fetch_task = asyncio.get_running_loop().create_task(self._fetch_pending())
+        except RuntimeError:
+            # Kein laufender Event Loop - beim nächsten resolve() erneut versuchen
+            self._fetch_task = None
+
+    async def _fetch_pending(self):
+        try:
+            # Kurz sammeln, damit ein Embed mit mehreren Streamern nur einen Burst auslöst
+            await asyncio.sleep(FETCH_DEBOUNCE_SECONDS)
+            while self._pending:
+                batch = list(self._pending)
+                self._pending.clear()
+                await self._fetch(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching missing members: {e}")
+
+    def invalidate(self, user_id: int):
+        """User hat sich geändert -> Namen neu auflösen, auch wenn er zuletzt nicht gefunden wurde"""
+        self.bot.member_cache.forget(user_id)
+        self._misses.pop(user_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'misses_remembered': len(self._misses),
+            'max_misses': self.max_misses,
+            'pending': len(self._pending),
+            **self.stats
+        }
@@ -4,42 +4,25 @@ Config Helper
 
 import logging
 
+from utils.bot_settings import BotSettings
+
 logger = logging.getLogger(__name__)
 
 class ConfigHelper:
     
     @staticmethod
     def get_rules_url(bot=None) -> str:
-        try:
-            if bot and hasattr(bot, 'config') and bot.config:
-                return bot.config.get('rules', {}).get('onm_url', '#')
-            return '#'
-        except Exception as e:
-            logger.warning(f"Fehler beim Laden der Rules URL: {e}")
-            return '#'
+        return BotSettings.of(bot).rules_url
     
     @staticmethod
     def get_team_icon(team_side: str, bot=None) -> str:
-        try:
-            if bot and hasattr(bot, 'config') and bot.config:
-                team_icons = bot.config.get('team_icons', {})
-                icon = team_icons.get(team_side.upper(), '')
-                if icon:
-                    logger.debug(f"Team Icon für {team_side}: {icon}")
-                    return icon
-            
-            logger.debug(f"Kein Icon für Team {team_side} gefunden")
-            return ''
-        except Exception as e:
-            logger.warning(f"Fehler beim Laden des Team Icons für {team_side}: {e}")
+        if not team_side:
             return ''
+        return BotSettings.of(bot).team_icons.get(team_side.upper(), '')
             
     @staticmethod
     def format_team_side_with_icon(team_side: str, bot=None) -> str:
-        icon = ConfigHelper.get_team_icon(team_side, bot)
-        if icon:
-            return f"{team_side} {icon}"
-        return team_side
+        return BotSettings.of(bot).side_label(team_side)
     
     @staticmethod
     def format_date_to_display(date_str: str) -> str:
@@ -7,7 +7,8 @@ import json
 import logging
 from typing import Tuple
 from .config_helper import ConfigHelper
-from utils.timezone_helper import TimezoneHelper
+from utils.bot_settings import BotSettings
+from utils.match_time import MatchClock
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +20,15 @@ class MatchEmbeds:
                                  match_date: str, map_name: str, team1_side: str, 
                                  team2_side: str, team1_role, team2_role, week: int, bot=None) -> discord.Embed:
         
+        settings = BotSettings.of(bot)
+        
         formatted_date = ConfigHelper.format_date_to_display(match_date)
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(team1_side, bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(team2_side, bot)
+        team1_side_with_icon = settings.side_label(team1_side)
+        team2_side_with_icon = settings.side_label(team2_side)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         embed = discord.Embed(
             title=f"🏆 Week {week}: {team1_name} vs {team2_name}",
@@ -40,7 +43,7 @@ class MatchEmbeds:
             inline=False
         )
         embed.add_field(name="👥 Teams", value=f"{team1_role.mention} vs {team2_role.mention}", inline=False)
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -57,13 +60,14 @@ class MatchEmbeds:
         """
         TIMEZONE SUPPORT: Tournament Phase entfernt, Timezone-Info hinzugefügt
         """
+        settings = BotSettings.of(bot)
         formatted_date = ConfigHelper.format_date_to_display(match_date)
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(team1_side, bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(team2_side, bot)
+        team1_side_with_icon = settings.side_label(team1_side)
+        team2_side_with_icon = settings.side_label(team2_side)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         embed = discord.Embed(
             title=f"🏆 Week {week}: {team1_name} vs {team2_name}",
@@ -77,7 +81,7 @@ class MatchEmbeds:
             value=f"{team1_name}: {team1_side_with_icon}\n{team2_name}: {team2_side_with_icon}", 
             inline=False
         )
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -100,23 +104,25 @@ class MatchEmbeds:
     @staticmethod
     def create_updated_private_match_embed(match_data: Tuple, bot=None) -> discord.Embed:
         
+        settings = BotSettings.of(bot)
+        
         formatted_date = ConfigHelper.format_date_to_display(match_data[3])
         team1_name, team2_name = ConfigHelper.safe_get_team_names(match_data)
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data[6], bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data[7], bot)
+        team1_side_with_icon = settings.side_label(match_data[6])
+        team2_side_with_icon = settings.side_label(match_data[7])
         
         week = match_data[13] if len(match_data) > 13 else "N/A"
         
         # TIMEZONE SUPPORT: Match time mit Timezone formatieren
         raw_match_time = match_data[4] if len(match_data) > 4 else None
         if raw_match_time and raw_match_time != "*TBA*":
-            formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, bot)
+            formatted_match_time = MatchClock.format(bot, match_data[0], raw_match_time, match_data[3])
         else:
             formatted_match_time = "*TBA*"
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         embed = discord.Embed(
             title=f"🏆 Week {week}: {team1_name} vs {team2_name}",
@@ -130,7 +136,7 @@ class MatchEmbeds:
             value=f"{team1_name}: {team1_side_with_icon}\n{team2_name}: {team2_side_with_icon}", 
             inline=False
         )
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -152,23 +158,24 @@ class MatchEmbeds:
         """
         TIMEZONE SUPPORT: Tournament Phase entfernt, Timezone-Support hinzugefügt
         """
+        settings = BotSettings.of(bot)
         formatted_date = ConfigHelper.format_date_to_display(match_data[3])
         team1_name, team2_name = ConfigHelper.safe_get_team_names(match_data)
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data[6], bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data[7], bot)
+        team1_side_with_icon = settings.side_label(match_data[6])
+        team2_side_with_icon = settings.side_label(match_data[7])
         
         week = match_data[13] if len(match_data) > 13 else "N/A"
         
         # TIMEZONE SUPPORT: Match time mit Timezone formatieren
         raw_match_time = match_data[4] if len(match_data) > 4 else None
         if raw_match_time and raw_match_time != "*TBA*":
-            formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, bot)
+            formatted_match_time = MatchClock.format(bot, match_data[0], raw_match_time, match_data[3])
         else:
             formatted_match_time = "*TBA*"
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         embed = discord.Embed(
             title=f"🏆 Week {week}: {team1_name} vs {team2_name}",
@@ -182,7 +189,7 @@ class MatchEmbeds:
             value=f"{team1_name}: {team1_side_with_icon}\n{team2_name}: {team2_side_with_icon}", 
             inline=False
         )
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
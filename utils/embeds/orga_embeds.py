@@ -23,8 +23,8 @@ class OrgaEmbeds:
             color=discord.Color.gold()
         )
         
-        teams = bot.get_all_teams()
-        active_teams = len([t for t in teams if t[4]])
+        teams = bot.team_registry
+        active_teams = len(teams.active_teams)
         
         matches_current_week = bot.db.get_matches_by_week(bot.CURRENT_WEEK)
         completed_matches = len([m for m in matches_current_week if m[10] == 'confirmed'])
@@ -6,42 +6,32 @@ import discord
 import logging
 from typing import List
 from .config_helper import ConfigHelper
-from utils.timezone_helper import TimezoneHelper
+from utils.bot_settings import BotSettings
+from utils.match_time import MatchClock
 
 logger = logging.getLogger(__name__)
 
 class StreamerEmbeds:
     
-    @staticmethod
-    def _get_streamer_display_name(bot, streamer_id: int) -> str:
-        """Get server nickname or fallback to global name/username"""
-        # Versuche Member zu finden (hat Server-Nickname)
-        for guild in bot.guilds:
-            member = guild.get_member(streamer_id)
-            if member:
-                return member.nick or member.global_name or member.name
-        
-        # Fallback auf User
-        user = bot.get_user(streamer_id)
-        return user.global_name or user.name if user else f"User {streamer_id}"
-    
     @staticmethod
     def create_streamer_match_embed(match_data: dict, streamers: List[dict] = None, bot=None) -> discord.Embed:
         
+        settings = BotSettings.of(bot)
+        
         formatted_date = ConfigHelper.format_date_to_display(match_data.get('match_date', 'TBA'))
         
         # TIMEZONE SUPPORT: Match time mit Timezone formatieren
         raw_match_time = match_data.get('match_time', 'TBA')
         if raw_match_time and raw_match_time != 'TBA':
-            formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, bot)
+            formatted_match_time = MatchClock.format(bot, match_data.get('match_id'), raw_match_time, match_data.get('match_date'))
         else:
             formatted_match_time = 'TBA'
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team1_side'], bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team2_side'], bot)
+        team1_side_with_icon = settings.side_label(match_data['team1_side'])
+        team2_side_with_icon = settings.side_label(match_data['team2_side'])
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         week = match_data.get('week', 'N/A')
         title = f"📺 Week {week} - Streamer wanted!"
@@ -65,7 +55,7 @@ class StreamerEmbeds:
         )
         
         
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -77,7 +67,7 @@ class StreamerEmbeds:
             
             
             if bot:
-                username = StreamerEmbeds._get_streamer_display_name(bot, streamer_data['streamer_id'])
+                username = bot.display_names.resolve(streamer_data['streamer_id'])
             else:
                 username = f"User {streamer_data['streamer_id']}"
             
@@ -116,20 +106,22 @@ class StreamerEmbeds:
     @staticmethod
     def create_public_embed_with_streamers(match_data: dict, streamers: List[dict], bot=None) -> discord.Embed:
         
+        settings = BotSettings.of(bot)
+        
         formatted_date = ConfigHelper.format_date_to_display(match_data.get('match_date', 'TBA'))
         
         # TIMEZONE SUPPORT: Match time mit Timezone formatieren
         raw_match_time = match_data.get('match_time')
         if raw_match_time and raw_match_time != 'TBA':
-            formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, bot)
+            formatted_match_time = MatchClock.format(bot, match_data.get('match_id'), raw_match_time, match_data.get('match_date'))
         else:
             formatted_match_time = "*TBA*"
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team1_side'], bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team2_side'], bot)
+        team1_side_with_icon = settings.side_label(match_data['team1_side'])
+        team2_side_with_icon = settings.side_label(match_data['team2_side'])
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         week = match_data.get('week', 'N/A')
         title = f"🏆 Week {week}: {match_data['team1_name']} vs {match_data['team2_name']}"
@@ -146,7 +138,7 @@ class StreamerEmbeds:
             value=f"{match_data['team1_name']}: {team1_side_with_icon}\n{match_data['team2_name']}: {team2_side_with_icon}", 
             inline=False
         )
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -158,7 +150,7 @@ class StreamerEmbeds:
             
             
             if bot:
-                username = StreamerEmbeds._get_streamer_display_name(bot, streamer_data['streamer_id'])
+                username = bot.display_names.resolve(streamer_data['streamer_id'])
             else:
                 username = f"User {streamer_data['streamer_id']}"
             
@@ -177,20 +169,22 @@ class StreamerEmbeds:
     @staticmethod
     def create_private_embed_with_streamers(match_data: dict, streamers: List[dict], bot=None) -> discord.Embed:
         
+        settings = BotSettings.of(bot)
+        
         formatted_date = ConfigHelper.format_date_to_display(match_data.get('match_date', 'TBA'))
         
         # TIMEZONE SUPPORT: Match time mit Timezone formatieren
         raw_match_time = match_data.get('match_time')
         if raw_match_time and raw_match_time != 'TBA':
-            formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, bot)
+            formatted_match_time = MatchClock.format(bot, match_data.get('match_id'), raw_match_time, match_data.get('match_date'))
         else:
             formatted_match_time = "*TBA*"
         
-        team1_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team1_side'], bot)
-        team2_side_with_icon = ConfigHelper.format_team_side_with_icon(match_data['team2_side'], bot)
+        team1_side_with_icon = settings.side_label(match_data['team1_side'])
+        team2_side_with_icon = settings.side_label(match_data['team2_side'])
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
-        timezone_warning = TimezoneHelper.get_timezone_warning_text(bot)
+        timezone_warning = settings.local_time_note
         
         week = match_data.get('week', 'N/A')
         title = f"🏆 Week {week}: {match_data['team1_name']} vs {match_data['team2_name']}"
@@ -207,7 +201,7 @@ class StreamerEmbeds:
             value=f"{match_data['team1_name']}: {team1_side_with_icon}\n{match_data['team2_name']}: {team2_side_with_icon}", 
             inline=False
         )
-        embed.add_field(name="📖 Rules", value=f"[ONM]({ConfigHelper.get_rules_url(bot)})", inline=False)
+        embed.add_field(name="📖 Rules", value=f"[ONM]({settings.rules_url})", inline=False)
         
         # TIMEZONE SUPPORT: Timezone-Info hinzufügen
         embed.add_field(name="⏰ Timezone Info", value=timezone_warning, inline=False)
@@ -219,7 +213,7 @@ class StreamerEmbeds:
             
             
             if bot:
-                username = StreamerEmbeds._get_streamer_display_name(bot, streamer_data['streamer_id'])
+                username = bot.display_names.resolve(streamer_data['streamer_id'])
             else:
                 username = f"User {streamer_data['streamer_id']}"
             
@@ -7,6 +7,7 @@ import discord
 import logging
 import asyncio
 import json
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
@@ -46,10 +47,13 @@ class FastStartupPersistence:
                 
                 
                 for message_data in batch:
+                    restore_start = time.perf_counter()
+                    queries_before = self.bot.db.query_count
                     try:
                         success = await self._fast_restore_component_no_edit(message_data)
                         
                         message_type = message_data.get('message_type', 'unknown')
+                        self._record_restoration_timing(message_type, restore_start, queries_before, success)
                         if message_type not in stats['by_type']:
                             stats['by_type'][message_type] = {'restored': 0, 'failed': 0}
                         
@@ -63,6 +67,7 @@ class FastStartupPersistence:
                     except Exception as e:
                         logger.error(f"❌ Error restoring {message_data.get('message_type')}: {e}")
                         stats['failed'] += 1
+                        self._record_restoration_timing(message_data.get('message_type', 'unknown'), restore_start, queries_before, False)
                 
                 
                 await asyncio.sleep(0.1)
@@ -79,6 +84,14 @@ class FastStartupPersistence:
             logger.error(f"Error in FAST restoration: {e}")
             return {'total': 0, 'restored': 0, 'failed': 0}
     
+    def _record_restoration_timing(self, message_type: str, start: float, queries_before: int, success: bool):
+        profiler = getattr(self.bot, 'startup_profiler', None)
+        if profiler and not profiler.finished:
+            profiler.record_restoration(
+                message_type, time.perf_counter() - start,
+                self.bot.db.query_count - queries_before, success
+            )
+    
     async def _fast_restore_component_no_edit(self, message_data: Dict[str, Any]) -> bool:
         
         try:
@@ -429,14 +442,9 @@ class FastStartupPersistence:
             
             if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                 try:
-                    all_teams = self.bot.get_all_teams()
-                    for team_tuple in all_teams:
-                        team_config_id, name, role_id, members, active = team_tuple
-                        
-                        if team_config_id == team1_id:
-                            team1_name = name
-                        elif team_config_id == team2_id:
-                            team2_name = name
+                    teams = self.bot.team_registry
+                    team1_name = teams.display_name_for_db_id(team1_id, team1_name)
+                    team2_name = teams.display_name_for_db_id(team2_id, team2_name)
                 except Exception as config_error:
                     logger.debug(f"Could not get team names from config: {config_error}")
             
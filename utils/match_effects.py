@@ -0,0 +1,100 @@
+"""
+Match Effects - Effekt-Typen der Outbox (utils/outbox.py) nach Bestätigung eines Ergebnisses
+Speichere als: utils/match_effects.py
+
+OrgaResultConfirmationView.confirm_button schreibt Status 'confirmed' und diese Effekte in einer
+Transaktion (db.confirm_match_result(match_id, effects=...)); der Dispatcher führt sie danach in
+dieser Reihenfolge aus - auch nach einem Neustart:
+
+- result_public_embed:    Ergebnis im Public Match Embed
+- result_submit_button:   "Submit Result" im Private Channel deaktivieren
+- result_private_embed:   Private Embed mit Streamer-Info aktualisieren
+- result_archive_private: Private Channel archivieren (Server-Details bleiben erhalten)
+- result_streamer_embeds: Streamer Embed auf "Final Result"
+- result_channel_status:  Status-Icon des Public Channels auf 'completed'
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RESULT_PUBLIC_EMBED = 'result_public_embed'
+RESULT_SUBMIT_BUTTON = 'result_submit_button'
+RESULT_PRIVATE_EMBED = 'result_private_embed'
+RESULT_ARCHIVE_PRIVATE = 'result_archive_private'
+RESULT_STREAMER_EMBEDS = 'result_streamer_embeds'
+RESULT_CHANNEL_STATUS = 'result_channel_status'
+
+RESULT_CONFIRMED_EFFECTS = (
+    RESULT_PUBLIC_EMBED, RESULT_SUBMIT_BUTTON, RESULT_PRIVATE_EMBED,
+    RESULT_ARCHIVE_PRIVATE, RESULT_STREAMER_EMBEDS, RESULT_CHANNEL_STATUS
+)
+
+
+class MatchEffects:
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    def register(self):
+        outbox = self.bot.outbox
+        outbox.register(RESULT_PUBLIC_EMBED, self._update_public_embed)
+        outbox.register(RESULT_SUBMIT_BUTTON, self._disable_submit_button)
+        outbox.register(RESULT_PRIVATE_EMBED, self._update_private_embed)
+        outbox.register(RESULT_ARCHIVE_PRIVATE, self._archive_private_channel)
+        outbox.register(RESULT_STREAMER_EMBEDS, self._update_streamer_embeds)
+        outbox.register(RESULT_CHANNEL_STATUS, self._update_channel_status)
+
+    @staticmethod
+    def result_confirmed(match_data: Dict[str, Any], result_data: Dict[str, Any],
+                         confirmed_by: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """Effekte für db.confirm_match_result(match_id, effects=...)"""
+        payload = {
+            'match_data': match_data,
+            'result_data': result_data,
+            'confirmed_by': confirmed_by,
+            'enqueued_at': time.time()
+        }
+        return [(effect_type, payload) for effect_type in RESULT_CONFIRMED_EFFECTS]
+
+    def _view(self, match_id: int, payload: Dict[str, Any]):
+        from ui.match_interactions.orga_result_confirmation import OrgaResultConfirmationView
+        return OrgaResultConfirmationView(self.bot, match_id, payload.get('match_data', {}), payload.get('result_data', {}))
+
+    # ---------------------------------------------------------------- handlers
+    # Die View-Helper liefern False, wenn der Discord-Zielzustand nicht hergestellt werden konnte -
+    # der Handler wirft dann, damit die Outbox den Effekt wiederholt statt ihn als 'done' zu markieren.
+
+    @staticmethod
+    def _require(success: bool, effect: str, match_id: int):
+        if not success:
+            raise RuntimeError(f"{effect} failed for match {match_id}")
+
+    async def _update_public_embed(self, match_id: int, payload: Dict[str, Any]):
+        match_details = self.bot.db.get_match_details(match_id)
+        if match_details:
+            success = await self._view(match_id, payload)._update_public_match_in_separate_channel(match_details)
+            self._require(success, "public embed update", match_id)
+
+    async def _disable_submit_button(self, match_id: int, payload: Dict[str, Any]):
+        success = await self._view(match_id, payload)._disable_submit_result_button()
+        self._require(success, "disabling the submit button", match_id)
+
+    async def _update_private_embed(self, match_id: int, payload: Dict[str, Any]):
+        success = await self._view(match_id, payload)._update_private_embed_with_streamer_info()
+        self._require(success, "private embed update", match_id)
+
+    async def _archive_private_channel(self, match_id: int, payload: Dict[str, Any]):
+        success = await self._view(match_id, payload)._archive_match_channel_preserve_server(payload.get('confirmed_by'))
+        self._require(success, "private channel archive", match_id)
+
+    async def _update_streamer_embeds(self, match_id: int, payload: Dict[str, Any]):
+        success = await self._view(match_id, payload)._update_streamer_embeds_final_with_persistence()
+        self._require(success, "streamer embed update", match_id)
+
+    async def _update_channel_status(self, match_id: int, payload: Optional[Dict[str, Any]]):
+        success = await self.bot.status_manager.update_channel_status(match_id, 'completed')
+        self._require(success, "channel status update", match_id)
+        logger.info(f"✅ Status updated to 'completed' for match {match_id}")
@@ -0,0 +1,203 @@
+"""
+Match Jobs - Job-Typen des Schedulers (utils/scheduler.py) für Matches
+Speichere als: utils/match_jobs.py
+
+- offer_expiry:          Zeit-/Server-Angebot nach offer_expiry_hours ablaufen lassen (on_timeout der View)
+- match_reminder:        "Match starts in 30 min" an beide Team-Rollen (Private Channel) und Streamer
+- archive_public_match:  Public Match Channel nach Bestätigung des Ergebnisses archivieren
+- periodic_cleanup:      abgelaufene Views/Interactions deaktivieren, Team-Sync (wiederkehrend)
+
+config.json:
+    "scheduler": {"offer_expiry_hours": 24, "reminder_lead_minutes": 30,
+                  "archive_delay_minutes": 60, "cleanup_interval_minutes": 60}
+"""
+
+import logging
+import time
+from typing import Dict, Any, Optional
+
+import discord
+
+from utils.match_time import discord_timestamp
+
+logger = logging.getLogger(__name__)
+
+OFFER_EXPIRY = 'offer_expiry'
+MATCH_REMINDER = 'match_reminder'
+ARCHIVE_PUBLIC_MATCH = 'archive_public_match'
+PERIODIC_CLEANUP = 'periodic_cleanup'
+
+DEFAULT_OFFER_EXPIRY_HOURS = 24
+DEFAULT_REMINDER_LEAD_MINUTES = 30
+DEFAULT_ARCHIVE_DELAY_MINUTES = 60
+DEFAULT_CLEANUP_INTERVAL_MINUTES = 60
+
+
+class MatchJobs:
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, float]:
+        scheduler_config = config.get('scheduler', {}) if config else {}
+        return {
+            'offer_expiry_hours': float(scheduler_config.get('offer_expiry_hours', DEFAULT_OFFER_EXPIRY_HOURS)),
+            'reminder_lead_minutes': float(scheduler_config.get('reminder_lead_minutes', DEFAULT_REMINDER_LEAD_MINUTES)),
+            'archive_delay_minutes': float(scheduler_config.get('archive_delay_minutes', DEFAULT_ARCHIVE_DELAY_MINUTES)),
+            'cleanup_interval_minutes': float(scheduler_config.get('cleanup_interval_minutes', DEFAULT_CLEANUP_INTERVAL_MINUTES))
+        }
+
+    def register(self):
+        scheduler = self.bot.scheduler
+        scheduler.register(OFFER_EXPIRY, self._expire_offer)
+        scheduler.register(MATCH_REMINDER, self._remind_match)
+        scheduler.register(ARCHIVE_PUBLIC_MATCH, self._archive_public_match)
+        scheduler.register(PERIODIC_CLEANUP, self._periodic_cleanup)
+
+    # ---------------------------------------------------------------- scheduling
+
+    @staticmethod
+    def offer_key(message_id: int) -> str:
+        return f"{OFFER_EXPIRY}:{message_id}"
+
+    def schedule_offer_expiry(self, view_type: str, message, match_id: int, data: Dict[str, Any]) -> str:
+        hours = MatchJobs.settings(self.bot.config)['offer_expiry_hours']
+        return self.bot.scheduler.schedule(OFFER_EXPIRY, time.time() + hours * 3600, {
+            'view_type': view_type,
+            'match_id': match_id,
+            'message_id': message.id,
+            'channel_id': message.channel.id,
+            'guild_id': message.guild.id if message.guild else None,
+            'data': data
+        }, key=MatchJobs.offer_key(message.id), match_id=match_id)
+
+    def cancel_offer_expiry(self, message_id: Optional[int]):
+        if message_id:
+            self.bot.scheduler.cancel(MatchJobs.offer_key(message_id))
+
+    def schedule_reminder(self, match_id: int, starts_at: Optional[int]):
+        """Bei jeder Zeitänderung neu planen; ohne Zeitpunkt / in der Vergangenheit -> entfernen"""
+        key = f"{MATCH_REMINDER}:{match_id}"
+        if starts_at is None or starts_at <= time.time():
+            self.bot.scheduler.cancel(key)
+            return
+        lead = MatchJobs.settings(self.bot.config)['reminder_lead_minutes'] * 60
+        self.bot.scheduler.schedule(
+            MATCH_REMINDER, max(time.time(), starts_at - lead), {'match_id': match_id, 'starts_at': starts_at},
+            key=key, match_id=match_id
+        )
+
+    def schedule_archive(self, match_id: int, result_data: Optional[Dict[str, Any]] = None):
+        delay = MatchJobs.settings(self.bot.config)['archive_delay_minutes'] * 60
+        self.bot.scheduler.schedule(
+            ARCHIVE_PUBLIC_MATCH, time.time() + delay, {'match_id': match_id, 'result_data': result_data},
+            key=f"{ARCHIVE_PUBLIC_MATCH}:{match_id}", match_id=match_id
+        )
+
+    def ensure_cleanup_job(self):
+        """Wiederkehrender Cleanup - ein bestehender (ggf. überfälliger) Job bleibt erhalten"""
+        if self.bot.scheduler.get_job(PERIODIC_CLEANUP) is None:
+            self._schedule_next_cleanup()
+
+    def reschedule_cleanup(self):
+        """Nach einer Änderung von cleanup_interval_minutes: nächsten Cleanup mit dem neuen Intervall planen"""
+        self._schedule_next_cleanup()
+
+    def _schedule_next_cleanup(self):
+        interval = MatchJobs.settings(self.bot.config)['cleanup_interval_minutes'] * 60
+        self.bot.scheduler.schedule(PERIODIC_CLEANUP, time.time() + interval, key=PERIODIC_CLEANUP)
+
+    # ---------------------------------------------------------------- handlers
+
+    async def _expire_offer(self, payload: Dict[str, Any]):
+        data = payload.get('data', {})
+        match_id = payload['match_id']
+
+        if payload['view_type'] == 'time_offer':
+            from ui.match_interactions.time_offer_system import TimeOfferView
+            view = TimeOfferView(
+                self.bot, match_id, data.get('match_data', {}), data.get('offered_time'),
+                data.get('offering_team'), data.get('responding_team'), data.get('responding_team_role_id')
+            )
+        elif payload['view_type'] == 'server_offer':
+            from ui.match_interactions.server_offer_system import ServerOfferView
+            view = ServerOfferView(
+                self.bot, match_id, data.get('match_data', {}), data.get('server_name'), data.get('server_password'),
+                data.get('offering_team'), data.get('responding_team'), data.get('responding_team_role_id')
+            )
+        else:
+            logger.warning(f"Unknown offer type for expiry: {payload['view_type']}")
+            return
+
+        view.message_id = payload['message_id']
+        view.channel_id = payload['channel_id']
+        view.guild_id = payload['guild_id']
+
+        # on_timeout der View: Buttons deaktivieren, "Expired" Embed, Offer-Button im Private Channel wieder aktiv.
+        # Unter dem Match-Lock, damit ein gleichzeitiges Accept nicht mit dem Ablauf verschachtelt wird
+        async with self.bot.match_locks.hold(match_id, OFFER_EXPIRY):
+            if self.bot.scheduler.get_job(MatchJobs.offer_key(payload['message_id'])) is None:
+                return
+            await view.on_timeout()
+        self.bot.db.deactivate_ui_message(payload['message_id'])
+        logger.info(f"⏰ {payload['view_type']} {payload['message_id']} for match {match_id} expired")
+
+    async def _remind_match(self, payload: Dict[str, Any]):
+        match_id = payload['match_id']
+        starts_at = payload['starts_at']
+
+        # Zeit inzwischen geändert oder Match schon gespielt -> kein Reminder
+        if self.bot.match_clock.starts_at(match_id) != starts_at:
+            return
+        match_details = self.bot.db.get_match_details(match_id)
+        if not match_details or match_details[10] in ('completed', 'confirmed'):
+            return
+
+        from utils.embeds import ConfigHelper
+        team1_name, team2_name = ConfigHelper.safe_get_team_names(match_details)
+        team1_role_id, team2_role_id = self.bot.role_index.match_team_role_ids(match_id)
+
+        embed = discord.Embed(
+            title="⏰ Match starting soon!",
+            description=f"**{team1_name}** vs **{team2_name}** starts {discord_timestamp(starts_at, 'R')}",
+            color=discord.Color.orange()
+        )
+        embed.add_field(name="🕒 Match Time", value=discord_timestamp(starts_at, 'F'), inline=True)
+        embed.add_field(name="🗺️ Map", value=match_details[5] or 'TBA', inline=True)
+        embed.set_footer(text=f"Match ID: {match_id}")
+
+        private_channel = self.bot.get_channel(match_details[8]) if match_details[8] else None
+        if private_channel:
+            mentions = " ".join(f"<@&{role_id}>" for role_id in (team1_role_id, team2_role_id) if role_id)
+            await private_channel.send(
+                mentions or None, embed=embed,
+                allowed_mentions=discord.AllowedMentions(roles=True, users=False, everyone=False)
+            )
+
+        streamers = self.bot.db.get_match_streamers_detailed(match_id)
+        channel_id = self.bot.config.get('channels', {}).get('streamer_notification_channel_id')
+        notification_channel = self.bot.get_channel(channel_id) if channel_id else None
+        if streamers and notification_channel:
+            mentions = " ".join(f"<@{streamer['streamer_id']}>" for streamer in streamers)
+            await notification_channel.send(
+                mentions, embed=embed,
+                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False)
+            )
+
+        logger.info(f"⏰ Reminder sent for match {match_id} ({len(streamers)} streamers)")
+
+    async def _archive_public_match(self, payload: Dict[str, Any]):
+        await self.bot.archive_public_match_channel(payload['match_id'], payload.get('result_data'))
+
+    async def _periodic_cleanup(self, payload: Dict[str, Any]):
+        try:
+            logger.info("🧹 Running periodic cleanup...")
+
+            self.bot.db.cleanup_expired_data()
+            await self.bot.lazy_persistence.cleanup_orphaned_messages()
+            self.bot.sync_config_teams_to_database()
+
+            logger.info("✅ Periodic cleanup complete")
+        finally:
+            self._schedule_next_cleanup()
@@ -0,0 +1,195 @@
+"""
+Match Locks - serialisiert zustandsändernde Interaktionen pro Match
+Speichere als: utils/match_locks.py
+
+- Pro Match ein asyncio.Lock: Accept / Counter Offer / Orga Edit / Streamer-Registrierung desselben
+  Matches laufen nacheinander (DB-Update, Embed-Edits, Channel-Rename nicht mehr verschachtelt).
+  Verschiedene Matches laufen weiterhin parallel.
+- Lock-Einträge existieren nur solange ein Handler den Lock hält oder darauf wartet (Referenzzähler)
+  und werden danach sofort entfernt - keine wachsende Map über die Turnierlaufzeit.
+- Doppelklicks: dieselbe Aktion auf derselben Nachricht, die gerade läuft oder vor weniger als
+  DUPLICATE_WINDOW_SECONDS abgeschlossen wurde, wird verworfen (ephemeral Hinweis).
+- Wartet ein Klick länger als LOCK_WAIT_SECONDS, wird er mit "busy" beantwortet statt die
+  3-Sekunden-Frist der Interaction zu verpassen.
+
+Verwendung in Views / Modals (self.bot und self.match_id müssen gesetzt sein):
+
+    @discord.ui.button(label='✅ Accept Time', custom_id='time_accept')
+    @match_action('time_accept')
+    async def accept_button(self, interaction, button): ...
+
+Ohne Interaction (z.B. Scheduler-Jobs):  async with bot.match_locks.hold(match_id, 'offer_expiry'): ...
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+LOCK_WAIT_SECONDS = 2.5
+DUPLICATE_WINDOW_SECONDS = 3.0
+RECENT_PRUNE_SIZE = 256
+
+
+class MatchBusyError(Exception):
+    """Lock eines Matches nicht innerhalb des Timeouts erhalten"""
+
+    def __init__(self, match_id: int, holder: Optional[str]):
+        super().__init__(f"match {match_id} is busy ({holder or 'unknown'})")
+        self.match_id = match_id
+        self.holder = holder
+
+
+class _MatchLock:
+    __slots__ = ('lock', 'refs', 'holder', 'acquired_at')
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.refs = 0
+        self.holder: Optional[str] = None
+        self.acquired_at = 0.0
+
+
+class MatchLocks:
+
+    def __init__(self, bot=None):
+        self.bot = bot
+        self._locks: Dict[int, _MatchLock] = {}
+        # (match_id, action, message_id, user_id) -> läuft gerade / Abschlusszeitpunkt
+        self._in_flight = set()
+        self._recent: Dict[Tuple, float] = {}
+        self.stats = {
+            'acquired': 0, 'contended': 0, 'busy': 0, 'duplicates_dropped': 0,
+            'total_wait_ms': 0.0, 'max_wait_ms': 0.0, 'max_hold_ms': 0.0
+        }
+        self._contended_by_action: Dict[str, int] = defaultdict(int)
+
+    def _release_ref(self, match_id: int, entry: _MatchLock):
+        entry.refs -= 1
+        if entry.refs <= 0 and self._locks.get(match_id) is entry:
+            del self._locks[match_id]
+
+    @asynccontextmanager
+    async def hold(self, match_id: int, action: str = 'unknown', timeout: Optional[float] = None):
+        """Exklusiver Zugriff auf ein Match. timeout=None wartet unbegrenzt, sonst MatchBusyError"""
+        entry = self._locks.get(match_id)
+        if entry is None:
+            entry = self._locks[match_id] = _MatchLock()
+        entry.refs += 1
+
+        started = time.monotonic()
+        # Ein anderer Handler hält den Lock oder wartet bereits darauf
+        contended = entry.refs > 1
+        try:
+            if timeout is None:
+                await entry.lock.acquire()
+            else:
+                await asyncio.wait_for(entry.lock.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self._release_ref(match_id, entry)
+            self.stats['busy'] += 1
+            self._contended_by_action[action] += 1
+            raise MatchBusyError(match_id, entry.holder)
+        except BaseException:
+            self._release_ref(match_id, entry)
+            raise
+
+        wait_ms = (time.monotonic() - started) * 1000
+        self.stats['acquired'] += 1
+        self.stats['total_wait_ms'] += wait_ms
+        self.stats['max_wait_ms'] = max(self.stats['max_wait_ms'], round(wait_ms, 1))
+        if contended:
+            self.stats['contended'] += 1
+            self._contended_by_action[action] += 1
+            logger.debug(f"🔒 Match {match_id}: '{action}' waited {wait_ms:.0f}ms for '{entry.holder}'")
+
+        entry.holder = action
+        entry.acquired_at = time.monotonic()
+        try:
+            yield
+        finally:
+            hold_ms = (time.monotonic() - entry.acquired_at) * 1000
+            self.stats['max_hold_ms'] = max(self.stats['max_hold_ms'], round(hold_ms, 1))
+            entry.holder = None
+            entry.lock.release()
+            self._release_ref(match_id, entry)
+
+    def _is_duplicate(self, key: Tuple) -> bool:
+        if key in self._in_flight:
+            return True
+        finished = self._recent.get(key)
+        return finished is not None and time.monotonic() - finished < DUPLICATE_WINDOW_SECONDS
+
+    def _finish(self, key: Tuple):
+        self._in_flight.discard(key)
+        now = time.monotonic()
+        self._recent[key] = now
+        if len(self._recent) > RECENT_PRUNE_SIZE:
+            self._recent = {k: t for k, t in self._recent.items() if now - t < DUPLICATE_WINDOW_SECONDS}
+
+    async def run(self, match_id: int, action: str, interaction: discord.Interaction,
+                  handler: Callable[[], Awaitable[Any]], per_user: bool = False) -> Any:
+        """Führt handler() unter dem Lock des Matches aus - Duplikate und zu lange Wartezeiten werden beantwortet"""
+        message_id = interaction.message.id if interaction.message else None
+        key = (match_id, action, message_id, interaction.user.id if per_user else None)
+
+        if self._is_duplicate(key):
+            self.stats['duplicates_dropped'] += 1
+            logger.info(f"🔁 Dropped duplicate '{action}' for match {match_id} by {interaction.user}")
+            await self._reply(interaction, "⏳ This action is already being processed.")
+            return None
+
+        self._in_flight.add(key)
+        try:
+            async with self.hold(match_id, action, timeout=LOCK_WAIT_SECONDS):
+                return await handler()
+        except MatchBusyError as e:
+            logger.warning(f"⏳ Match {match_id} busy with '{e.holder}' - rejected '{action}' by {interaction.user}")
+            await self._reply(interaction, "⏳ Another action for this match is in progress. Please try again in a moment.")
+            return None
+        finally:
+            self._finish(key)
+
+    @staticmethod
+    async def _reply(interaction: discord.Interaction, content: str):
+        try:
+            if not interaction.response.is_done():
+                await interaction.response.send_message(content, ephemeral=True)
+        except Exception as e:
+            logger.debug(f"Could not reply to interaction: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        acquired = self.stats['acquired']
+        return {
+            'active_matches': len(self._locks),
+            'in_flight': len(self._in_flight),
+            'avg_wait_ms': round(self.stats['total_wait_ms'] / acquired, 1) if acquired else 0.0,
+            **{k: v for k, v in self.stats.items() if k != 'total_wait_ms'},
+            'contended_by_action': dict(self._contended_by_action)
+        }
+
+
+def match_action(action: str, per_user: bool = False):
+    """
+    Decorator für Button-Callbacks / on_submit / Select-Callbacks. per_user=True: Duplikat nur,
+    wenn derselbe User dieselbe Aktion wiederholt (z.B. Modals, die beide Teams öffnen können).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            match_locks = getattr(self.bot, 'match_locks', None)
+            if match_locks is None:
+                return await func(self, interaction, *args, **kwargs)
+            return await match_locks.run(
+                self.match_id, action, interaction,
+                lambda: func(self, interaction, *args, **kwargs), per_user=per_user
+            )
+        return wrapper
+    return decorator
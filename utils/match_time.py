@@ -0,0 +1,176 @@
+"""
+Match Time - echte Zeitpunkte (UTC Epoch) für Matches und Discord Timestamps
+Speichere als: utils/match_time.py
+
+- matches.match_date / match_time bleiben der lokale Text ("2025-08-09", "20:30"), dazu speichert
+  match_schedule den UTC Epoch (einmal beim Setzen der Zeit mit der Server-Zone umgerechnet).
+- Umrechnung über zoneinfo (server.iana_timezone, sonst server.timezone) - Sommer-/Winterzeit
+  wird pro Datum korrekt berücksichtigt, Zone-Objekte sind gecacht.
+- Embeds zeigen <t:epoch:F>: Discord rendert das in der Zeitzone jedes Betrachters. Eine spätere
+  Änderung von server.timezone verschiebt bereits gespeicherte Matches nicht.
+- "Matches in den nächsten N Stunden" ist ein Range Scan über idx_match_schedule_starts_at.
+"""
+
+import logging
+import time
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from utils.bot_settings import BotSettings, TBA_VALUES
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMAT = '%Y-%m-%d'
+TIME_FORMAT = '%H:%M'
+DEFAULT_STYLE = 'F'
+
+
+@lru_cache(maxsize=16)
+def get_zone(name: str) -> tzinfo:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        logger.warning(f"⚠️ Unknown timezone '{name}' ({e}) - using UTC for match times")
+        return timezone.utc
+
+
+def to_epoch(date_str: Optional[str], time_str: Optional[str], zone: tzinfo) -> Optional[int]:
+    """
+    Lokales Datum + "HH:MM" in der Zone -> UTC Epoch (None, wenn Datum/Zeit fehlen oder ungültig sind).
+    Doppelte Stunde (Umstellung im Herbst): der frühere Zeitpunkt. Übersprungene Stunde (Frühjahr):
+    wird mit dem Offset vor der Umstellung gerechnet, also eine Stunde später angezeigt.
+    """
+    if not date_str or not time_str or time_str in TBA_VALUES:
+        return None
+    try:
+        local = datetime.strptime(f"{date_str.strip()} {time_str.strip()}", f"{DATE_FORMAT} {TIME_FORMAT}")
+    except ValueError:
+        return None
+
+    epoch = int(local.replace(tzinfo=zone).timestamp())
+    if datetime.fromtimestamp(epoch, zone).replace(tzinfo=None) != local:
+        logger.info(f"🕒 {date_str} {time_str} does not exist in {zone} (DST change) - using <t:{epoch}:F>")
+    return epoch
+
+
+def discord_timestamp(epoch: int, style: str = DEFAULT_STYLE) -> str:
+    return f"<t:{int(epoch)}:{style}>"
+
+
+class MatchClock:
+
+    def __init__(self, bot):
+        self.bot = bot
+        # match_id -> (starts_at, match_date, match_time) - beim ersten Zugriff aus match_schedule geladen
+        self._schedule: Optional[Dict[int, Tuple[int, str, str]]] = None
+
+    @property
+    def zone_name(self) -> str:
+        return BotSettings.of(self.bot).zone_name
+
+    @property
+    def zone(self) -> tzinfo:
+        return get_zone(self.zone_name)
+
+    def _entries(self) -> Dict[int, Tuple[int, str, str]]:
+        if self._schedule is None:
+            self._schedule = {
+                match_id: (starts_at, match_date, match_time)
+                for match_id, starts_at, match_date, match_time in self.bot.db.get_match_schedule()
+            }
+        return self._schedule
+
+    def to_epoch(self, match_date: Optional[str], match_time: Optional[str]) -> Optional[int]:
+        return to_epoch(match_date, match_time, self.zone)
+
+    def starts_at(self, match_id: int) -> Optional[int]:
+        entry = self._entries().get(match_id)
+        return entry[0] if entry else None
+
+    def set_match_time(self, match_id: int, match_date: Optional[str], match_time: Optional[str],
+                       update_date: bool = False, map_name: Optional[str] = None) -> Optional[int]:
+        """
+        Speichert Zeit-Text und UTC Epoch (eine Transaktion). update_date=True schreibt auch match_date,
+        ohne match_date wird das aktuelle Datum aus der DB verwendet. map_name wird mitgeschrieben, wenn angegeben.
+        """
+        if match_date is None and not update_date:
+            match_details = self.bot.db.get_match_details(match_id)
+            match_date = match_details[3] if match_details else None
+
+        starts_at = self.to_epoch(match_date, match_time)
+        self.bot.db.update_match_time(
+            match_id, match_time, starts_at, self.zone_name, match_date if update_date else None, map_name
+        )
+        if starts_at is None:
+            self._entries().pop(match_id, None)
+        else:
+            self._entries()[match_id] = (starts_at, match_date, match_time)
+        self._schedule_reminder(match_id, starts_at)
+        return starts_at
+
+    def _schedule_reminder(self, match_id: int, starts_at: Optional[int]):
+        match_jobs = getattr(self.bot, 'match_jobs', None)
+        if match_jobs is not None:
+            match_jobs.schedule_reminder(match_id, starts_at)
+
+    def forget(self, match_id: int):
+        if self._schedule is not None:
+            self._schedule.pop(match_id, None)
+
+    def render(self, match_id: Optional[int] = None, match_time: Optional[str] = None,
+               match_date: Optional[str] = None, style: str = DEFAULT_STYLE) -> str:
+        """
+        Gespeicherter Zeitpunkt des Matches als <t:epoch:style>. Weicht match_time vom gespeicherten
+        Stand ab (z.B. ein noch offenes Zeitangebot), wird mit dem Match-Datum neu umgerechnet.
+        Ohne Datum bleibt es beim Text mit Zonen-Kürzel ("20:30 CET").
+        """
+        if not match_time or match_time in TBA_VALUES:
+            return 'TBA'
+
+        entry = self._entries().get(match_id) if match_id is not None else None
+        if entry and entry[2] == match_time and (match_date is None or entry[1] == match_date):
+            return discord_timestamp(entry[0], style)
+
+        starts_at = self.to_epoch(match_date or (entry[1] if entry else None), match_time)
+        if starts_at is not None:
+            return discord_timestamp(starts_at, style)
+        return BotSettings.of(self.bot).format_time(match_time)
+
+    @staticmethod
+    def format(bot, match_id: Optional[int] = None, match_time: Optional[str] = None,
+               match_date: Optional[str] = None, style: str = DEFAULT_STYLE) -> str:
+        """Für Embed-Builder mit optionalem bot - ohne MatchClock der bisherige Text"""
+        clock = getattr(bot, 'match_clock', None)
+        if clock is None:
+            return BotSettings.of(bot).format_time(match_time)
+        return clock.render(match_id, match_time, match_date, style)
+
+    def upcoming(self, hours: float) -> List[Tuple[int, int]]:
+        """(match_id, starts_at) aller Matches, die in den nächsten `hours` Stunden beginnen"""
+        now = int(time.time())
+        return self.bot.db.get_matches_starting_between(now, now + int(hours * 3600))
+
+    def backfill(self) -> int:
+        """
+        Einmalig für bestehende Matches: Zeit-Text ohne Epoch mit der aktuellen Server-Zone umrechnen
+        """
+        try:
+            starts = []
+            for match_id, match_date, match_time in self.bot.db.get_unscheduled_match_times():
+                starts_at = self.to_epoch(match_date, match_time)
+                if starts_at is not None:
+                    starts.append((match_id, starts_at, self.zone_name))
+
+            if starts:
+                self.bot.db.set_match_starts(starts)
+                self._schedule = None
+                for match_id, starts_at, _ in starts:
+                    self._schedule_reminder(match_id, starts_at)
+                logger.info(f"🕒 Backfilled UTC start times for {len(starts)} matches ({self.zone_name})")
+            return len(starts)
+
+        except Exception as e:
+            logger.error(f"Error backfilling match start times: {e}")
+            return 0
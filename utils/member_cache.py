@@ -0,0 +1,248 @@
+"""
+Member Cache - Lazy Member-Strategie statt vollem Chunking beim Startup
+Speichere als: utils/member_cache.py
+
+Policy 'full' (Default): discord.py lädt beim Startup alle Member jeder Guild (bisheriges Verhalten).
+Policy 'lazy': kein Chunking beim Startup - Member werden bei Bedarf per ID geholt und
+Display-Namen / getrackte Rollen in einem begrenzten LRU-Cache gehalten.
+
+Einziger Namens-Speicher des Bots: Display-Namen laufen nach name_ttl_seconds ab und werden dann neu
+aufgelöst, Invalidierung über remember() (on_member_update) / forget() (on_user_update, on_member_remove).
+utils/display_name_resolver.py bündelt darauf nur noch die Nachlade-Bursts.
+
+config.json:
+    "member_cache": {"policy": "lazy", "max_entries": 1000, "name_ttl_seconds": 900}
+"""
+
+import discord
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+POLICY_FULL = 'full'
+POLICY_LAZY = 'lazy'
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_NAME_TTL_SECONDS = 900
+QUERY_MEMBERS_LIMIT = 100
+
+class MemberCache:
+
+    def __init__(self, bot):
+        self.bot = bot
+        settings = MemberCache._settings(bot.config)
+        self.policy = settings['policy']
+        self.max_entries = settings['max_entries']
+        self.name_ttl_seconds = settings['name_ttl_seconds']
+        # user_id -> {'name': str, 'name_expires_at': float, 'role_ids': frozenset} (LRU, älteste zuerst)
+        self._entries = OrderedDict()
+        self._tracked_role_ids = self.tracked_role_ids()
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    @staticmethod
+    def _settings(config: Dict[str, Any]) -> Dict[str, Any]:
+        member_cache_config = config.get('member_cache', {}) if config else {}
+        policy = member_cache_config.get('policy', POLICY_FULL)
+        if policy not in (POLICY_FULL, POLICY_LAZY):
+            logger.warning(f"Unknown member_cache policy '{policy}', using '{POLICY_FULL}'")
+            policy = POLICY_FULL
+        return {
+            'policy': policy,
+            'max_entries': int(member_cache_config.get('max_entries', DEFAULT_MAX_ENTRIES)),
+            'name_ttl_seconds': float(member_cache_config.get('name_ttl_seconds', DEFAULT_NAME_TTL_SECONDS))
+        }
+
+    @staticmethod
+    def client_options(config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Zusätzliche kwargs für commands.Bot - bei 'lazy' wird das Chunking beim Startup deaktiviert
+        """
+        if MemberCache._settings(config)['policy'] == POLICY_LAZY:
+            return {'chunk_guilds_at_startup': False}
+        return {}
+
+    def apply_settings(self, config: Dict[str, Any]):
+        """
+        Config Reload: max_entries / name_ttl_seconds sofort übernehmen (policy erst nach Neustart)
+        """
+        settings = MemberCache._settings(config)
+        self.max_entries = settings['max_entries']
+        self.name_ttl_seconds = settings['name_ttl_seconds']
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.policy == POLICY_LAZY
+
+    def refresh_tracked_roles(self, role_ids: Optional[Set[int]] = None):
+        self._tracked_role_ids = role_ids if role_ids is not None else self.tracked_role_ids()
+
+    def tracked_role_ids(self, config: Optional[Dict[str, Any]] = None) -> Set[int]:
+        """
+        Alle Rollen, die der Bot für Berechtigungen/Anzeige braucht
+        """
+        config = config if config is not None else self.bot.config
+        role_ids = {role_id for role_id in config.get('roles', {}).values() if role_id}
+        role_ids.update(role_id for role_id in config.get('additional_match_role_ids', []) if role_id)
+        for team_data in config.get('teams', {}).values():
+            if isinstance(team_data, dict) and team_data.get('role_id'):
+                role_ids.add(team_data['role_id'])
+        return role_ids
+
+    def should_track(self, member) -> bool:
+        """
+        Bereits gecachte Member oder Member mit einer getrackten Rolle
+        """
+        return member.id in self._entries or self.user_has_any_role(member, self._tracked_role_ids)
+
+    @staticmethod
+    def display_name(member) -> str:
+        # Priorität: Server-Nickname > Global Display Name > Username
+        return getattr(member, 'nick', None) or member.global_name or member.name
+
+    def _fresh_name(self, user_id: int) -> Optional[str]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry['name_expires_at'] < time.monotonic():
+            return None
+        self._entries.move_to_end(user_id)
+        return entry['name']
+
+    def remember(self, member):
+        """
+        Speichert Display-Name und getrackte Rollen eines Members (LRU, begrenzt auf max_entries)
+        """
+        try:
+            role_ids = frozenset(role.id for role in getattr(member, 'roles', []))
+            self._entries[member.id] = {
+                'name': self.display_name(member),
+                'name_expires_at': time.monotonic() + self.name_ttl_seconds,
+                'role_ids': role_ids & self._tracked_role_ids
+            }
+            self._entries.move_to_end(member.id)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        except Exception as e:
+            logger.debug(f"Could not cache member {getattr(member, 'id', '?')}: {e}")
+
+    def forget(self, user_id: int):
+        self._entries.pop(user_id, None)
+
+    def get_display_name(self, user_id: int) -> Optional[str]:
+        """
+        Sync-Lookup: LRU (solange der Name nicht abgelaufen ist) -> discord.py Member Cache -> User Cache.
+        None wenn unbekannt - abgelaufene Namen ohne Live-Member gelten als unbekannt und werden nachgeholt.
+        """
+        name = self._fresh_name(user_id)
+        if name is not None:
+            self.hits += 1
+            return name
+
+        self.misses += 1
+        for guild in self.bot.guilds:
+            member = guild.get_member(user_id)
+            if member:
+                self.remember(member)
+                return self.display_name(member)
+
+        user = self.bot.get_user(user_id)
+        if user:
+            return user.global_name or user.name
+        return None
+
+    def get_role_ids(self, user_id: int) -> Optional[frozenset]:
+        entry = self._entries.get(user_id)
+        return entry['role_ids'] if entry else None
+
+    def user_has_any_role(self, user, role_ids: Iterable[int]) -> bool:
+        """
+        Rollen-Check, der auch mit reinen User-Objekten (ohne .roles) über den Cache funktioniert
+        """
+        role_ids = {role_id for role_id in role_ids if role_id}
+        if not role_ids:
+            return False
+
+        user_roles = getattr(user, 'roles', None)
+        if user_roles is not None:
+            return any(role.id in role_ids for role in user_roles)
+
+        cached_role_ids = self.get_role_ids(user.id)
+        return bool(cached_role_ids and cached_role_ids & role_ids)
+
+    async def fetch_members(self, user_ids: Iterable[int]) -> int:
+        """
+        Holt fehlende Member per ID (query_members in 100er Batches) und legt sie im Cache ab
+        """
+        missing = [
+            user_id for user_id in dict.fromkeys(user_ids)
+            if user_id and self._fresh_name(user_id) is None
+            and not any(guild.get_member(user_id) for guild in self.bot.guilds)
+        ]
+        if not missing:
+            return 0
+
+        fetched = 0
+        for guild in self.bot.guilds:
+            if not missing:
+                break
+            for i in range(0, len(missing), QUERY_MEMBERS_LIMIT):
+                batch = missing[i:i + QUERY_MEMBERS_LIMIT]
+                try:
+                    members = await guild.query_members(user_ids=batch, limit=len(batch), cache=not self.is_lazy)
+                except (discord.HTTPException, discord.ClientException, ValueError) as e:
+                    logger.warning(f"query_members failed in guild {guild.id}: {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Error querying members in guild {guild.id}: {e}")
+                    continue
+
+                self.fetches += 1
+                for member in members:
+                    self.remember(member)
+                    fetched += 1
+
+            missing = [user_id for user_id in missing if self._fresh_name(user_id) is None]
+
+        return fetched
+
+    async def warm_up(self) -> int:
+        """
+        Lazy Policy: lädt nur die Streamer der noch offenen Matches vor, statt alle Member zu chunken
+        """
+        if not self.is_lazy:
+            return 0
+
+        try:
+            cursor = self.bot.db.conn.cursor()
+            cursor.execute('''
+                SELECT DISTINCT ms.streamer_id
+                FROM match_streamers ms
+                JOIN matches m ON m.id = ms.match_id
+                WHERE m.status != 'confirmed'
+            ''')
+            streamer_ids = [row[0] for row in cursor.fetchall()]
+
+            fetched = await self.fetch_members(streamer_ids)
+            logger.info(f"👥 Member cache warm-up: {fetched}/{len(streamer_ids)} streamers fetched (policy: {self.policy})")
+            return fetched
+
+        except Exception as e:
+            logger.error(f"Error warming up member cache: {e}")
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'policy': self.policy,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'name_ttl_seconds': self.name_ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'fetches': self.fetches
+        }
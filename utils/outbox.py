@@ -0,0 +1,141 @@
+"""
+Outbox - dauerhafte Warteschlange für Discord-Effekte nach Zustandsänderungen
+Speichere als: utils/outbox.py
+
+- Handler schreiben Zustandsänderung + ausstehende Effekte (outbox_effects) in EINER SQLite-Transaktion
+  (z.B. db.confirm_match_result(match_id, effects=[...])) und antworten direkt nach dem Commit.
+- Ein Dispatcher-Task führt die Effekte in Einfüge-Reihenfolge aus, gedrosselt auf
+  outbox.effects_per_second, jeweils unter dem Match-Lock (utils/match_locks.py).
+- Erfolgreiche Effekte werden als 'done' markiert, Fehler mit Backoff wiederholt, nach MAX_ATTEMPTS 'failed'.
+- Bricht der Prozess mitten in der Abarbeitung ab, bleiben die Effekte 'pending' und werden beim
+  nächsten Start erneut ausgeführt - Effekt-Handler müssen daher idempotent sein (Zielzustand setzen,
+  nicht inkrementell ändern).
+
+Handler: outbox.register('effect_type', async def handler(match_id: int, payload: dict)).
+Ein Handler gilt als erfolgreich, wenn er ohne Exception zurückkehrt - Fehler müssen geworfen werden,
+nicht nur geloggt.
+config.json: "outbox": {"effects_per_second": 2}
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 1800
+BATCH_SIZE = 20
+DEFAULT_EFFECTS_PER_SECOND = 2.0
+
+EffectHandler = Callable[[Optional[int], Dict[str, Any]], Awaitable[Any]]
+
+
+class Outbox:
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._handlers: Dict[str, EffectHandler] = {}
+        self._wakeup = asyncio.Event()
+        self._runner = None
+        self.stats = {'dispatched': 0, 'retried': 0, 'failed': 0, 'replayed_on_boot': 0, 'max_delay_ms': 0.0}
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, float]:
+        outbox_config = config.get('outbox', {}) if config else {}
+        return {
+            'effects_per_second': max(0.1, float(outbox_config.get('effects_per_second', DEFAULT_EFFECTS_PER_SECOND)))
+        }
+
+    def register(self, effect_type: str, handler: EffectHandler):
+        self._handlers[effect_type] = handler
+
+    def notify(self):
+        """Nach dem Commit neuer Effekte aufrufen - weckt den Dispatcher sofort"""
+        self._wakeup.set()
+
+    def start(self) -> Optional[asyncio.Task]:
+        if self._runner and not self._runner.done():
+            return self._runner
+
+        pending = self.bot.db.count_pending_outbox_effects()
+        self.stats['replayed_on_boot'] = pending
+        if pending:
+            logger.info(f"📬 Outbox: replaying {pending} pending effects from previous run")
+        self._runner = asyncio.create_task(self._run())
+        return self._runner
+
+    async def _run(self):
+        while not self.bot.is_closed():
+            try:
+                self._wakeup.clear()
+                effects = self.bot.db.get_due_outbox_effects(time.time(), BATCH_SIZE)
+
+                interval = 1.0 / Outbox.settings(self.bot.config)['effects_per_second']
+                for effect in effects:
+                    started = time.monotonic()
+                    await self._dispatch(*effect)
+                    await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+                if len(effects) == BATCH_SIZE:
+                    continue
+
+                # Bis zum nächsten Retry schlafen oder bis neue Effekte eingereiht werden
+                next_at = self.bot.db.get_next_outbox_available_at()
+                delay = max(0.0, next_at - time.time()) if next_at is not None else None
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in outbox dispatcher: {e}")
+                await asyncio.sleep(5)
+
+    async def _dispatch(self, effect_id: int, effect_type: str, match_id: Optional[int], payload_json: str, attempts: int):
+        handler = self._handlers.get(effect_type)
+        try:
+            if handler is None:
+                raise RuntimeError(f"no handler registered for effect type '{effect_type}'")
+            payload = json.loads(payload_json) if payload_json else {}
+
+            if match_id is not None:
+                async with self.bot.match_locks.hold(match_id, f"outbox:{effect_type}"):
+                    await handler(match_id, payload)
+            else:
+                await handler(match_id, payload)
+
+            self.bot.db.mark_outbox_effect_done(effect_id, payload_json)
+            self.stats['dispatched'] += 1
+
+            enqueued_at = payload.get('enqueued_at')
+            if enqueued_at:
+                delay_ms = (time.time() - enqueued_at) * 1000
+                self.stats['max_delay_ms'] = max(self.stats['max_delay_ms'], round(delay_ms, 1))
+            logger.debug(f"📬 Effect {effect_type} for match {match_id} done")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            attempts = (attempts or 0) + 1
+            if attempts >= MAX_ATTEMPTS:
+                self.bot.db.mark_outbox_effect_failed(effect_id, attempts, str(e))
+                self.stats['failed'] += 1
+                logger.error(f"❌ Effect {effect_type} for match {match_id} failed permanently after {attempts} attempts: {e}")
+            else:
+                available_at = time.time() + min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+                self.bot.db.retry_outbox_effect(effect_id, available_at, attempts, str(e))
+                self.stats['retried'] += 1
+                logger.warning(f"⚠️ Effect {effect_type} for match {match_id} failed ({e}) - retry {attempts}/{MAX_ATTEMPTS - 1}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        try:
+            pending = self.bot.db.count_pending_outbox_effects()
+        except Exception:
+            pending = None
+        return {'pending': pending, **self.stats}
@@ -6,7 +6,6 @@ Public Embed Update System - WITH TIMEZONE SUPPORT
 import discord
 import logging
 from typing import Dict, Any, Optional
-from utils.timezone_helper import TimezoneHelper
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +34,7 @@ class PublicEmbedUpdater:
             
             # Aktuelle Streamer-Informationen holen
             current_streamers = self.bot.db.get_match_streamers_detailed(match_id)
+            await self.bot.display_names.prefetch(streamer['streamer_id'] for streamer in current_streamers)
             
             # Public Embed aktualisieren
             await self._update_public_embed_with_current_data(
@@ -112,7 +112,7 @@ class PublicEmbedUpdater:
             # TIMEZONE SUPPORT: Zeit mit Timezone formatieren
             raw_match_time = match_details[4]
             if raw_match_time and raw_match_time != "*TBA*":
-                formatted_match_time = TimezoneHelper.format_time_with_timezone(raw_match_time, self.bot)
+                formatted_match_time = self.bot.match_clock.render(match_details[0], raw_match_time, match_details[3])
             else:
                 formatted_match_time = "*TBA*"
             
@@ -126,8 +126,7 @@ class PublicEmbedUpdater:
                     embed.set_field_at(i, name=field.name, value=match_details[5], inline=field.inline)
                 # TIMEZONE SUPPORT: Timezone-Info Feld aktualisieren
                 elif "Timezone Info" in field.name or "⏰" in field.name:
-                    timezone_warning = TimezoneHelper.get_timezone_warning_text(self.bot)
-                    embed.set_field_at(i, name=field.name, value=timezone_warning, inline=field.inline)
+                    embed.set_field_at(i, name=field.name, value=self.bot.settings.local_time_note, inline=field.inline)
             
             # Streamer-Informationen aktualisieren
             await self._update_streamer_field_in_public_embed(embed, streamers, match_details)
@@ -171,7 +170,7 @@ class PublicEmbedUpdater:
                 stream_url = streamer_data.get('stream_url', '')
                 
                 # Server-Nickname verwenden (FIXED)
-                username = self._get_streamer_display_name(streamer_data['streamer_id'])
+                username = self.bot.display_names.resolve(streamer_data['streamer_id'])
                 
                 # Team-Namen aus Match Details holen
                 team1_name = match_details[16] if len(match_details) > 16 else f"Team {match_details[1]}"
@@ -180,13 +179,9 @@ class PublicEmbedUpdater:
                 # Falls Team-Namen noch generisch sind, aus Config laden
                 if team1_name.startswith("Team ") or team2_name.startswith("Team "):
                     try:
-                        all_teams = self.bot.get_all_teams()
-                        for team_tuple in all_teams:
-                            team_config_id, name, role_id, members, active = team_tuple
-                            if team_config_id == match_details[1]:
-                                team1_name = name
-                            elif team_config_id == match_details[2]:
-                                team2_name = name
+                        teams = self.bot.team_registry
+                        team1_name = teams.display_name_for_db_id(match_details[1], team1_name)
+                        team2_name = teams.display_name_for_db_id(match_details[2], team2_name)
                     except:
                         pass
                 
@@ -216,26 +211,6 @@ class PublicEmbedUpdater:
         except Exception as e:
             logger.error(f"Error updating streamer field in public embed: {e}")
     
-    def _get_streamer_display_name(self, streamer_id: int) -> str:
-        """
-        Holt den Server-Nickname oder fällt auf Display-Name zurück (FIXED)
-        """
-        try:
-            # Versuche Member zu finden (hat Server-Nickname)
-            for guild in self.bot.guilds:
-                member = guild.get_member(streamer_id)
-                if member:
-                    # Priorität: Server-Nickname > Global Display Name > Username
-                    return member.nick or member.global_name or member.name
-            
-            # Fallback auf User
-            user = self.bot.get_user(streamer_id)
-            return user.global_name or user.name if user else f"User {streamer_id}"
-            
-        except Exception as e:
-            logger.error(f"Error getting streamer display name: {e}")
-            return f"User {streamer_id}"
-    
     async def _update_result_field_if_completed(self, embed: discord.Embed, match_details: tuple):
         """
         Aktualisiert Result-Feld falls Match abgeschlossen
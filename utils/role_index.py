@@ -0,0 +1,219 @@
+"""
+Role Index - Rollen-Mitgliedschaften für O(1) Berechtigungs-Checks
+Speichere als: utils/role_index.py
+
+Hält pro User die getrackten Rollen (Team-Rollen, Orga, Streamer, weitere Rollen aus dem
+'roles' Abschnitt, additional_match_role_ids) als frozenset. Aktuell gehalten über
+on_member_update / on_member_remove / on_guild_role_delete und das Member-Objekt jeder
+Interaction. Alle Button-Checks laufen über authorize() - ohne DB-Zugriff.
+Ist der User ein discord.Member (Guild-Interaction / Command), zählen immer seine aktuellen
+member.roles (ein Durchlauf, aktualisiert dabei den Index). Der gespeicherte Stand wird nur für
+reine User-Objekte (z.B. DMs) verwendet, bei denen keine Rollen mitgeliefert werden.
+"""
+
+import logging
+from typing import Dict, Any, Optional, Iterable, Tuple, FrozenSet
+
+logger = logging.getLogger(__name__)
+
+TEAM1 = 'team1'
+TEAM2 = 'team2'
+
+
+class RoleIndex:
+
+    def __init__(self, bot):
+        self.bot = bot
+        # user_id -> {guild_id: frozenset(role_ids)} und user_id -> Vereinigung über alle Guilds
+        self._guild_roles: Dict[int, Dict[int, FrozenSet[int]]] = {}
+        self._roles: Dict[int, FrozenSet[int]] = {}
+        # match_id -> (team1 DB-ID, team2 DB-ID) - Teams eines Matches ändern sich nicht
+        self._match_teams: Dict[int, Tuple[int, int]] = {}
+        # match_id -> Role IDs aus der DB für Teams ohne Config-Eintrag (einmal geladen)
+        self._match_db_role_ids: Dict[int, Tuple[Optional[int], Optional[int]]] = {}
+        self._tracked_role_ids = frozenset(bot.member_cache.tracked_role_ids())
+        self.stats = {'hits': 0, 'member_refreshes': 0, 'match_lookups': 0}
+
+    @property
+    def tracked_role_ids(self) -> FrozenSet[int]:
+        return self._tracked_role_ids
+
+    def refresh_tracked_roles(self, role_ids: Optional[Iterable[int]] = None):
+        """Nach Config-Änderungen: getrackte Rollen neu bestimmen und Index neu aufbauen"""
+        if role_ids is None:
+            role_ids = self.bot.member_cache.tracked_role_ids()
+        self._tracked_role_ids = frozenset(role_ids)
+        self._match_teams.clear()
+        self._match_db_role_ids.clear()
+        self.rebuild()
+
+    def build(self, role_ids: Iterable[int]) -> Dict[int, Dict[int, FrozenSet[int]]]:
+        """
+        user_id -> {guild_id: frozenset(role_ids)} aus dem discord.py Member Cache (role.members) -
+        liest discord.py State, daher nur auf dem Event Loop aufrufen
+        """
+        guild_roles: Dict[int, Dict[int, set]] = {}
+        for guild in self.bot.guilds:
+            for role_id in role_ids:
+                role = guild.get_role(role_id)
+                if not role:
+                    continue
+                for member in role.members:
+                    guild_roles.setdefault(member.id, {}).setdefault(guild.id, set()).add(role_id)
+
+        return {
+            user_id: {guild_id: frozenset(role_ids) for guild_id, role_ids in guilds.items()}
+            for user_id, guilds in guild_roles.items()
+        }
+
+    def rebuild(self) -> int:
+        """
+        Setzt den Index aus dem discord.py Member Cache (role.members) - bei Lazy Policy
+        nur teilweise gefüllt, der Rest wird über Interactions nachgezogen
+        """
+        self._guild_roles = self.build(self._tracked_role_ids)
+        self._roles = {
+            user_id: frozenset().union(*guilds.values()) for user_id, guilds in self._guild_roles.items()
+        }
+        logger.info(f"🔐 Role index built: {len(self._roles)} members with tracked roles")
+        return len(self._roles)
+
+    def index_member(self, member) -> FrozenSet[int]:
+        """Übernimmt die aktuellen Rollen eines Members (einmal über member.roles)"""
+        guild = getattr(member, 'guild', None)
+        guild_id = guild.id if guild else 0
+        role_ids = frozenset(role.id for role in member.roles) & self._tracked_role_ids
+
+        guilds = self._guild_roles.get(member.id, {})
+        if role_ids:
+            guilds = {**guilds, guild_id: role_ids}
+        else:
+            guilds = {gid: roles for gid, roles in guilds.items() if gid != guild_id}
+        self._store(member.id, guilds)
+        # Auch "keine getrackten Rollen" merken, damit der nächste Check nicht erneut iteriert
+        self._roles[member.id] = frozenset().union(*guilds.values()) if guilds else frozenset()
+        return self._roles[member.id]
+
+    def _store(self, user_id: int, guilds: Dict[int, FrozenSet[int]]):
+        if guilds:
+            self._guild_roles[user_id] = guilds
+        else:
+            self._guild_roles.pop(user_id, None)
+
+    def remove_member(self, guild_id: int, user_id: int):
+        guilds = {gid: roles for gid, roles in self._guild_roles.get(user_id, {}).items() if gid != guild_id}
+        self._store(user_id, guilds)
+        if guilds:
+            self._roles[user_id] = frozenset().union(*guilds.values())
+        else:
+            self._roles.pop(user_id, None)
+
+    def remove_role(self, role_id: int):
+        """Gelöschte Rolle aus allen Einträgen entfernen"""
+        for user_id in [user_id for user_id, roles in self._roles.items() if role_id in roles]:
+            guilds = {
+                gid: roles - {role_id} for gid, roles in self._guild_roles.get(user_id, {}).items()
+                if roles - {role_id}
+            }
+            self._store(user_id, guilds)
+            self._roles[user_id] = frozenset().union(*guilds.values()) if guilds else frozenset()
+
+    def is_indexed(self, user_id: int) -> bool:
+        return user_id in self._roles
+
+    def role_ids_for(self, user) -> FrozenSet[int]:
+        # Member: die Rollen kommen mit jeder Interaction aktuell mit - nie einen älteren Index-Stand
+        # verwenden (z.B. wenn ein on_member_update verpasst wurde)
+        if getattr(user, 'roles', None) is not None:
+            self.stats['member_refreshes'] += 1
+            return self.index_member(user)
+
+        # Reiner User (z.B. DM) - letzter bekannter Stand aus dem Index bzw. Member Cache
+        roles = self._roles.get(user.id)
+        if roles is not None:
+            self.stats['hits'] += 1
+            return roles
+        return self.bot.member_cache.get_role_ids(user.id) or frozenset()
+
+    def has_any_role(self, user, role_ids: Iterable[int]) -> bool:
+        return not self.role_ids_for(user).isdisjoint(role_id for role_id in role_ids if role_id)
+
+    def remember_match(self, match_id: int, team1_db_id: int, team2_db_id: int):
+        self._match_teams[match_id] = (team1_db_id, team2_db_id)
+
+    def match_teams(self, match_id: int) -> Optional[Tuple[int, int]]:
+        """
+        (team1 DB-ID, team2 DB-ID) - einmal pro Match aus der DB, danach aus dem Speicher
+        """
+        teams = self._match_teams.get(match_id)
+        if teams is None:
+            self.stats['match_lookups'] += 1
+            match_details = self.bot.db.get_match_details(match_id)
+            if not match_details:
+                return None
+            teams = (match_details[1], match_details[2])
+            self._match_teams[match_id] = teams
+        return teams
+
+    def match_team_role_ids(self, match_id: int) -> Tuple[Optional[int], Optional[int]]:
+        teams = self.match_teams(match_id)
+        if not teams:
+            return None, None
+
+        registry = self.bot.team_registry
+        role_ids = []
+        for db_team_id in teams:
+            team = registry.get_by_db_id(db_team_id)
+            role_ids.append(team.role_id if team else None)
+
+        if None in role_ids:
+            # Team nicht (mehr) in config.json - Role ID aus der DB, einmal pro Match
+            db_role_ids = self._match_db_role_ids.get(match_id)
+            if db_role_ids is None:
+                self.stats['match_lookups'] += 1
+                by_team = self.bot.db.get_team_role_ids(list(teams))
+                db_role_ids = self._match_db_role_ids[match_id] = (by_team.get(teams[0]), by_team.get(teams[1]))
+                # Mittracken, sonst filtert index_member() diese Rollen aus den Member-Rollen heraus
+                self._tracked_role_ids = self._tracked_role_ids | {role_id for role_id in db_role_ids if role_id}
+            role_ids = [role_id or db_role_id for role_id, db_role_id in zip(role_ids, db_role_ids)]
+        return role_ids[0], role_ids[1]
+
+    def match_side(self, user, match_id: int) -> Optional[str]:
+        """'team1' / 'team2' wenn der User eine der Team-Rollen des Matches hat, sonst None"""
+        team1_role_id, team2_role_id = self.match_team_role_ids(match_id)
+        roles = self.role_ids_for(user)
+        if team1_role_id and team1_role_id in roles:
+            return TEAM1
+        if team2_role_id and team2_role_id in roles:
+            return TEAM2
+        return None
+
+    def authorize(self, user, *, orga: bool = False, streamer: bool = False,
+                  match_id: Optional[int] = None, role_ids: Iterable[int] = ()) -> bool:
+        """
+        Zentraler Berechtigungs-Check: True, wenn der User mindestens eine der angefragten
+        Berechtigungen hat (Orga-Rolle, Streamer-Rolle, Team-Rolle im Match, eine der role_ids)
+        """
+        try:
+            allowed = set(role_id for role_id in role_ids if role_id)
+            if orga and self.bot.EVENT_ORGA_ROLE_ID:
+                allowed.add(self.bot.EVENT_ORGA_ROLE_ID)
+            if streamer and self.bot.STREAMER_ROLE_ID:
+                allowed.add(self.bot.STREAMER_ROLE_ID)
+            if match_id is not None:
+                allowed.update(role_id for role_id in self.match_team_role_ids(match_id) if role_id)
+
+            return bool(allowed) and not self.role_ids_for(user).isdisjoint(allowed)
+
+        except Exception as e:
+            logger.error(f"Error checking permissions for user {getattr(user, 'id', '?')}: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'members': len(self._guild_roles),
+            'indexed': len(self._roles),
+            'tracked_roles': len(self._tracked_role_ids),
+            'matches': len(self._match_teams),
+            **self.stats
+        }
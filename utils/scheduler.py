@@ -0,0 +1,210 @@
+"""
+Job Scheduler - persistente, zeitgenaue Jobs (Offer-Ablauf, Match-Reminder, Archivierung, Cleanup)
+Speichere als: utils/scheduler.py
+
+- Jeder Job liegt in scheduled_jobs (job_key eindeutig, erneutes schedule() mit gleichem Key
+  verschiebt den Job) und zusätzlich in einem Min-Heap im Speicher.
+- Ein einziger Runner-Task schläft bis zum nächsten fälligen Job (wird bei früheren neuen Jobs
+  geweckt) und führt ihn genau dann aus. Erledigte Jobs werden gelöscht, fehlgeschlagene mit
+  Backoff erneut versucht, nach MAX_ATTEMPTS als 'failed' markiert.
+- Beim Boot werden nur offene Jobs über den partiellen Index idx_scheduled_jobs_pending geladen;
+  überfällige Jobs laufen sofort in Fälligkeits-Reihenfolge.
+
+Handler: scheduler.register('job_type', async def handler(payload: dict)).
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class ScheduledJob:
+    key: str
+    job_type: str
+    due_at: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+    match_id: Optional[int] = None
+    attempts: int = 0
+
+
+class JobScheduler:
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._handlers: Dict[str, JobHandler] = {}
+        # job_key -> aktueller Job; der Heap kann veraltete Einträge enthalten (lazy deletion)
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._runner = None
+        self._running = set()
+        self.stats = {'scheduled': 0, 'executed': 0, 'failed': 0, 'retried': 0, 'cancelled': 0, 'max_lateness_ms': 0.0}
+
+    def register(self, job_type: str, handler: JobHandler):
+        self._handlers[job_type] = handler
+
+    def _push(self, job: ScheduledJob):
+        self._jobs[job.key] = job
+        heapq.heappush(self._heap, (job.due_at, next(self._sequence), job))
+        if self._heap[0][2] is job:
+            self._wakeup.set()
+
+    def schedule(self, job_type: str, due_at: float, payload: Optional[Dict[str, Any]] = None,
+                 key: Optional[str] = None, match_id: Optional[int] = None) -> str:
+        """
+        Legt einen Job an (oder verschiebt den Job mit gleichem Key). due_at = UTC Epoch in Sekunden
+        """
+        key = key or f"{job_type}:{next(self._sequence)}:{time.time_ns()}"
+        try:
+            self.bot.db.upsert_scheduled_job(key, job_type, due_at, payload, match_id)
+            self._push(ScheduledJob(key, job_type, due_at, payload or {}, match_id))
+            self.stats['scheduled'] += 1
+            logger.debug(f"⏱️ Scheduled {key} at <t:{int(due_at)}>")
+        except Exception as e:
+            logger.error(f"Error scheduling job {key}: {e}")
+        return key
+
+    def cancel(self, key: str) -> bool:
+        job = self._jobs.pop(key, None)
+        try:
+            removed = self.bot.db.delete_scheduled_job(key)
+        except Exception as e:
+            logger.error(f"Error cancelling job {key}: {e}")
+            removed = False
+        if job or removed:
+            self.stats['cancelled'] += 1
+        return bool(job or removed)
+
+    def cancel_for_match(self, match_id: int) -> int:
+        """Alle Jobs eines Matches (z.B. beim Löschen des Matches)"""
+        try:
+            keys = self.bot.db.delete_scheduled_jobs_for_match(match_id)
+        except Exception as e:
+            logger.error(f"Error cancelling jobs for match {match_id}: {e}")
+            keys = []
+        for key in keys:
+            self._jobs.pop(key, None)
+        self.stats['cancelled'] += len(keys)
+        return len(keys)
+
+    def get_job(self, key: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(key)
+
+    def load(self) -> int:
+        """Offene Jobs aus der DB (Index-Scan, nach Fälligkeit sortiert)"""
+        self._jobs.clear()
+        self._heap = []
+        for key, job_type, due_at, payload_json, match_id, attempts in self.bot.db.get_pending_scheduled_jobs():
+            try:
+                payload = json.loads(payload_json) if payload_json else {}
+            except json.JSONDecodeError:
+                payload = {}
+            job = ScheduledJob(key, job_type, due_at, payload, match_id, attempts or 0)
+            self._jobs[key] = job
+            self._heap.append((due_at, next(self._sequence), job))
+        heapq.heapify(self._heap)
+        return len(self._jobs)
+
+    def start(self) -> Optional[asyncio.Task]:
+        if self._runner and not self._runner.done():
+            return self._runner
+
+        loaded = self.load()
+        overdue = sum(1 for job in self._jobs.values() if job.due_at <= time.time())
+        logger.info(f"⏱️ Scheduler started: {loaded} pending jobs ({overdue} overdue)")
+        self._runner = asyncio.create_task(self._run())
+        return self._runner
+
+    def _pop_due(self, now: float) -> List[ScheduledJob]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            # Veraltet (verschoben / abgebrochen)?
+            if self._jobs.get(job.key) is job:
+                due.append(job)
+        return due
+
+    async def _run(self):
+        while not self.bot.is_closed():
+            try:
+                now = time.time()
+                for job in self._pop_due(now):
+                    task = asyncio.create_task(self._execute(job, now))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+
+                # Veraltete Einträge oben vom Heap entfernen, dann bis zum nächsten Job schlafen
+                while self._heap and self._jobs.get(self._heap[0][2].key) is not self._heap[0][2]:
+                    heapq.heappop(self._heap)
+                delay = self._heap[0][0] - time.time() if self._heap else None
+
+                self._wakeup.clear()
+                if delay is None or delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}")
+                await asyncio.sleep(5)
+
+    async def _execute(self, job: ScheduledJob, now: float):
+        lateness_ms = max(0.0, (now - job.due_at) * 1000)
+        self.stats['max_lateness_ms'] = max(self.stats['max_lateness_ms'], round(lateness_ms, 1))
+
+        handler = self._handlers.get(job.job_type)
+        try:
+            if handler is None:
+                raise RuntimeError(f"no handler registered for job type '{job.job_type}'")
+            await handler(job.payload)
+
+            # Während der Ausführung neu geplant (gleicher Key)? Dann bleibt der neue Job bestehen
+            if self._jobs.get(job.key) is job:
+                self._jobs.pop(job.key, None)
+                self.bot.db.delete_scheduled_job(job.key)
+            self.stats['executed'] += 1
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.attempts += 1
+            if self._jobs.get(job.key) is not job:
+                return
+            if job.attempts >= MAX_ATTEMPTS:
+                self._jobs.pop(job.key, None)
+                self.bot.db.mark_scheduled_job_failed(job.key, job.attempts, str(e))
+                self.stats['failed'] += 1
+                logger.error(f"❌ Job {job.key} failed permanently after {job.attempts} attempts: {e}")
+            else:
+                job.due_at = time.time() + min(RETRY_BASE_SECONDS * 2 ** (job.attempts - 1), RETRY_MAX_SECONDS)
+                self.bot.db.reschedule_failed_job(job.key, job.due_at, job.attempts, str(e))
+                self._push(job)
+                self.stats['retried'] += 1
+                logger.warning(f"⚠️ Job {job.key} failed ({e}) - retry {job.attempts}/{MAX_ATTEMPTS - 1} at <t:{int(job.due_at)}>")
+
+    def get_stats(self) -> Dict[str, Any]:
+        next_due = min((job.due_at for job in self._jobs.values()), default=None)
+        return {
+            'pending': len(self._jobs),
+            'running': len(self._running),
+            'next_due_in_seconds': round(next_due - time.time(), 1) if next_due else None,
+            **self.stats
+        }
@@ -0,0 +1,232 @@
+"""
+Startup Profiler
+Speichere als: utils/startup_profiler.py
+
+Misst Wall-Time und DB-Query-Anzahl pro Startup-Phase, pro Message-Type bei der
+Restoration sowie die Import-Zeit der schweren Module. Bewusst ohne discord-Import,
+damit der Import-Timer vor allen anderen Modulen installiert werden kann.
+"""
+
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+HEAVY_MODULES = (
+    'discord',
+    'aiohttp',
+    'PIL.Image',
+    'wheel.wheel_generator',
+    'utils.lazy_persistence_service',
+    'utils.fast_startup_persistence',
+    'ui.match_interactions.orga_edit_system',
+    'ui.match_interactions.time_offer_system',
+    'ui.match_interactions.server_offer_system',
+    'ui.match_interactions.result_submission_system',
+    'ui.match_interactions.orga_result_confirmation',
+)
+
+DEFAULT_KEEP_REPORTS = 10
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak Resident Set Size des Prozesses in MB (None auf Plattformen ohne resource-Modul)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux liefert KB, macOS Bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+class _TimedLoader:
+    """Wrappt einen Loader und misst die (kumulative) Ausführungszeit des Moduls"""
+
+    def __init__(self, loader, on_loaded):
+        self._loader = loader
+        self._on_loaded = on_loaded
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._on_loaded(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimingFinder:
+    """Meta-Path Finder, der nur die beobachteten Module mit einem _TimedLoader versieht"""
+
+    def __init__(self, modules: Iterable[str], on_loaded):
+        self._modules = set(modules)
+        self._on_loaded = on_loaded
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in self._modules:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self._on_loaded)
+        return spec
+
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.created_at = datetime.now().isoformat()
+        self.phases = []
+        self.imports = {}
+        self.restoration = {}
+        self.db = None
+        self.finished = False
+        self._watched_modules = ()
+        self._finder = None
+
+    def install_import_timer(self, modules: Iterable[str] = HEAVY_MODULES):
+        """
+        Muss vor den eigentlichen Imports aufgerufen werden - bereits geladene Module
+        werden als 'preloaded' markiert
+        """
+        modules = list(modules)
+        self._watched_modules = tuple(modules)
+        for module_name in modules:
+            if module_name in sys.modules:
+                self.imports[module_name] = {'ms': None, 'status': 'preloaded'}
+
+        self._finder = _ImportTimingFinder(
+            [name for name in modules if name not in sys.modules],
+            self._record_import
+        )
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall_import_timer(self):
+        if self._finder and self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def _record_import(self, module_name: str, seconds: float):
+        self.imports[module_name] = {'ms': round(seconds * 1000, 1), 'status': 'loaded'}
+
+    def attach_database(self, db):
+        self.db = db
+
+    def _query_count(self) -> int:
+        return getattr(self.db, 'query_count', 0) if self.db else 0
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000, 1)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        queries_before = self._query_count()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - start, self._query_count() - queries_before)
+
+    def record_phase(self, name: str, seconds: float, db_queries: int = 0):
+        self.phases.append({
+            'name': name,
+            'ms': round(seconds * 1000, 1),
+            'db_queries': db_queries,
+            'at_ms': self.elapsed_ms()
+        })
+
+    def record_restoration(self, message_type: str, seconds: float, db_queries: int, success: bool):
+        entry = self.restoration.setdefault(message_type, {
+            'count': 0, 'restored': 0, 'failed': 0, 'ms': 0.0, 'db_queries': 0
+        })
+        entry['count'] += 1
+        entry['restored' if success else 'failed'] += 1
+        entry['ms'] = round(entry['ms'] + seconds * 1000, 1)
+        entry['db_queries'] += db_queries
+
+    def _phase_at(self, name: str) -> Optional[float]:
+        for phase in self.phases:
+            if phase['name'] == name:
+                return phase['at_ms']
+        return None
+
+    def build_report(self, **extra) -> Dict[str, Any]:
+        # Beobachtete Module, die bis jetzt nicht importiert wurden, sind erfolgreich verzögert
+        for module_name in self._watched_modules:
+            self.imports.setdefault(module_name, {'ms': None, 'status': 'deferred'})
+
+        report = {
+            'created_at': self.created_at,
+            'total_ms': self.elapsed_ms(),
+            'time_to_gateway_connect_ms': self._phase_at('gateway_connect'),
+            'phases': self.phases,
+            'restoration_by_type': self.restoration,
+            'imports': self.imports,
+        }
+        report.update(extra)
+        return report
+
+    def finish(self, db=None, keep: int = DEFAULT_KEEP_REPORTS, **extra) -> Optional[Dict[str, Any]]:
+        """
+        Erstellt den strukturierten Report, loggt ihn einmalig und speichert die letzten N Reports
+        """
+        if self.finished:
+            return None
+        self.finished = True
+        self.uninstall_import_timer()
+
+        report = self.build_report(**extra)
+        db = db or self.db
+
+        previous = None
+        if db:
+            try:
+                history = db.get_startup_reports(limit=1)
+                previous = history[0] if history else None
+            except Exception as e:
+                logger.error(f"Error loading previous startup report: {e}")
+
+        if previous and previous.get('total_ms') is not None:
+            report['delta_vs_previous_ms'] = round(report['total_ms'] - previous['total_ms'], 1)
+
+        if report['time_to_gateway_connect_ms'] is not None:
+            previous_connect = previous.get('time_to_gateway_connect_ms') if previous else None
+            if previous_connect is not None:
+                logger.info(f"🔌 Time to gateway connect: {report['time_to_gateway_connect_ms']}ms (before: {previous_connect}ms)")
+            else:
+                logger.info(f"🔌 Time to gateway connect: {report['time_to_gateway_connect_ms']}ms")
+
+        if db:
+            try:
+                db.save_startup_report(report, keep=keep)
+            except Exception as e:
+                logger.error(f"Error persisting startup report: {e}")
+
+        if 'delta_vs_previous_ms' in report:
+            logger.info(f"⏱️ Startup took {report['total_ms']}ms ({report['delta_vs_previous_ms']:+}ms vs. previous start)")
+        else:
+            logger.info(f"⏱️ Startup took {report['total_ms']}ms")
+
+        logger.info(f"📊 Startup report: {json.dumps(report, default=str)}")
+        return report
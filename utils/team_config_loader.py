@@ -3,86 +3,197 @@ Team Config Loader
 """
 
 import logging
-from typing import List, Tuple, Optional, Dict
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, NamedTuple, Mapping, Any
 
 logger = logging.getLogger(__name__)
 
+
+class TeamEntry(NamedTuple):
+    """
+    Team aus config.json - bleibt ein 5er-Tuple (config_id, display_name, role_id, members, active),
+    damit bestehendes Tuple-Unpacking weiter funktioniert
+    """
+    config_id: int
+    display_name: str
+    role_id: int
+    members: str
+    active: bool
+
+
+class TeamRegistry:
+    """
+    Unveränderlicher Index aller Teams aus config.json - einmal gebaut, danach nur gelesen.
+    O(1) Lookups nach Config-ID, DB-ID, Role-ID und (casefold) Name. Bei einem Config-Reload
+    wird eine neue Registry gebaut und als Ganzes ausgetauscht, Leser sehen nie einen Zwischenstand.
+    """
+
+    __slots__ = ('teams', 'active_teams', 'by_config_id', 'by_db_id', 'by_role_id', 'by_name', 'db_ids')
+
+    def __init__(self, teams: Tuple[TeamEntry, ...] = (), db_ids: Optional[Mapping[int, int]] = None):
+        db_ids = {config_id: db_id for config_id, db_id in (db_ids or {}).items() if db_id}
+
+        by_name = {}
+        for team in teams:
+            # Erster Eintrag gewinnt - wie beim früheren linearen Scan
+            by_name.setdefault(team.display_name.casefold(), team)
+
+        by_config_id = {team.config_id: team for team in teams}
+
+        self.teams = teams
+        self.active_teams = tuple(team for team in teams if team.active)
+        self.by_config_id = MappingProxyType(by_config_id)
+        self.by_role_id = MappingProxyType({team.role_id: team for team in reversed(teams)})
+        self.by_name = MappingProxyType(by_name)
+        self.db_ids = MappingProxyType(db_ids)
+        self.by_db_id = MappingProxyType({
+            db_id: by_config_id[config_id] for config_id, db_id in db_ids.items() if config_id in by_config_id
+        })
+
+    @classmethod
+    def from_config(cls, teams_config: Mapping[str, Any], db_ids: Optional[Mapping[int, int]] = None) -> 'TeamRegistry':
+        """
+        Baut die Registry aus dem 'teams' Abschnitt der config.json. Config-IDs werden wie bisher
+        fortlaufend ab 1 in Config-Reihenfolge vergeben (ungültige Einträge zählen nicht mit)
+        """
+        teams = []
+        team_id = 1
+
+        for team_key, team_data in (teams_config or {}).items():
+            if not isinstance(team_data, dict):
+                logger.warning(f"Invalid team data for {team_key}")
+                continue
+
+            role_id = team_data.get('role_id')
+            if not role_id:
+                logger.warning(f"No role_id specified for team {team_key}")
+                continue
+
+            teams.append(TeamEntry(
+                team_id,
+                team_data.get('display_name', team_key),
+                role_id,
+                "[]",
+                team_data.get('active', True)
+            ))
+            team_id += 1
+
+        return cls(tuple(teams), db_ids)
+
+    def with_db_ids(self, db_ids: Mapping[int, int]) -> 'TeamRegistry':
+        """Neue Registry mit Config-ID -> DB-ID Zuordnung (diese bleibt unverändert)"""
+        return TeamRegistry(self.teams, db_ids)
+
+    def carry_db_ids(self, previous: 'TeamRegistry') -> 'TeamRegistry':
+        """
+        DB-IDs einer älteren Registry übernehmen - über die Role ID, da sich Config-IDs
+        beim Einfügen/Entfernen von Teams verschieben
+        """
+        db_ids_by_role = {team.role_id: previous.db_ids[team.config_id] for team in previous.teams if team.config_id in previous.db_ids}
+        return self.with_db_ids({team.config_id: db_ids_by_role[team.role_id] for team in self.teams if team.role_id in db_ids_by_role})
+
+    def get_by_config_id(self, config_id: int) -> Optional[TeamEntry]:
+        return self.by_config_id.get(config_id)
+
+    def get_by_db_id(self, db_id: int) -> Optional[TeamEntry]:
+        return self.by_db_id.get(db_id)
+
+    def get_by_role_id(self, role_id: int) -> Optional[TeamEntry]:
+        return self.by_role_id.get(role_id)
+
+    def get_by_name(self, name: str) -> Optional[TeamEntry]:
+        return self.by_name.get(str(name).casefold())
+
+    def db_id_for(self, config_id: int) -> Optional[int]:
+        return self.db_ids.get(config_id)
+
+    def display_name(self, config_id: int, default: str = None) -> Optional[str]:
+        team = self.by_config_id.get(config_id)
+        return team.display_name if team else default
+
+    def display_name_for_db_id(self, db_id: int, default: str = None) -> Optional[str]:
+        """Matches speichern teams.id - nicht die Config-ID"""
+        team = self.by_db_id.get(db_id)
+        return team.display_name if team else default
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+
 class TeamConfigLoader:
     
     
     def __init__(self, bot):
         self.bot = bot
-        self._teams_cache = None
+        self._registry = None
     
-    def get_all_teams(self) -> List[Tuple]:
-        
+    @property
+    def registry(self) -> TeamRegistry:
+        registry = self._registry
+        if registry is None:
+            registry = self.reload()
+        return registry
+    
+    def reload(self, config: Optional[Dict[str, Any]] = None) -> TeamRegistry:
+        """
+        Baut die Registry neu (z.B. nach Config-Reload) und tauscht sie atomar aus.
+        Bekannte DB-IDs bleiben für unveränderte Teams (gleiche Role ID) erhalten
+        """
         try:
-            if not hasattr(self.bot, 'config') or not self.bot.config:
+            config = config if config is not None else getattr(self.bot, 'config', None)
+            if not config:
                 logger.error("Bot config not available")
-                return []
-            
-            teams_config = self.bot.config.get('teams', {})
-            if not teams_config:
-                logger.warning("No teams section found in config.json")
-                return []
-            
-            teams_list = []
-            team_id = 1  
-            
-            for team_key, team_data in teams_config.items():
-                if not isinstance(team_data, dict):
-                    logger.warning(f"Invalid team data for {team_key}")
-                    continue
-                
-                
-                display_name = team_data.get('display_name', team_key)
-                role_id = team_data.get('role_id')
-                active = team_data.get('active', True)
-                
-                if not role_id:
-                    logger.warning(f"No role_id specified for team {team_key}")
-                    continue
-                
-                
-                
-                team_tuple = (
-                    team_id,           
-                    display_name,      
-                    role_id,          
-                    "[]",             
-                    active            
-                )
-                
-                teams_list.append(team_tuple)
-                team_id += 1
-            
-            logger.debug(f"Loaded {len(teams_list)} teams from config.json")
-            return teams_list
+                registry = TeamRegistry()
+            else:
+                teams_config = config.get('teams', {})
+                if not teams_config:
+                    logger.warning("No teams section found in config.json")
+                registry = TeamRegistry.from_config(teams_config)
+                if self._registry:
+                    registry = registry.carry_db_ids(self._registry)
             
         except Exception as e:
             logger.error(f"Error loading teams from config: {e}")
-            return []
+            registry = self._registry or TeamRegistry()
+        
+        self._registry = registry
+        logger.debug(f"Loaded {len(registry)} teams from config.json")
+        return registry
+    
+    def swap(self, registry: TeamRegistry) -> TeamRegistry:
+        """Fertig gebaute Registry (z.B. aus dem Config Reload) atomar einsetzen"""
+        self._registry = registry
+        return registry
+    
+    def set_db_ids(self, db_ids: Mapping[int, int]) -> TeamRegistry:
+        """Config-ID -> DB-ID Zuordnung übernehmen (neue Registry, atomarer Austausch)"""
+        registry = self.registry.with_db_ids(db_ids)
+        self._registry = registry
+        return registry
+    
+    def get_all_teams(self) -> List[Tuple]:
+        
+        return list(self.registry.teams)
     
     def get_active_teams(self) -> List[Tuple]:
         
-        all_teams = self.get_all_teams()
-        return [team for team in all_teams if team[4]]  
+        return list(self.registry.active_teams)
+    
+    def get_team_by_config_id(self, config_id: int) -> Optional[Tuple]:
+        
+        return self.registry.get_by_config_id(config_id)
+    
+    def get_team_by_db_id(self, db_id: int) -> Optional[Tuple]:
+        
+        return self.registry.get_by_db_id(db_id)
     
     def get_team_by_role_id(self, role_id: int) -> Optional[Tuple]:
         
-        all_teams = self.get_all_teams()
-        for team in all_teams:
-            if team[2] == role_id:  
-                return team
-        return None
+        return self.registry.get_by_role_id(role_id)
     
     def get_team_by_name(self, name: str) -> Optional[Tuple]:
         
-        all_teams = self.get_all_teams()
-        for team in all_teams:
-            if team[1].lower() == name.lower():  
-                return team
-        return None
+        return self.registry.get_by_name(name)
     
     def team_exists(self, name: str) -> bool:
         
@@ -126,13 +237,12 @@ class TeamConfigLoader:
     def get_team_statistics(self) -> Dict[str, int]:
         
         try:
-            all_teams = self.get_all_teams()
-            active_teams = self.get_active_teams()
+            registry = self.registry
             
             return {
-                'total_teams': len(all_teams),
-                'active_teams': len(active_teams),
-                'inactive_teams': len(all_teams) - len(active_teams)
+                'total_teams': len(registry.teams),
+                'active_teams': len(registry.active_teams),
+                'inactive_teams': len(registry.teams) - len(registry.active_teams)
             }
             
         except Exception as e:
@@ -6,11 +6,14 @@ Timezone Helper - Vereinfachte Server-Timezone Lösung
 import logging
 from typing import Optional
 
+from utils.bot_settings import BotSettings
+
 logger = logging.getLogger(__name__)
 
 class TimezoneHelper:
     """
-    Einfache Timezone-Behandlung mit Server-weiter Einstellung
+    Einfache Timezone-Behandlung mit Server-weiter Einstellung.
+    Die Werte kommen vorkompiliert aus bot.settings (utils/bot_settings.py)
     """
     
     @staticmethod
@@ -18,42 +21,21 @@ class TimezoneHelper:
         """
         Holt die Server-Timezone aus der Config
         """
-        try:
-            if bot and hasattr(bot, 'config') and bot.config:
-                server_config = bot.config.get('server', {})
-                return server_config.get('timezone', 'UTC')
-            return 'UTC'
-        except Exception as e:
-            logger.warning(f"Error getting server timezone: {e}")
-            return 'UTC'
+        return BotSettings.of(bot).timezone
     
     @staticmethod
     def get_timezone_display(bot=None) -> str:
         """
         Holt die detaillierte Timezone-Anzeige
         """
-        try:
-            if bot and hasattr(bot, 'config') and bot.config:
-                server_config = bot.config.get('server', {})
-                return server_config.get('timezone_display', 'UTC')
-            return 'UTC'
-        except Exception as e:
-            logger.warning(f"Error getting timezone display: {e}")
-            return 'UTC'
+        return BotSettings.of(bot).timezone_display
     
     @staticmethod
     def get_timezone_info(bot=None) -> str:
         """
         Holt die Timezone-Info für Benutzer-Hinweise
         """
-        try:
-            if bot and hasattr(bot, 'config') and bot.config:
-                server_config = bot.config.get('server', {})
-                return server_config.get('timezone_info', 'All times are in UTC')
-            return 'All times are in UTC'
-        except Exception as e:
-            logger.warning(f"Error getting timezone info: {e}")
-            return 'All times are in UTC'
+        return BotSettings.of(bot).timezone_info
     
     @staticmethod
     def format_time_with_timezone(time_str: str, bot=None) -> str:
@@ -67,16 +49,7 @@ class TimezoneHelper:
         Returns:
             Formatierte Zeit mit Timezone (z.B. "20:30 CET" oder "TBA")
         """
-        try:
-            if not time_str or time_str == 'TBA' or time_str == '*TBA*':
-                return "TBA"
-            
-            timezone_short = TimezoneHelper.get_server_timezone(bot)
-            return f"{time_str} {timezone_short}"
-            
-        except Exception as e:
-            logger.error(f"Error formatting time with timezone: {e}")
-            return time_str or "TBA"
+        return BotSettings.of(bot).format_time(time_str)
     
     @staticmethod
     def format_time_with_full_timezone(time_str: str, bot=None) -> str:
@@ -90,40 +63,21 @@ class TimezoneHelper:
         Returns:
             Formatierte Zeit mit vollständiger Timezone (z.B. "20:30 CET (UTC+1)" oder "TBA")
         """
-        try:
-            if not time_str or time_str == 'TBA' or time_str == '*TBA*':
-                return "TBA"
-            
-            timezone_display = TimezoneHelper.get_timezone_display(bot)
-            return f"{time_str} {timezone_display}"
-            
-        except Exception as e:
-            logger.error(f"Error formatting time with full timezone: {e}")
-            return time_str or "TBA"
+        return BotSettings.of(bot).format_time_full(time_str)
     
     @staticmethod
     def get_time_input_placeholder(bot=None) -> str:
         """
         Gibt einen Platzhalter-Text für Zeit-Eingaben zurück
         """
-        try:
-            timezone_short = TimezoneHelper.get_server_timezone(bot)
-            return f"20:30 ({timezone_short})"
-        except Exception as e:
-            logger.error(f"Error getting time input placeholder: {e}")
-            return "20:30"
+        return BotSettings.of(bot).time_input_placeholder
     
     @staticmethod
     def get_time_input_label(bot=None) -> str:
         """
         Gibt einen Label-Text für Zeit-Eingaben zurück
         """
-        try:
-            timezone_display = TimezoneHelper.get_timezone_display(bot)
-            return f"Match Time ({timezone_display})"
-        except Exception as e:
-            logger.error(f"Error getting time input label: {e}")
-            return "Match Time"
+        return BotSettings.of(bot).time_input_label
     
     @staticmethod
     def validate_time_format(time_str: str) -> bool:
@@ -146,11 +100,14 @@ class TimezoneHelper:
     @staticmethod
     def get_timezone_warning_text(bot=None) -> str:
         """
-        Gibt einen Warntext für Timezone-Bewusstsein zurück
+        Gibt einen Warntext für Timezone-Bewusstsein zurück - nur für Embeds ohne Discord Timestamps
         """
-        try:
-            timezone_info = TimezoneHelper.get_timezone_info(bot)
-            return f"⏰ **{timezone_info}**"
-        except Exception as e:
-            logger.error(f"Error getting timezone warning text: {e}")
-            return "⏰ **Please check server timezone settings**"
\ No newline at end of file
+        return BotSettings.of(bot).timezone_warning
+    
+    @staticmethod
+    def get_local_time_note_text(bot=None) -> str:
+        """
+        Hinweis für Embeds mit Discord Timestamps (MatchClock.render) - diese erscheinen in der Zone
+        des Betrachters, "All times are in ..." wäre dort falsch
+        """
+        return BotSettings.of(bot).local_time_note
\ No newline at end of file
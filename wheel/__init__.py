@@ -1,13 +1,27 @@
 # wheel/__init__.py
+# Lazy Exports (PEP 562): PIL wird erst geladen, wenn tatsächlich ein Wheel gerendert wird.
 
-from .match_wheel_service import MatchWheelService
-from .config_loader import WheelConfigLoader
-from .random_service import RandomService
-from .wheel_generator import WheelGenerator
-
-__all__ = [
-    'MatchWheelService',
-    'WheelConfigLoader', 
-    'RandomService',
-    'WheelGenerator'
-]
\ No newline at end of file
+import importlib
+
+_EXPORTS = {
+    'MatchWheelService': '.match_wheel_service',
+    'WheelConfigLoader': '.config_loader',
+    'MapCatalog': '.config_loader',
+    'RandomService': '.random_service',
+    'WheelGenerator': '.wheel_generator',
+    'WheelRenderer': '.wheel_renderer',
+    'WheelRenderPool': '.render_pool',
+    'WheelGifCache': '.gif_cache',
+    'WheelEncoder': '.gif_encoder',
+    'NumpyWheelRenderer': '.numpy_renderer',
+    'EntropyPool': '.entropy_pool',
+    'RenderAssets': '.render_assets'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
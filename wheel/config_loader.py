@@ -2,101 +2,199 @@
 Wheel Config Loader
 """
 
+import hashlib
 import json
 import logging
 import os
+from typing import Dict, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+MAP_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'map_config.json')
+DEFAULT_MAPS = ("de_dust2", "de_mirage", "de_inferno")
+DEFAULT_MAP_SIDES = ('US', 'GER')
+DEFAULT_SIDES = ('CT', 'T')
+
+class MapCatalog:
+    """
+    map_config.json einmal geparst und validiert im Speicher: Map-Name -> Side-Tuple.
+    Neu geladen wird nur, wenn sich mtime/Größe UND der Inhalts-Hash der Datei ändern.
+    `version` (Hash-Präfix) kann als Cache-Key für abgeleitete Daten (Wheel GIFs) dienen.
+    """
+
+    def __init__(self, path: str = MAP_CONFIG_PATH):
+        self.path = path
+        self.maps: Tuple[str, ...] = DEFAULT_MAPS
+        self.sides: Dict[str, Tuple[str, ...]] = {}
+        self.version = 'default'
+        self.loaded = False
+        self._file_signature = None
+        self._content_hash = None
+
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    def refresh(self) -> bool:
+        """
+        Prüft die Datei (ein stat-Aufruf) und lädt bei Änderung neu. Rückgabe: True wenn neu geladen
+        """
+        signature = self._stat_signature()
+        if self.loaded and signature == self._file_signature:
+            return False
+        self._file_signature = signature
+
+        if signature is None:
+            if not self.loaded or self.version != 'default':
+                logger.error("map_config.json not found in main directory")
+            self._apply_defaults()
+            return True
+
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            logger.error(f"Error reading map_config.json: {e}")
+            # Beim nächsten Zugriff erneut versuchen
+            self._file_signature = None
+            if not self.loaded:
+                self._apply_defaults()
+            return False
+
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if self.loaded and content_hash == self._content_hash:
+            # Nur touch - Inhalt unverändert
+            return False
+
+        try:
+            config = json.loads(raw.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error(f"Error parsing map_config.json: {e}")
+            if not self.loaded:
+                self._apply_defaults()
+            # Letzten gültigen Stand behalten
+            return False
+
+        maps, sides = MapCatalog.validate(config)
+        if not maps:
+            logger.warning("No valid map names found in map_config.json")
+            self._apply_defaults()
+        else:
+            self.maps = maps
+            self.sides = sides
+            self.version = content_hash[:12]
+
+        self._content_hash = content_hash
+        self.loaded = True
+        logger.info(f"Loaded {len(self.maps)} maps from map_config.json (version {self.version})")
+        return True
+
+    def _apply_defaults(self):
+        self.maps = DEFAULT_MAPS
+        self.sides = {}
+        self.version = 'default'
+        self._content_hash = None
+        self.loaded = True
+
+    @staticmethod
+    def validate(config: dict) -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]]]:
+        """
+        Einmalige Validierung: ungültige Einträge werden mit Warnung übersprungen
+        """
+        maps = []
+        sides = {}
+
+        maps_data = config.get('maps', []) if isinstance(config, dict) else []
+        if not maps_data:
+            logger.warning("No maps found in map_config.json")
+
+        for position, map_data in enumerate(maps_data):
+            name = map_data.get('name') if isinstance(map_data, dict) else None
+            if not isinstance(name, str) or not name.strip():
+                logger.warning(f"map_config.json: entry {position} has no valid name - skipped")
+                continue
+            if name in sides:
+                logger.warning(f"map_config.json: duplicate map '{name}' - skipped")
+                continue
+
+            teams = map_data.get('teams', list(DEFAULT_MAP_SIDES))
+            if not isinstance(teams, list) or len(teams) < 2 or not all(isinstance(team, str) and team for team in teams):
+                logger.warning(f"map_config.json: map '{name}' has invalid teams {teams!r} - using {list(DEFAULT_MAP_SIDES)}")
+                teams = list(DEFAULT_MAP_SIDES)
+
+            maps.append(name)
+            sides[name] = tuple(teams)
+
+        return tuple(maps), sides
+
+    def get_sides(self, map_name: str) -> Optional[Tuple[str, ...]]:
+        return self.sides.get(map_name)
+
+
+_catalog = MapCatalog()
+
 class WheelConfigLoader:
-    
-    
+
+
+    @staticmethod
+    def catalog() -> MapCatalog:
+        _catalog.refresh()
+        return _catalog
+
+    @staticmethod
+    def current_catalog() -> MapCatalog:
+        """Aktueller Catalog ohne Datei-Check"""
+        return _catalog
+
+    @staticmethod
+    def replace_catalog(catalog: MapCatalog):
+        """Hot Reload: fertig geladenen Catalog als Ganzes einsetzen"""
+        global _catalog
+        _catalog = catalog
+
+    @staticmethod
+    def catalog_version() -> str:
+        return WheelConfigLoader.catalog().version
+
     @staticmethod
     def load_maps() -> list:
-        
+
         try:
-            
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'map_config.json')
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-            maps_data = config.get('maps', [])
-            if not maps_data:
-                logger.warning("No maps found in map_config.json")
-                return ["de_dust2", "de_mirage", "de_inferno"]  
-            
-            
-            maps = [map_data['name'] for map_data in maps_data if 'name' in map_data]
-            
-            if not maps:
-                logger.warning("No valid map names found in map_config.json")
-                return ["de_dust2", "de_mirage", "de_inferno"]  
-                
-            logger.info(f"Loaded {len(maps)} maps from map_config.json")
-            return maps
-            
-        except FileNotFoundError:
-            logger.error("map_config.json not found in main directory")
-            return ["de_dust2", "de_mirage", "de_inferno"]  
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing map_config.json: {e}")
-            return ["de_dust2", "de_mirage", "de_inferno"]  
+            return list(WheelConfigLoader.catalog().maps)
         except Exception as e:
             logger.error(f"Error loading maps: {e}")
-            return ["de_dust2", "de_mirage", "de_inferno"]  
-    
+            return list(DEFAULT_MAPS)
+
     @staticmethod
     def load_team_sides(map_name: str = None) -> dict:
-        
+
         try:
-            
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'map_config.json')
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-            maps_data = config.get('maps', [])
-            
             if map_name:
-                
-                for map_data in maps_data:
-                    if map_data['name'] == map_name:
-                        teams = map_data.get('teams', ['US', 'GER'])
-                        logger.info(f"Found teams for {map_name}: {teams}")
-                        return {
-                            'team1_options': teams,
-                            'team2_options': teams
-                        }
-                
-                
+                teams = WheelConfigLoader.catalog().get_sides(map_name)
+                if teams:
+                    logger.debug(f"Found teams for {map_name}: {list(teams)}")
+                    return {
+                        'team1_options': list(teams),
+                        'team2_options': list(teams)
+                    }
+
                 logger.warning(f"Map {map_name} not found, using default teams")
                 return {
-                    'team1_options': ['US', 'GER'],
-                    'team2_options': ['US', 'GER']
+                    'team1_options': list(DEFAULT_MAP_SIDES),
+                    'team2_options': list(DEFAULT_MAP_SIDES)
                 }
-            else:
-                
-                return {
-                    'team1_options': ['CT', 'T'],
-                    'team2_options': ['CT', 'T']
-                }
-                
-        except FileNotFoundError:
-            logger.error("map_config.json not found")
-            return {
-                'team1_options': ['CT', 'T'],
-                'team2_options': ['CT', 'T']
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing map_config.json: {e}")
+
             return {
-                'team1_options': ['CT', 'T'],
-                'team2_options': ['CT', 'T']
+                'team1_options': list(DEFAULT_SIDES),
+                'team2_options': list(DEFAULT_SIDES)
             }
+
         except Exception as e:
             logger.error(f"Error loading team sides: {e}")
             return {
-                'team1_options': ['CT', 'T'],
-                'team2_options': ['CT', 'T']
-            }
\ No newline at end of file
+                'team1_options': list(DEFAULT_SIDES),
+                'team2_options': list(DEFAULT_SIDES)
+            }
@@ -0,0 +1,224 @@
+"""
+Entropy Pool - gepufferte True Random Zahlen von random.org
+Speichere als: wheel/entropy_pool.py
+
+Eine geteilte aiohttp Session holt Zufallszahlen im Voraus (16-Bit Einheiten) und füllt im
+Hintergrund nach, sobald der Puffer unter die Low-Water-Mark fällt. Auswahlen werden per
+Rejection Sampling ohne Modulo-Bias aus dem Puffer erzeugt. Ist der Puffer leer, wird sofort
+auf `secrets` zurückgefallen (kein Warten auf das Netzwerk). Jede Ziehung wird mit ihrer
+Herkunft (random.org / secrets) protokolliert.
+
+config.json:
+    "entropy": {"base_url": "https://www.random.org", "batch_size": 256, "low_water": 64}
+
+base_url kann für Tests auf einen lokalen Stand-in Server zeigen, der das Plain-Format von
+/integers/ liefert (eine Zahl pro Zeile).
+"""
+
+import aiohttp
+import asyncio
+import logging
+import secrets
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://www.random.org'
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_LOW_WATER = 64
+DEFAULT_TIMEOUT_SECONDS = 5
+PROVENANCE_HISTORY = 100
+
+UNIT_BITS = 16
+UNIT_RANGE = 1 << UNIT_BITS
+
+SOURCE_RANDOM_ORG = 'random.org'
+SOURCE_SECRETS = 'secrets'
+
+
+class EntropyPool:
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, batch_size: int = DEFAULT_BATCH_SIZE,
+                 low_water: int = DEFAULT_LOW_WATER, timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS):
+        self.base_url = base_url.rstrip('/')
+        self.batch_size = max(1, min(batch_size, 10000))
+        self.low_water = max(0, low_water)
+        self.timeout_seconds = timeout_seconds
+
+        # (16-Bit Wert, Batch-ID)
+        self._units = deque()
+        self._session = None
+        self._refill_task = None
+        self._batch_counter = 0
+        self._batches = {}
+        self.provenance = deque(maxlen=PROVENANCE_HISTORY)
+        self.stats = {'fetched_batches': 0, 'failed_fetches': 0, 'draws_random_org': 0, 'draws_secrets': 0, 'rejected_units': 0}
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        entropy_config = config.get('entropy', {}) if config else {}
+        return {
+            'base_url': entropy_config.get('base_url', DEFAULT_BASE_URL),
+            'batch_size': int(entropy_config.get('batch_size', DEFAULT_BATCH_SIZE)),
+            'low_water': int(entropy_config.get('low_water', DEFAULT_LOW_WATER)),
+            'timeout_seconds': float(entropy_config.get('timeout_seconds', DEFAULT_TIMEOUT_SECONDS))
+        }
+
+    @property
+    def available(self) -> int:
+        return len(self._units)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout_seconds))
+        return self._session
+
+    async def start(self):
+        """Erste Befüllung im Hintergrund anstoßen"""
+        self._schedule_refill()
+
+    async def close(self):
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+            await asyncio.gather(self._refill_task, return_exceptions=True)
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def refill(self) -> int:
+        """
+        Holt einen Batch 16-Bit Zahlen (eine HTTP Anfrage). Rückgabe: Anzahl neuer Einheiten
+        """
+        url = f"{self.base_url}/integers/?num={self.batch_size}&min=0&max={UNIT_RANGE - 1}&col=1&base=10&format=plain&rnd=new"
+        try:
+            async with self._get_session().get(url) as response:
+                if response.status != 200:
+                    self.stats['failed_fetches'] += 1
+                    logger.warning(f"❌ random.org error: Status {response.status}")
+                    return 0
+                text = await response.text()
+
+            values = [int(line) for line in text.split() if line.strip()]
+            if any(value < 0 or value >= UNIT_RANGE for value in values):
+                raise ValueError("random.org returned values outside the requested range")
+
+            self._batch_counter += 1
+            batch_id = self._batch_counter
+            self._batches[batch_id] = datetime.now().isoformat()
+            self._units.extend((value, batch_id) for value in values)
+            self.stats['fetched_batches'] += 1
+
+            logger.info(f"✅ Entropy pool refilled from random.org: +{len(values)} units ({self.available} available)")
+            return len(values)
+
+        except Exception as e:
+            self.stats['failed_fetches'] += 1
+            logger.warning(f"❌ random.org not reachable for entropy pool: {e}")
+            return 0
+
+    def _schedule_refill(self):
+        if self._refill_task and not self._refill_task.done():
+            return
+        try:
+            self._refill_task = asyncio.get_running_loop().create_task(self.refill())
+        except RuntimeError:
+            # Kein laufender Event Loop (z.B. synchroner Aufruf) - beim nächsten Draw erneut versuchen
+            self._refill_task = None
+
+    def _take_unit(self) -> Optional[Tuple[int, int]]:
+        if not self._units:
+            return None
+        unit = self._units.popleft()
+        if len(self._units) < self.low_water:
+            self._schedule_refill()
+        return unit
+
+    def _draw_below(self, n: int) -> Tuple[int, str, Optional[int]]:
+        """
+        Gleichverteilte Zahl in [0, n) - Rejection Sampling über so viele 16-Bit Einheiten wie nötig.
+        Rückgabe: (wert, quelle, batch_id)
+        """
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        units_needed = 1
+        while UNIT_RANGE ** units_needed < n:
+            units_needed += 1
+        space = UNIT_RANGE ** units_needed
+        limit = space - (space % n)
+
+        while len(self._units) >= units_needed:
+            value = 0
+            batch_id = None
+            for _ in range(units_needed):
+                unit, batch_id = self._take_unit()
+                value = (value << UNIT_BITS) | unit
+            if value < limit:
+                return value % n, SOURCE_RANDOM_ORG, batch_id
+            self.stats['rejected_units'] += units_needed
+
+        # Puffer leer: sofortiger Fallback statt auf das Netzwerk zu warten
+        self._schedule_refill()
+        return secrets.randbelow(n), SOURCE_SECRETS, None
+
+    def _record(self, purpose: str, value, source: str, batch_id: Optional[int]) -> Dict[str, Any]:
+        record = {
+            'purpose': purpose,
+            'value': value,
+            'source': source,
+            'batch_id': batch_id,
+            'batch_fetched_at': self._batches.get(batch_id),
+            'drawn_at': datetime.now().isoformat()
+        }
+        self.provenance.append(record)
+        self.stats['draws_random_org' if source == SOURCE_RANDOM_ORG else 'draws_secrets'] += 1
+        return record
+
+    def randbelow(self, n: int, purpose: str = 'randbelow') -> Tuple[int, Dict[str, Any]]:
+        value, source, batch_id = self._draw_below(n)
+        return value, self._record(purpose, value, source, batch_id)
+
+    def choice(self, options: Sequence, purpose: str = 'choice') -> Tuple[Any, Dict[str, Any]]:
+        index, source, batch_id = self._draw_below(len(options))
+        record = self._record(purpose, options[index], source, batch_id)
+        logger.info(f"🎲 {purpose}: Index {index} -> {options[index]} (source: {source})")
+        return options[index], record
+
+    def randints(self, count: int, min_val: int, max_val: int, purpose: str = 'randints') -> Tuple[List[int], List[Dict[str, Any]]]:
+        values = []
+        records = []
+        for _ in range(count):
+            value, source, batch_id = self._draw_below(max_val - min_val + 1)
+            values.append(min_val + value)
+            records.append(self._record(purpose, min_val + value, source, batch_id))
+        return values, records
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'available_units': self.available,
+            'low_water': self.low_water,
+            'batch_size': self.batch_size,
+            **self.stats
+        }
+
+
+_entropy_pool = None
+
+
+def get_entropy_pool(config: Optional[Dict[str, Any]] = None) -> EntropyPool:
+    """
+    Prozessweiter Pool - wird beim ersten Aufruf mit den Settings aus config.json erstellt
+    """
+    global _entropy_pool
+    if _entropy_pool is None:
+        _entropy_pool = EntropyPool(**EntropyPool.settings(config))
+    return _entropy_pool
+
+
+async def close_entropy_pool():
+    global _entropy_pool
+    if _entropy_pool is not None:
+        await _entropy_pool.close()
+        _entropy_pool = None
@@ -0,0 +1,173 @@
+"""
+Wheel GIF Cache - Content-addressed Disk Cache für fertige Wheel GIFs
+Speichere als: wheel/gif_cache.py
+
+Key = sha256 über (Optionen, gewählter Index, Offset-Bucket, Umdrehungen, Render-Version,
+Map-Katalog-Version, Encoder-Settings).
+Die Dateien liegen unter einem begrenzten Verzeichnis; beim Überschreiten von max_mb werden
+die am längsten nicht genutzten Dateien gelöscht (LRU über mtime, Cache-Hits "touchen" die Datei).
+
+config.json:
+    "wheel_cache": {"enabled": true, "directory": "cache/wheels", "max_mb": 256}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'wheels')
+DEFAULT_MAX_MB = 256
+CACHED_EXTENSIONS = ('.gif', '.webp')
+
+
+class WheelGifCache:
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        cache_config = config.get('wheel_cache', {}) if config else {}
+        directory = cache_config.get('directory') or DEFAULT_DIRECTORY
+        if not os.path.isabs(directory):
+            directory = os.path.join(os.path.dirname(os.path.dirname(__file__)), directory)
+        return {
+            'enabled': bool(cache_config.get('enabled', True)),
+            'directory': directory,
+            'max_bytes': int(float(cache_config.get('max_mb', DEFAULT_MAX_MB)) * 1024 * 1024)
+        }
+
+    @staticmethod
+    def make_key(options: list, selected_index: int, offset_bucket: int, rotation_count: int,
+                 encoder: Optional[Dict[str, Any]] = None) -> str:
+        # Lazy Imports: Versionen gehören zum Key, sollen aber kein PIL beim Import ziehen
+        from .wheel_renderer import RENDER_VERSION
+        from .wheel_generator import OFFSET_BUCKETS
+        from .config_loader import WheelConfigLoader
+
+        payload = json.dumps({
+            'options': [str(option) for option in options],
+            'selected': selected_index,
+            'offset_bucket': offset_bucket,
+            'offset_buckets': OFFSET_BUCKETS,
+            'rotations': rotation_count,
+            'render_version': RENDER_VERSION,
+            'map_catalog_version': WheelConfigLoader.catalog_version(),
+            'encoder': encoder or {}
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, extension: str = 'gif') -> str:
+        return os.path.join(self.directory, f"{key}.{extension}")
+
+    def get_path(self, key: str, extension: str = 'gif') -> Optional[str]:
+        """
+        Pfad der gecachten Datei oder None. Ein Treffer aktualisiert die mtime (LRU)
+        """
+        path = self._path(key, extension)
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"Could not touch cached wheel GIF {path}: {e}")
+
+        self.hits += 1
+        return path
+
+    def put(self, key: str, data: bytes, extension: str = 'gif') -> str:
+        """
+        Atomares Schreiben (tmp + os.replace), danach ggf. LRU Eviction
+        """
+        path = self._path(key, extension)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+        return path
+
+    def _entries(self) -> List[os.DirEntry]:
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if entry.is_file() and entry.name.endswith(CACHED_EXTENSIONS)]
+
+    def evict(self) -> int:
+        entries = self._entries()
+        stats = {entry.path: entry.stat() for entry in entries}
+        total_bytes = sum(stat.st_size for stat in stats.values())
+        if total_bytes <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for path, stat in sorted(stats.items(), key=lambda item: item[1].st_mtime):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= stat.st_size
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not evict cached wheel GIF {path}: {e}")
+
+        self.evictions += removed
+        logger.info(f"🧹 Wheel GIF cache: evicted {removed} files ({total_bytes / 1024 / 1024:.1f}MB left)")
+        return removed
+
+    def clear(self) -> int:
+        removed = 0
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        entries = self._entries()
+        return {
+            'directory': self.directory,
+            'files': len(entries),
+            'size_mb': round(sum(entry.stat().st_size for entry in entries) / 1024 / 1024, 1),
+            'max_mb': round(self.max_bytes / 1024 / 1024, 1),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+_gif_cache = None
+_gif_cache_configured = False
+
+
+def get_gif_cache(config: Optional[Dict[str, Any]] = None) -> Optional[WheelGifCache]:
+    """
+    Prozessweiter Cache - None wenn in config.json deaktiviert
+    """
+    global _gif_cache, _gif_cache_configured
+    if not _gif_cache_configured:
+        settings = WheelGifCache.settings(config)
+        if settings['enabled']:
+            try:
+                _gif_cache = WheelGifCache(settings['directory'], settings['max_bytes'])
+            except OSError as e:
+                logger.error(f"Wheel GIF cache disabled - directory not usable: {e}")
+        _gif_cache_configured = True
+    return _gif_cache
@@ -0,0 +1,213 @@
+"""
+Wheel Animation Encoder - kompakte GIFs mit globaler Palette, Frame-Deltas und Byte-Budget
+Speichere als: wheel/gif_encoder.py
+
+'pillow':  bisheriges Verhalten (jeder Frame wird einzeln quantisiert)
+'compact': eine adaptive Palette mit PALETTE_COLORS Farben für alle Frames (6-Bit LZW-Codes
+           statt 8 Bit - die Frames bestehen aus wenigen Flächenfarben plus Text-Kanten),
+           unveränderte Pixel werden transparent (disposal=1, der Writer schneidet jeden
+           Frame auf die geänderte Bounding Box zu).
+           Liegt das Ergebnis über max_bytes, werden erst Spin-Frames ausgedünnt, dann die
+           Auflösung reduziert.
+Optional animiertes WebP (format 'webp'), falls Pillow mit WebP-Support gebaut ist.
+
+config.json (Teil von "wheel_render"):
+    "encoder": "compact", "format": "gif", "max_bytes": 4000000, "backend": "pillow"
+"""
+
+from PIL import Image, ImageChops, features
+import io
+import logging
+from typing import Dict, Any, List, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+ENCODER_PILLOW = 'pillow'
+ENCODER_COMPACT = 'compact'
+DEFAULT_MAX_BYTES = 4_000_000
+PALETTE_COLORS = 32
+TRANSPARENT_INDEX = PALETTE_COLORS
+PALETTE_SAMPLE_FRAMES = 6
+MIN_SCALE = 0.5
+
+_LANCZOS = getattr(Image, 'Resampling', Image).LANCZOS
+_MEDIANCUT = getattr(Image, 'Quantize', Image).MEDIANCUT
+_NO_DITHER = getattr(Image, 'Dither', Image).NONE
+
+
+def encoder_settings(render_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Normalisiert die Encoder-/Backend-Settings (auch Teil des GIF Cache Keys)"""
+    render_config = render_config or {}
+    output_format = str(render_config.get('format', 'gif')).lower()
+    if output_format not in ('gif', 'webp'):
+        logger.warning(f"Unknown wheel output format '{output_format}', using 'gif'")
+        output_format = 'gif'
+    return {
+        'encoder': render_config.get('encoder', ENCODER_COMPACT),
+        'format': output_format,
+        'max_bytes': int(render_config.get('max_bytes', DEFAULT_MAX_BYTES)),
+        'backend': render_config.get('backend', 'pillow')
+    }
+
+
+class WheelEncoder:
+
+    @staticmethod
+    def encode(frames: List[Image.Image], durations: List[int], settings: Optional[Dict[str, Any]] = None) -> Tuple[bytes, str]:
+        """
+        Rückgabe: (bytes, extension)
+        """
+        settings = settings or encoder_settings(None)
+
+        if settings['format'] == 'webp':
+            if features.check('webp_anim'):
+                return WheelEncoder.encode_webp(frames, durations), 'webp'
+            logger.warning("Pillow has no animated WebP support - falling back to GIF")
+
+        if settings['encoder'] != ENCODER_COMPACT:
+            return WheelEncoder.encode_pillow(frames, durations), 'gif'
+
+        return WheelEncoder.encode_within_budget(frames, durations, settings['max_bytes']), 'gif'
+
+    @staticmethod
+    def encode_pillow(frames: List[Image.Image], durations: List[int]) -> bytes:
+        buffer = io.BytesIO()
+        frames[0].save(
+            buffer,
+            format='GIF',
+            save_all=True,
+            append_images=frames[1:],
+            duration=durations,
+            loop=0
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def encode_webp(frames: List[Image.Image], durations: List[int], quality: int = 80) -> bytes:
+        buffer = io.BytesIO()
+        frames[0].save(
+            buffer,
+            format='WEBP',
+            save_all=True,
+            append_images=frames[1:],
+            duration=durations,
+            loop=0,
+            quality=quality,
+            method=4
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def encode_within_budget(frames: List[Image.Image], durations: List[int], max_bytes: int) -> bytes:
+        """
+        Kompaktes GIF; bei Überschreitung von max_bytes erst jeden zweiten Spin-Frame weglassen,
+        dann die Auflösung in Schritten bis MIN_SCALE reduzieren
+        """
+        data = WheelEncoder.encode_compact(frames, durations)
+        base_frames, step_durations, scale = frames, durations, 1.0
+
+        while len(data) > max_bytes:
+            if len(base_frames) > 25:
+                base_frames, step_durations = WheelEncoder.subsample(base_frames, step_durations)
+            elif scale > MIN_SCALE:
+                scale = max(MIN_SCALE, round(scale - 0.125, 3))
+            else:
+                logger.warning(f"⚠️ Wheel GIF still {len(data)} bytes at minimum size (budget {max_bytes})")
+                break
+
+            # Immer von den Original-Frames skalieren, nicht schrittweise
+            data = WheelEncoder.encode_compact(WheelEncoder.resize(base_frames, scale), step_durations)
+            logger.debug(f"📉 Wheel GIF budget step: {len(base_frames)} frames, scale {scale} -> {len(data)} bytes")
+
+        return data
+
+    @staticmethod
+    def subsample(frames: List[Image.Image], durations: List[int]) -> Tuple[List[Image.Image], List[int]]:
+        """
+        Jeden zweiten Frame weglassen - die Dauer wandert auf den behaltenen Frame, der letzte
+        (Ergebnis-)Frame bleibt immer erhalten
+        """
+        kept_frames = []
+        kept_durations = []
+        for i, (frame, duration) in enumerate(zip(frames[:-1], durations[:-1])):
+            if i % 2 == 0:
+                kept_frames.append(frame)
+                kept_durations.append(duration)
+            else:
+                kept_durations[-1] += duration
+
+        kept_frames.append(frames[-1])
+        kept_durations.append(durations[-1])
+        return kept_frames, kept_durations
+
+    @staticmethod
+    def resize(frames: List[Image.Image], scale: float) -> List[Image.Image]:
+        width, height = frames[0].size
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+        if frames[0].size == target:
+            return frames
+
+        # Wiederverwendete Frames (gleiches Objekt) nur einmal skalieren
+        resized = {}
+        for frame in frames:
+            if id(frame) not in resized:
+                resized[id(frame)] = frame.resize(target, _LANCZOS)
+        return [resized[id(frame)] for frame in frames]
+
+    @staticmethod
+    def build_palette(frames: List[Image.Image]) -> Image.Image:
+        """
+        Eine adaptive Palette (PALETTE_COLORS Farben + Transparenz-Index) aus einer Stichprobe der Frames
+        """
+        step = max(1, len(frames) // PALETTE_SAMPLE_FRAMES)
+        samples = frames[::step][:PALETTE_SAMPLE_FRAMES] + [frames[-1]]
+
+        width, height = frames[0].size
+        sheet = Image.new('RGB', (width, height * len(samples)))
+        for i, frame in enumerate(samples):
+            sheet.paste(frame.convert('RGB'), (0, height * i))
+
+        return sheet.quantize(colors=PALETTE_COLORS, method=_MEDIANCUT)
+
+    @staticmethod
+    def encode_compact(frames: List[Image.Image], durations: List[int]) -> bytes:
+        palette_image = WheelEncoder.build_palette(frames)
+        palette = palette_image.getpalette()
+
+        quantized_cache = {}
+        encoded = []
+        previous_indices = None
+
+        for frame in frames:
+            indexed = quantized_cache.get(id(frame))
+            if indexed is None:
+                indexed = quantized_cache[id(frame)] = frame.convert('RGB').quantize(palette=palette_image, dither=_NO_DITHER)
+
+            # Palette-Indizes als 'L' Bild, damit ImageChops direkt vergleichen kann
+            indices = Image.frombytes('L', indexed.size, indexed.tobytes())
+
+            if previous_indices is None:
+                delta = indices
+            else:
+                changed = ImageChops.difference(indices, previous_indices).point(lambda value: 255 if value else 0)
+                delta = Image.new('L', indices.size, TRANSPARENT_INDEX)
+                delta.paste(indices, mask=changed)
+
+            output = Image.frombytes('P', delta.size, delta.tobytes())
+            output.putpalette(palette)
+            encoded.append(output)
+            previous_indices = indices
+
+        buffer = io.BytesIO()
+        encoded[0].save(
+            buffer,
+            format='GIF',
+            save_all=True,
+            append_images=encoded[1:],
+            duration=durations,
+            loop=0,
+            transparency=TRANSPARENT_INDEX,
+            disposal=1,
+            optimize=False
+        )
+        return buffer.getvalue()
@@ -2,12 +2,12 @@
 Match Wheel Service
 """
 
+import asyncio
 import discord
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 from .config_loader import WheelConfigLoader
-from .random_service import RandomService
-from .wheel_generator import WheelGenerator
+from .random_service import RandomService, SPIN_RANDOM_NUMBERS
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ class MatchWheelService:
         
         
         available_maps = WheelConfigLoader.load_maps()
-        selected_map = await RandomService.get_true_random_choice(available_maps)
+        selected_map = await RandomService.get_true_random_choice(available_maps, purpose='map')
         
         logger.info(f"🗺️ Selected map: {selected_map}")
         
@@ -30,7 +30,7 @@ class MatchWheelService:
         available_sides = team_sides_config['team1_options']  
         
         
-        team1_side = await RandomService.get_true_random_choice(available_sides)
+        team1_side = await RandomService.get_true_random_choice(available_sides, purpose='team1_side')
         
         
         if len(available_sides) == 2:
@@ -38,16 +38,19 @@ class MatchWheelService:
         else:
             
             remaining_sides = [side for side in available_sides if side != team1_side]
-            team2_side = await RandomService.get_true_random_choice(remaining_sides)
+            team2_side = await RandomService.get_true_random_choice(remaining_sides, purpose='team2_side')
         
         logger.info(f"🔴 Team sides: {team1_name}={team1_side}, {team2_name}={team2_side}")
         
+        # Spin-Parameter beider Wheels in einem Batch ziehen
+        spin_numbers = await RandomService.get_true_random_numbers(2 * SPIN_RANDOM_NUMBERS, 0, 1000, purpose='wheel_spins')
         
         map_wheel_data = {
             'type': 'map',
             'options': available_maps,
             'selected': selected_map,
-            'title': 'Map Selection'
+            'title': 'Map Selection',
+            'spin_numbers': spin_numbers[:SPIN_RANDOM_NUMBERS]
         }
         
         sides_wheel_data = {
@@ -55,6 +58,7 @@ class MatchWheelService:
             'options': available_sides,
             'selected': team1_side,
             'title': f'Team Side for {team1_name}',
+            'spin_numbers': spin_numbers[SPIN_RANDOM_NUMBERS:],
             'team1_name': team1_name,
             'team2_name': team2_name,
             'team2_side': team2_side
@@ -63,59 +67,89 @@ class MatchWheelService:
         return selected_map, team1_side, team2_side, map_wheel_data, sides_wheel_data
     
     @staticmethod
-    async def create_map_wheel_gif(wheel_data: Dict[str, Any]) -> discord.File:
+    async def create_map_wheel_gif(wheel_data: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> discord.File:
         
         try:
             logger.info(f"🎨 Creating map wheel GIF for: {wheel_data['selected']}")
             
-            gif_buffer = await WheelGenerator.create_spinning_wheel_gif(
+            # Lazy Import: PIL erst beim ersten Rendern laden
+            from .wheel_generator import WheelGenerator
+            
+            buffer, extension = await WheelGenerator.create_spinning_wheel(
                 wheel_data['options'], 
-                wheel_data['selected']
+                wheel_data['selected'],
+                config,
+                random_numbers=wheel_data.get('spin_numbers')
             )
             
-            return discord.File(gif_buffer, filename='map_selection.gif')
+            # Bei Cache-Hit ist buffer ein Dateipfad - discord.File streamt die Datei direkt
+            return discord.File(buffer, filename=f'map_selection.{extension}')
             
         except Exception as e:
             logger.error(f"Error creating map wheel GIF: {e}")
             raise
     
     @staticmethod
-    async def create_sides_wheel_gif(wheel_data: Dict[str, Any]) -> discord.File:
+    async def create_sides_wheel_gif(wheel_data: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> discord.File:
         
         try:
             logger.info(f"🎨 Creating sides wheel GIF for: {wheel_data['selected']}")
             
-            gif_buffer = await WheelGenerator.create_spinning_wheel_gif(
+            # Lazy Import: PIL erst beim ersten Rendern laden
+            from .wheel_generator import WheelGenerator
+            
+            buffer, extension = await WheelGenerator.create_spinning_wheel(
                 wheel_data['options'], 
-                wheel_data['selected']
+                wheel_data['selected'],
+                config,
+                random_numbers=wheel_data.get('spin_numbers')
             )
             
-            return discord.File(gif_buffer, filename='sides_selection.gif')
+            # Bei Cache-Hit ist buffer ein Dateipfad - discord.File streamt die Datei direkt
+            return discord.File(buffer, filename=f'sides_selection.{extension}')
             
         except Exception as e:
             logger.error(f"Error creating sides wheel GIF: {e}")
             raise
     
     @staticmethod
-    def create_map_selection_embed(wheel_data: Dict[str, Any]) -> discord.Embed:
+    async def create_wheel_files(map_wheel_data: Dict[str, Any], sides_wheel_data: Dict[str, Any],
+                                 config: Optional[Dict[str, Any]] = None) -> Tuple[Optional[discord.File], Optional[discord.File]]:
+        """
+        Rendert Map- und Sides-Wheel parallel (je ein Job im Render Pool). Fehlgeschlagene Wheels sind None.
+        """
+        map_file, sides_file = await asyncio.gather(
+            MatchWheelService.create_map_wheel_gif(map_wheel_data, config),
+            MatchWheelService.create_sides_wheel_gif(sides_wheel_data, config),
+            return_exceptions=True
+        )
+        
+        # Fehler wurden bereits in create_*_wheel_gif geloggt
+        return (
+            None if isinstance(map_file, BaseException) else map_file,
+            None if isinstance(sides_file, BaseException) else sides_file
+        )
+    
+    @staticmethod
+    def create_map_selection_embed(wheel_data: Dict[str, Any], filename: str = 'map_selection.gif') -> discord.Embed:
         
         embed = discord.Embed(
             title="🗺️ Map Selection",
             color=0x00FF00
         )
-        embed.set_image(url="attachment://map_selection.gif")
+        embed.set_image(url=f"attachment://{filename}")
         embed.set_footer(text="Powered by random.org • True randomness guaranteed")
         
         return embed
     
     @staticmethod
-    def create_sides_selection_embed(wheel_data: Dict[str, Any]) -> discord.Embed:
+    def create_sides_selection_embed(wheel_data: Dict[str, Any], filename: str = 'sides_selection.gif') -> discord.Embed:
         
         embed = discord.Embed(
             title=f"🔴 Team Selection for {wheel_data['team1_name']}",
             color=0xFF0000
         )
-        embed.set_image(url="attachment://sides_selection.gif")
+        embed.set_image(url=f"attachment://{filename}")
         embed.set_footer(text="Powered by random.org • True randomness guaranteed")
         
         return embed
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+NumPy Wheel Renderer - vektorisiertes Backend (optional)
+Speichere als: wheel/numpy_renderer.py
+
+Einmalig pro Canvas: Polar-Lookup (Textur-Index je Pixel, int32) und die deckenden Overlay-Pixel.
+Einmalig pro (Optionen, Highlight): die fertige Scheibe aus WheelRenderer.disc_layer wird in eine
+Polar-Textur (Radius x Winkel in ANGLE_STEP-Schritten, ein RGBX-uint32 pro Eintrag) umgelegt.
+Eine Rotation ist damit nur eine Verschiebung der Winkel-Spalte - pro Frame ein Integer-Add, ein
+Gather (LUT) und die Overlay-Zuweisung, keine Float-Blends und kein bilineares Sampling.
+
+Aktivierung in config.json: "wheel_render": {"backend": "numpy"} - ohne NumPy wird
+automatisch das Pillow Backend verwendet. Vergleich: python benchmarks/wheel_backend_benchmark.py
+"""
+
+from PIL import Image
+from functools import lru_cache
+import logging
+from typing import Tuple
+
+from .wheel_renderer import WheelRenderer, SIZE, CENTER, RADIUS, ANGLE_STEP, quantize_angle
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Winkel-Spalten der Polar-Textur: eine pro ANGLE_STEP, Rotationen sind dadurch ganzzahlige Verschiebungen
+ANGLE_BINS = int(round(360 / ANGLE_STEP))
+# Radius bis einschließlich der äußeren Segment-Outline (Rest deckt Hintergrund + Overlay-Rand ab)
+DISC_RADIUS = RADIUS + 2
+# Eine Textur ~2.9 MB (Spin + Result-Frame = 2 Texturen pro Wheel)
+TEXTURE_CACHE_SIZE = 8
+
+
+class NumpyWheelRenderer:
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def polar_lookup():
+        """
+        Textur-Index je Canvas-Pixel (int32, flach) - einmal pro Prozess. Zeigt in die doppelt breite
+        Polar-Textur, + Verschiebung ergibt die Rotation ohne Modulo. Pixel außerhalb der Scheibe zeigen
+        auf die Hintergrund-Zeile (Radius DISC_RADIUS + 1)
+        """
+        # Pixelmitten wie Image.rotate (Pixel x deckt [x, x+1) ab, Drehzentrum liegt auf einer Pixelecke)
+        coordinates = np.arange(SIZE, dtype=np.float64) + 0.5 - CENTER
+        dy, dx = np.meshgrid(coordinates, coordinates, indexing='ij')
+        radius = np.hypot(dx, dy)
+
+        # Bildkoordinaten (y nach unten): Winkel laufen im Uhrzeigersinn wie bei ImageDraw.pieslice
+        angle = np.degrees(np.arctan2(dy, dx)) % 360
+        radius_index = np.minimum(np.rint(radius), DISC_RADIUS + 1).astype(np.int32)
+        angle_index = np.rint(angle / ANGLE_STEP).astype(np.int32) % ANGLE_BINS
+
+        return (radius_index * (2 * ANGLE_BINS) + angle_index).ravel()
+
+    @staticmethod
+    @lru_cache(maxsize=TEXTURE_CACHE_SIZE)
+    def polar_texture(options: Tuple[str, ...], highlight_index: int = -1):
+        """
+        Scheibe als Polar-Textur, ein uint32 (RGBX) pro Eintrag: DISC_RADIUS + 2 Zeilen x 2 * ANGLE_BINS
+        Spalten, letzte Zeile = Hintergrund - gecacht, nicht verändern
+        """
+        disc = np.asarray(WheelRenderer.disc_layer(options, highlight_index).convert('RGBX'), dtype=np.uint8)
+
+        radius = np.arange(DISC_RADIUS + 2, dtype=np.float64)[:, None]
+        theta = np.radians(np.arange(ANGLE_BINS, dtype=np.float64) * ANGLE_STEP)[None, :]
+        src_x = np.clip(np.floor(CENTER + radius * np.cos(theta)).astype(np.int32), 0, SIZE - 1)
+        src_y = np.clip(np.floor(CENTER + radius * np.sin(theta)).astype(np.int32), 0, SIZE - 1)
+
+        texture = disc[src_y, src_x]
+        texture[-1] = disc[0, 0]
+        # Zweimal nebeneinander: Index + Verschiebung bleibt ohne Modulo innerhalb der Zeile
+        texture = np.concatenate([texture, texture], axis=1)
+        return np.ascontiguousarray(texture).view(np.uint32).ravel()
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def overlay_pixels():
+        """
+        (Pixel-Index, RGBX-Wert) der deckenden Overlay-Pixel. Das Overlay wird ohne Antialiasing gezeichnet,
+        Alpha ist also 0 oder 255 - Einfügen ist eine reine Zuweisung statt eines Alpha-Blends
+        """
+        overlay = WheelRenderer.overlay_layer()
+        opaque = np.flatnonzero(np.asarray(overlay.getchannel('A')).ravel())
+        values = np.ascontiguousarray(np.asarray(overlay.convert('RGBX'), dtype=np.uint8)).view(np.uint32).ravel()
+        return opaque, values[opaque]
+
+    @staticmethod
+    def render_frame(options: Tuple[str, ...], rotation_angle: float = 0, highlight_index: int = -1) -> Image.Image:
+        """
+        Gleiche Signatur wie WheelRenderer.render_frame
+        """
+        options = tuple(str(option) for option in options)
+        texture_index = NumpyWheelRenderer.polar_lookup()
+        texture = NumpyWheelRenderer.polar_texture(options, highlight_index)
+
+        # Pixel bei Winkel a zeigt nach der Rotation den Scheiben-Inhalt bei a - rotation
+        shift = ANGLE_BINS - int(round(quantize_angle(rotation_angle) / ANGLE_STEP)) % ANGLE_BINS
+        frame = np.take(texture, texture_index + shift)
+
+        # Statisches Overlay (Rand, Pointer, Center)
+        overlay_index, overlay_values = NumpyWheelRenderer.overlay_pixels()
+        frame[overlay_index] = overlay_values
+
+        return Image.frombytes('RGB', (SIZE, SIZE), frame, 'raw', 'RGBX')
+
+    @staticmethod
+    def warm_up():
+        NumpyWheelRenderer.polar_lookup()
+        NumpyWheelRenderer.overlay_pixels()
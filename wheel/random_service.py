@@ -2,52 +2,27 @@
 Random Service
 """
 
-import aiohttp
-import random
 import logging
+from .entropy_pool import get_entropy_pool
 
 logger = logging.getLogger(__name__)
 
+# Zufallszahlen pro Wheel-Spin (Offset-Bucket + Umdrehungen, siehe WheelGenerator.spin_variant)
+SPIN_RANDOM_NUMBERS = 2
+
 class RandomService:
     
+    # Draws kommen aus dem gepufferten Entropy Pool (random.org, sofortiger Fallback: secrets) -
+    # kein HTTP Request pro Aufruf mehr, siehe entropy_pool.py
     
     @staticmethod
-    async def get_true_random_choice(options: list):
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                
-                url = f"https://www.random.org/integers/?num=1&min=0&max={len(options)-1}&col=1&base=10&format=plain&rnd=new"
-                
-                async with session.get(url, timeout=5) as response:
-                    if response.status == 200:
-                        random_index = int(await response.text())
-                        logger.info(f"✅ True Random from random.org: Index {random_index} -> {options[random_index]}")
-                        return options[random_index]
-                    else:
-                        logger.warning(f"❌ random.org error: Status {response.status}")
-                        return random.choice(options)
-        except Exception as e:
-            logger.warning(f"❌ random.org not reachable: {e}")
-            logger.info("🔄 Fallback to local random generator")
-            return random.choice(options)
+    async def get_true_random_choice(options: list, purpose: str = 'choice'):
+        selected, _ = get_entropy_pool().choice(options, purpose=purpose)
+        return selected
     
     @staticmethod
-    async def get_true_random_numbers(count: int, min_val: int, max_val: int) -> list:
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://www.random.org/integers/?num={count}&min={min_val}&max={max_val}&col=1&base=10&format=plain&rnd=new"
-                
-                async with session.get(url, timeout=5) as response:
-                    if response.status == 200:
-                        numbers_text = await response.text()
-                        numbers = [int(line.strip()) for line in numbers_text.strip().split('\n')]
-                        logger.info(f"✅ True Random numbers from random.org: {numbers}")
-                        return numbers
-                    else:
-                        logger.warning(f"❌ random.org error for numbers: Status {response.status}")
-                        return [random.randint(min_val, max_val) for _ in range(count)]
-        except Exception as e:
-            logger.warning(f"❌ random.org not reachable for numbers: {e}")
-            return [random.randint(min_val, max_val) for _ in range(count)]
\ No newline at end of file
+    async def get_true_random_numbers(count: int, min_val: int, max_val: int, purpose: str = 'numbers') -> list:
+        numbers, records = get_entropy_pool().randints(count, min_val, max_val, purpose=purpose)
+        sources = sorted({record['source'] for record in records})
+        logger.info(f"✅ Random numbers ({', '.join(sources)}): {numbers}")
+        return numbers
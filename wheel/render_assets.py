@@ -0,0 +1,136 @@
+"""
+Render Assets - Font- und Label-Sprite-Cache für das Wheel Rendering
+Speichere als: wheel/render_assets.py
+
+- Die Font-Datei wird genau einmal gesucht (fonts/ Ordner -> System-Fonts -> Default)
+  und das Ergebnis im Log gemeldet
+- Font-Objekte sind pro (Pfad, Größe) memoisiert
+- Label-Sprites (Text mit Stroke, noch unrotiert) sind pro (Text, Font, Größe, Stroke) vorgerastert
+- warm_up() lädt Font + Sprites für den aktuellen Map Pool vorab
+"""
+
+from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+import logging
+import os
+from typing import Optional, Iterable, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Pfad zum fonts/ Ordner (neben main.py)
+FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts')
+CUSTOM_FONT_FILES = (
+    'arial.ttf',
+    'Arial.ttf',
+    'arial_bold.ttf',
+    'helvetica.ttf',
+    'Roboto-Regular.ttf',
+    'OpenSans-Regular.ttf'
+)
+SYSTEM_FONTS = (
+    # Windows (Pillow sucht im Windows Font-Ordner)
+    'arial.ttf',
+    # macOS
+    '/System/Library/Fonts/Arial.ttf',
+    # Linux
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+    '/usr/share/fonts/TTF/arial.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf'
+)
+
+LABEL_SIZE = (300, 80)
+LABEL_FONT_SIZE = 16
+LABEL_STROKE_WIDTH = 3
+SPRITE_CACHE_SIZE = 256
+
+
+class RenderAssets:
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def font_path() -> Optional[str]:
+        """
+        Einmalige Font-Suche. None = Pillow Default Font
+        """
+        candidates = [os.path.join(FONTS_DIR, font_file) for font_file in CUSTOM_FONT_FILES]
+        candidates = [path for path in candidates if os.path.exists(path)]
+        if not candidates:
+            logger.warning(f"No custom fonts found in {FONTS_DIR}")
+        candidates.extend(SYSTEM_FONTS)
+
+        for candidate in candidates:
+            try:
+                ImageFont.truetype(candidate, LABEL_FONT_SIZE)
+            except Exception:
+                continue
+            source = 'fonts/' if candidate.startswith(FONTS_DIR) else 'system'
+            logger.info(f"🔤 Wheel font resolved: {candidate} ({source})")
+            return candidate
+
+        logger.warning("🔤 No TrueType font found - using default font, text may be small!")
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def load_font(path: Optional[str], size: int):
+        if path is None:
+            return ImageFont.load_default()
+        return ImageFont.truetype(path, size)
+
+    @staticmethod
+    def get_font(size: int = 20):
+        return RenderAssets.load_font(RenderAssets.font_path(), size)
+
+    @staticmethod
+    @lru_cache(maxsize=SPRITE_CACHE_SIZE)
+    def label_sprite(text: str, font_path: Optional[str], font_size: int = LABEL_FONT_SIZE,
+                     stroke_width: int = LABEL_STROKE_WIDTH) -> Image.Image:
+        """
+        Vorgerasterter, unrotierter Label-Sprite (weiß, schwarzer Stroke) - gecacht, nicht verändern
+        """
+        sprite = Image.new('RGBA', LABEL_SIZE, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+        draw.text((LABEL_SIZE[0] // 2, LABEL_SIZE[1] // 2), text, fill='#FFFFFF',
+                  font=RenderAssets.load_font(font_path, font_size),
+                  stroke_width=stroke_width, stroke_fill='#000000', anchor='mm')
+        return sprite
+
+    @staticmethod
+    def get_label_sprite(text: str) -> Image.Image:
+        return RenderAssets.label_sprite(str(text), RenderAssets.font_path())
+
+    @staticmethod
+    def warm_up(labels: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Font auflösen + Sprites vorrastern (z.B. alle Map- und Side-Namen)
+        """
+        RenderAssets.get_font(LABEL_FONT_SIZE)
+        labels = list(dict.fromkeys(str(label) for label in labels))
+        for label in labels:
+            RenderAssets.get_label_sprite(label)
+
+        return {
+            'font': RenderAssets.font_path() or 'default',
+            'sprites': len(labels)
+        }
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        return {
+            'font': RenderAssets.font_path() or 'default',
+            'fonts': RenderAssets.load_font.cache_info().currsize,
+            'sprites': RenderAssets.label_sprite.cache_info().currsize,
+            'sprite_hits': RenderAssets.label_sprite.cache_info().hits
+        }
+
+
+def wheel_labels() -> list:
+    """Alle Labels des aktuellen Map Pools (Map-Namen + Sides)"""
+    from .config_loader import WheelConfigLoader
+
+    catalog = WheelConfigLoader.catalog()
+    labels = list(catalog.maps)
+    for sides in catalog.sides.values():
+        labels.extend(sides)
+    return labels
@@ -0,0 +1,199 @@
+"""
+Wheel Render Pool - GIF Rendering außerhalb des Event Loops
+Speichere als: wheel/render_pool.py
+
+Pillow-Rendering + GIF Encoding laufen in einem ProcessPoolExecutor mit vorgewärmten
+Workern (Fonts + statische Layer vorgeladen). Ist der Pool ausgelastet (Queue-Limit)
+oder überschreitet ein Job das Timeout, wird ein statisches PNG des Ergebnisses geliefert.
+
+config.json:
+    "wheel_render": {"workers": 2, "max_queue_depth": 4, "timeout_seconds": 20}
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE_DEPTH = 4
+DEFAULT_TIMEOUT_SECONDS = 20.0
+
+
+def _init_worker(encoder: Optional[Dict[str, Any]] = None):
+    """Wärmt einen Worker vor: Font + Label-Sprites + Hintergrund/Overlay Layer (+ Polar-Lookup beim NumPy Backend)"""
+    from .render_assets import RenderAssets, wheel_labels
+    from .wheel_renderer import WheelRenderer, BACKEND_NUMPY
+
+    RenderAssets.warm_up(wheel_labels())
+    WheelRenderer.background_layer()
+    WheelRenderer.overlay_layer()
+
+    if (encoder or {}).get('backend') == BACKEND_NUMPY:
+        from .numpy_renderer import NumpyWheelRenderer, NUMPY_AVAILABLE
+        if NUMPY_AVAILABLE:
+            NumpyWheelRenderer.warm_up()
+
+
+def _ping() -> bool:
+    return True
+
+
+def _render_animation_job(options: tuple, selected_index: int, total_rotation: float, final_angle: float,
+                          encoder: Dict[str, Any]) -> Tuple[bytes, str]:
+    from .wheel_renderer import WheelRenderer
+
+    buffer, extension = WheelRenderer.render_animation(list(options), selected_index, total_rotation, final_angle, encoder)
+    return buffer.getvalue(), extension
+
+
+def render_static_png(options: tuple, selected_index: int, final_angle: float) -> io.BytesIO:
+    """Fallback: nur das Ergebnisbild (Gewinner hervorgehoben) als PNG"""
+    from .wheel_renderer import WheelRenderer
+
+    frame = WheelRenderer.render_frame(tuple(options), final_angle, highlight_index=selected_index)
+    buffer = io.BytesIO()
+    frame.save(buffer, format='PNG', optimize=True)
+    buffer.seek(0)
+    return buffer
+
+
+class WheelRenderPool:
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH,
+                 timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS, encoder: Optional[Dict[str, Any]] = None):
+        self.workers = max(1, workers)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.timeout_seconds = timeout_seconds
+        # Encoder-Settings aus "wheel_render" (encoder/format/max_bytes/backend) - siehe gif_encoder.py
+        self.encoder = encoder or {}
+        self._executor = None
+        self.pending = 0
+        self.stats = {'rendered': 0, 'fallback_saturated': 0, 'fallback_timeout': 0, 'fallback_error': 0}
+
+    @staticmethod
+    def settings(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        render_config = config.get('wheel_render', {}) if config else {}
+        return {
+            'workers': int(render_config.get('workers', DEFAULT_WORKERS)),
+            'max_queue_depth': int(render_config.get('max_queue_depth', DEFAULT_MAX_QUEUE_DEPTH)),
+            'timeout_seconds': float(render_config.get('timeout_seconds', DEFAULT_TIMEOUT_SECONDS)),
+            'encoder': {key: render_config[key] for key in ('encoder', 'format', 'max_bytes', 'backend') if key in render_config}
+        }
+
+    def start(self):
+        """
+        Erstellt den Pool und startet alle Worker sofort (statt beim ersten Match)
+        """
+        if self._executor is not None:
+            return
+
+        # 'spawn' statt fork: der Bot-Prozess hat laufende Threads + offene Sockets
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.encoder,)
+        )
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+        logger.info(f"🎨 Wheel render pool started ({self.workers} workers, queue limit {self.max_queue_depth})")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def render(self, options: list, selected_index: int, total_rotation: float, final_angle: float) -> Tuple[io.BytesIO, str]:
+        """
+        Rendert die Spin-Animation im Pool. Rückgabe: (buffer, 'gif'|'webp') oder bei Fallback (buffer, 'png')
+        """
+        options = tuple(str(option) for option in options)
+
+        if self.pending >= self.max_queue_depth:
+            self.stats['fallback_saturated'] += 1
+            logger.warning(f"⚠️ Wheel render pool saturated ({self.pending} pending) - sending static image")
+            return await self._render_fallback(options, selected_index, final_angle)
+
+        self.start()
+        self.pending += 1
+        try:
+            future = self._executor.submit(_render_animation_job, options, selected_index, total_rotation, final_angle, self.encoder)
+        except BrokenProcessPool as e:
+            self.pending -= 1
+            logger.error(f"Wheel render pool broken, recreating: {e}")
+            self._executor = None
+            self.stats['fallback_error'] += 1
+            return await self._render_fallback(options, selected_index, final_angle)
+
+        # pending erst freigeben, wenn der Worker wirklich fertig ist (auch nach Timeout)
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: self._job_done(loop))
+
+        try:
+            data, extension = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=self.timeout_seconds)
+            self.stats['rendered'] += 1
+            return io.BytesIO(data), extension
+
+        except asyncio.TimeoutError:
+            self.stats['fallback_timeout'] += 1
+            logger.warning(f"⚠️ Wheel render job exceeded {self.timeout_seconds}s - sending static image")
+        except BrokenProcessPool as e:
+            logger.error(f"Wheel render pool broken, recreating: {e}")
+            self._executor = None
+            self.stats['fallback_error'] += 1
+        except Exception as e:
+            logger.error(f"Error rendering wheel GIF in pool: {e}")
+            self.stats['fallback_error'] += 1
+
+        return await self._render_fallback(options, selected_index, final_angle)
+
+    def _job_done(self, loop):
+        # Callback kommt aus dem Executor-Thread - Zähler nur im Event Loop anfassen
+        try:
+            loop.call_soon_threadsafe(self._decrement_pending)
+        except RuntimeError:
+            self._decrement_pending()
+
+    def _decrement_pending(self):
+        self.pending = max(0, self.pending - 1)
+
+    async def _render_fallback(self, options: tuple, selected_index: int, final_angle: float) -> Tuple[io.BytesIO, str]:
+        # Einzelbild im Thread - blockiert den Event Loop nicht
+        buffer = await asyncio.to_thread(render_static_png, options, selected_index, final_angle)
+        return buffer, 'png'
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'running': self._executor is not None,
+            'pending': self.pending,
+            'max_queue_depth': self.max_queue_depth,
+            **self.stats
+        }
+
+
+_render_pool = None
+
+
+def get_render_pool(config: Optional[Dict[str, Any]] = None) -> WheelRenderPool:
+    """
+    Prozessweiter Pool - wird beim ersten Aufruf mit den Settings aus config.json erstellt
+    """
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = WheelRenderPool(**WheelRenderPool.settings(config))
+    return _render_pool
+
+
+def shutdown_render_pool():
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown()
+        _render_pool = None
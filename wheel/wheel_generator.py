@@ -2,119 +2,42 @@
 Wheel Generator - FIXED: Font handling with custom fonts folder
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import math
+from PIL import Image
+import asyncio
 import io
 import logging
 import os
-from .random_service import RandomService
+from typing import Tuple, Dict, Any, List, Optional, Union
+from .random_service import RandomService, SPIN_RANDOM_NUMBERS
+from .wheel_renderer import WheelRenderer
+from .render_assets import RenderAssets
 
 logger = logging.getLogger(__name__)
 
+# Stufen für den Zufalls-Offset innerhalb des Segments (Teil des GIF Cache Keys)
+OFFSET_BUCKETS = 8
+# Mögliche Anzahl zusätzlicher Umdrehungen (Teil des GIF Cache Keys)
+SPIN_ROTATION_COUNTS = (4, 5, 6, 7)
+
+# Pre-Warm: Varianten pro (Wheel, Auswahl) - alle OFFSET_BUCKETS x SPIN_ROTATION_COUNTS wären 32 GIFs pro Auswahl
+PREWARM_VARIANTS_PER_SELECTION = 1
+# Anteil von wheel_cache.max_mb, den ein Pre-Warm höchstens belegt (Rest bleibt für Live-Spins)
+PREWARM_BUDGET_SHARE = 0.5
+
 class WheelGenerator:
 
     @staticmethod
     def get_font(size: int = 20):
         """
-        Lädt eine Font-Datei aus dem fonts/ Ordner oder fallback zu System-Fonts
+        Font aus dem fonts/ Ordner oder System-Fonts - einmal gesucht, pro Größe gecacht (render_assets.py)
         """
-        try:
-            # Pfad zum fonts/ Ordner (neben main.py)
-            fonts_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts')
-            
-            # Verschiedene Font-Dateien versuchen
-            font_files = [
-                'arial.ttf',
-                'Arial.ttf', 
-                'arial_bold.ttf',
-                'helvetica.ttf',
-                'Roboto-Regular.ttf',
-                'OpenSans-Regular.ttf'
-            ]
-            
-            # Versuche Font aus fonts/ Ordner zu laden
-            for font_file in font_files:
-                font_path = os.path.join(fonts_dir, font_file)
-                if os.path.exists(font_path):
-                    try:
-                        font = ImageFont.truetype(font_path, size)
-                        logger.debug(f"✅ Font loaded: {font_file} (Size: {size})")
-                        return font
-                    except Exception as e:
-                        logger.warning(f"Could not load {font_file}: {e}")
-                        continue
-            
-            logger.warning(f"No custom fonts found in {fonts_dir}")
-            
-        except Exception as e:
-            logger.warning(f"Error accessing fonts directory: {e}")
-        
-        # Fallback zu System-Fonts
-        try:
-            # Windows
-            font = ImageFont.truetype("arial.ttf", size)
-            logger.debug(f"✅ System font loaded: arial.ttf (Size: {size})")
-            return font
-        except:
-            try:
-                # macOS
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size)
-                logger.debug(f"✅ System font loaded: macOS Arial (Size: {size})")
-                return font
-            except:
-                try:
-                    # Linux - verschiedene Pfade versuchen
-                    linux_fonts = [
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-                        "/usr/share/fonts/TTF/arial.ttf",
-                        "/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf"
-                    ]
-                    
-                    for font_path in linux_fonts:
-                        if os.path.exists(font_path):
-                            try:
-                                font = ImageFont.truetype(font_path, size)
-                                logger.debug(f"✅ Linux system font loaded: {os.path.basename(font_path)} (Size: {size})")
-                                return font
-                            except:
-                                continue
-                    
-                    logger.warning("No Linux system fonts found, using default")
-                    
-                except:
-                    pass
-                
-                # Letzter Fallback - Default Font (aber mit Warnung)
-                logger.warning(f"Using default font - text may be small! Size parameter {size} ignored.")
-                return ImageFont.load_default()
+        return RenderAssets.get_font(size)
 
     @staticmethod
     def create_wheel_frame(options: list, rotation_angle: float = 0, show_winner: bool = False, selected_option: str = None) -> Image.Image:
-        size = 600
-        center = size // 2
-        radius = 250
-        
-        img = Image.new('RGB', (size, size), '#1a1a1a')
-        draw = ImageDraw.Draw(img)
-        
-        # FIXED: Größere Font mit verbessertem Handling
-        font = WheelGenerator.get_font(16)  # Größere Schrift für bessere Lesbarkeit
-        
-        colors = [
-            '#2C3E50',
-            '#8B0000',
-            '#34495E',
-            '#722F37',
-            '#1B2631',
-            '#A93226',
-            '#273746',
-            '#6C3483'
-        ]
-        
-        num_options = len(options)
-        angle_per_option = 360 / num_options
-        
+        """
+        Einzelner Frame - nutzt die gecachte Basis-Scheibe des WheelRenderer
+        """
         selected_index = -1
         if show_winner and selected_option:
             try:
@@ -122,116 +45,216 @@ class WheelGenerator:
             except ValueError:
                 pass
         
-        # Wheel Segmente zeichnen
-        for i, option in enumerate(options):
-            start_angle = i * angle_per_option + rotation_angle
-            end_angle = (i + 1) * angle_per_option + rotation_angle
-            
-            color = colors[i % len(colors)]
-            
-            if show_winner and i == selected_index:
-                color = '#DC143C'  # Highlight für Gewinner
-            
-            draw.pieslice([center-radius, center-radius, center+radius, center+radius], 
-                         start_angle, end_angle, fill=color, outline='#FFFFFF', width=3)
-        
-        # Text auf Segmente
-        for i, option in enumerate(options):
-            text_angle_deg = i * angle_per_option + angle_per_option / 2 + rotation_angle
-            text_angle_rad = math.radians(text_angle_deg)
-            
-            text_radius = radius * 0.6
-            text_x = center + text_radius * math.cos(text_angle_rad)
-            text_y = center + text_radius * math.sin(text_angle_rad)
-            
-            # FIXED: Größere Text-Area für bessere Lesbarkeit
-            text_img = Image.new('RGBA', (300, 80), (0, 0, 0, 0))
-            text_draw = ImageDraw.Draw(text_img)
-            
-            # FIXED: Stärkerer Stroke für bessere Lesbarkeit
-            text_draw.text((150, 40), str(option), fill='#FFFFFF', font=font, 
-                          stroke_width=3, stroke_fill='#000000', anchor='mm')
-            
-            rotated_text = text_img.rotate(-text_angle_deg, expand=True)
-            
-            text_w, text_h = rotated_text.size
-            paste_x = int(text_x - text_w // 2)
-            paste_y = int(text_y - text_h // 2)
-            
-            img.paste(rotated_text, (paste_x, paste_y), rotated_text)
-        
-        # Wheel Border
-        draw.ellipse([center-radius-5, center-radius-5, center+radius+5, center+radius+5], 
-                     outline='#FFFFFF', width=8)
-        
-        # Pointer/Arrow
-        draw.polygon([(center, center-radius-15), (center-20, center-radius-40), 
-                      (center+20, center-radius-40)], fill='#FFFFFF', outline='#000000', width=2)
-        
-        # Center Circle
-        draw.ellipse([center-25, center-25, center+25, center+25], fill='#FFFFFF', outline='#000000', width=3)
-        draw.ellipse([center-15, center-15, center+15, center+15], fill='#1a1a1a')
-        
-        return img
+        return WheelRenderer.render_frame(tuple(options), rotation_angle, highlight_index=selected_index)
     
     @staticmethod
-    async def create_spinning_wheel_gif(options: list, selected_option: str) -> io.BytesIO:
-        frames = []
+    def spin_variant(random_numbers: list) -> Tuple[int, int]:
+        """
+        Reduziert die True Random Zahlen auf (offset_bucket, rotation_count) - 
+        endlich viele Varianten, damit fertige GIFs gecacht werden können
+        """
+        # Random Offset innerhalb des Segments (quantisiert auf OFFSET_BUCKETS Stufen)
+        offset_bucket = min(random_numbers[0] * OFFSET_BUCKETS // 1000, OFFSET_BUCKETS - 1)
+        
+        # Random Anzahl zusätzlicher Umdrehungen
+        rotation_count = SPIN_ROTATION_COUNTS[random_numbers[1] % len(SPIN_ROTATION_COUNTS)]
         
+        return offset_bucket, rotation_count
+    
+    @staticmethod
+    def spin_parameters_for_variant(options: list, selected_index: int, offset_bucket: int, rotation_count: int) -> Tuple[float, float]:
+        """
+        Berechnet (total_rotation, final_angle) für eine Variante
+        """
+        angle_per_option = 360 / len(options)
+        
+        random_offset_factor = ((offset_bucket + 0.5) / OFFSET_BUCKETS) * 0.6 - 0.3
+        random_offset = random_offset_factor * angle_per_option
+        
+        # Berechne finalen Winkel
+        target_segment_angle = selected_index * angle_per_option + angle_per_option / 2
+        final_angle = 270 - target_segment_angle + random_offset
+        
+        total_rotation = 360 * rotation_count + final_angle
+        
+        logger.info(f"🎯 Final calculation: Segment at {target_segment_angle:.1f}°, Final position {final_angle:.1f}°, Total {total_rotation:.1f}°")
+        
+        return total_rotation, final_angle
+    
+    @staticmethod
+    def compute_spin_parameters(options: list, selected_index: int, random_numbers: list) -> Tuple[float, float]:
+        """
+        Berechnet (total_rotation, final_angle) aus den True Random Zahlen
+        """
+        offset_bucket, rotation_count = WheelGenerator.spin_variant(random_numbers)
+        
+        logger.info(f"🎲 True Random parameters: Index {selected_index}, Offset bucket={offset_bucket}/{OFFSET_BUCKETS}, Rotations={rotation_count}")
+        
+        return WheelGenerator.spin_parameters_for_variant(options, selected_index, offset_bucket, rotation_count)
+    
+    @staticmethod
+    async def create_spinning_wheel_gif(options: list, selected_option: str) -> io.BytesIO:
         try:
             selected_index = options.index(selected_option)
         except ValueError:
             logger.error(f"Selected option '{selected_option}' not found in options")
             selected_index = 0
-            
-        angle_per_option = 360 / len(options)
         
         # True Random Zahlen von random.org
-        random_numbers = await RandomService.get_true_random_numbers(3, 0, 1000)
-        
-        # Random Offset innerhalb des Segments
-        random_offset_factor = (random_numbers[0] / 1000) * 0.6 - 0.3
-        random_offset = random_offset_factor * angle_per_option
+        random_numbers = await RandomService.get_true_random_numbers(SPIN_RANDOM_NUMBERS, 0, 1000, purpose='wheel_spin')
         
-        # Random Anzahl zusätzlicher Umdrehungen
-        rotation_count = 4 + (random_numbers[1] % 4)
+        total_rotation, final_angle = WheelGenerator.compute_spin_parameters(options, selected_index, random_numbers)
         
-        logger.info(f"🎲 True Random parameters: Selected={selected_option} (Index {selected_index}), Offset={random_offset:.1f}°, Rotations={rotation_count}")
+        # Render-once, rotate-per-frame (siehe wheel_renderer.py)
+        return WheelRenderer.render_gif(options, selected_index, total_rotation, final_angle)
+    
+    @staticmethod
+    async def create_spinning_wheel(options: list, selected_option: str, config: Optional[Dict[str, Any]] = None,
+                                    random_numbers: Optional[list] = None) -> Tuple[Union[io.BytesIO, str], str]:
+        """
+        Wie create_spinning_wheel_gif, rendert aber im Process Pool (blockiert den Event Loop nicht).
+        Rückgabe: (Dateipfad aus dem GIF Cache | buffer, 'gif') oder (buffer, 'png') wenn der Pool
+        ausgelastet ist / Timeout
+        """
+        # Lazy Imports: Pool + Cache erst beim ersten Rendern anlegen
+        from .render_pool import get_render_pool
+        from .gif_cache import get_gif_cache
         
-        # Berechne finalen Winkel
-        target_segment_angle = selected_index * angle_per_option + angle_per_option / 2
-        final_angle = 270 - target_segment_angle + random_offset
+        try:
+            selected_index = options.index(selected_option)
+        except ValueError:
+            logger.error(f"Selected option '{selected_option}' not found in options")
+            selected_index = 0
         
-        total_rotation = 360 * rotation_count + final_angle
+        # random_numbers kann vorab im Batch gezogen werden (MatchWheelService.select_map_and_sides)
+        if random_numbers is None:
+            random_numbers = await RandomService.get_true_random_numbers(SPIN_RANDOM_NUMBERS, 0, 1000, purpose='wheel_spin')
+        offset_bucket, rotation_count = WheelGenerator.spin_variant(random_numbers)
         
-        logger.info(f"🎯 Final calculation: Segment at {target_segment_angle:.1f}°, Final position {final_angle:.1f}°, Total {total_rotation:.1f}°")
+        logger.info(f"🎲 True Random parameters: Selected={selected_option} (Index {selected_index}), Offset bucket={offset_bucket}/{OFFSET_BUCKETS}, Rotations={rotation_count}")
         
-        # Spin Animation
-        spin_frames = 80
-        for i in range(spin_frames):
-            progress = i / spin_frames
-            # Ease-out Animation
-            eased_progress = 1 - (1 - progress) ** 2
-            
-            current_angle = total_rotation * eased_progress
-            frame = WheelGenerator.create_wheel_frame(options, current_angle)
-            frames.append(frame)
-        
-        # Result Frames (Winner highlight)
-        for i in range(20):
-            frame = WheelGenerator.create_wheel_frame(options, final_angle, show_winner=True, selected_option=selected_option)
-            frames.append(frame)
-        
-        # GIF erstellen
-        gif_buffer = io.BytesIO()
-        frames[0].save(
-            gif_buffer, 
-            format='GIF',
-            save_all=True,
-            append_images=frames[1:],
-            duration=[40] * spin_frames + [100] * 20,  # Schnelle Animation + längere Anzeige
-            loop=0
+        return await WheelGenerator.render_variant(
+            options, selected_index, offset_bucket, rotation_count,
+            pool=get_render_pool(config), cache=get_gif_cache(config)
         )
-        gif_buffer.seek(0)
+    
+    @staticmethod
+    async def render_variant(options: list, selected_index: int, offset_bucket: int, rotation_count: int, pool, cache=None) -> Tuple[Union[io.BytesIO, str], str]:
+        """
+        Cache Lookup -> sonst Rendern im Pool und (nur echte GIFs) im Cache ablegen
+        """
+        key = None
+        expected_extension = pool.encoder.get('format', 'gif')
+        if cache is not None:
+            key = cache.make_key(options, selected_index, offset_bucket, rotation_count, pool.encoder)
+            cached_path = await asyncio.to_thread(cache.get_path, key, expected_extension)
+            if cached_path:
+                logger.info(f"📦 Wheel GIF cache hit: {key[:12]}")
+                return cached_path, expected_extension
+        
+        total_rotation, final_angle = WheelGenerator.spin_parameters_for_variant(options, selected_index, offset_bucket, rotation_count)
+        buffer, extension = await pool.render(options, selected_index, total_rotation, final_angle)
+        
+        # PNG = Fallback des Pools (ausgelastet/Timeout) - nicht cachen
+        if cache is not None and extension != 'png':
+            try:
+                await asyncio.to_thread(cache.put, key, buffer.getvalue(), extension)
+            except Exception as e:
+                logger.error(f"Error storing wheel GIF in cache: {e}")
+            buffer.seek(0)
+        
+        return buffer, extension
+    
+    @staticmethod
+    def prewarm_spin_variants(variants_per_selection: int = PREWARM_VARIANTS_PER_SELECTION) -> List[Tuple[int, int]]:
+        """
+        (offset_bucket, rotation_count) Paare, die pro Auswahl vorgerendert werden - gleichmäßig verteilt
+        """
+        count = max(1, min(variants_per_selection, OFFSET_BUCKETS * len(SPIN_ROTATION_COUNTS)))
+        if count <= OFFSET_BUCKETS:
+            # Verschiedene Offsets über das Segment verteilt, Umdrehungen reihum
+            return [((2 * i + 1) * OFFSET_BUCKETS // (2 * count), SPIN_ROTATION_COUNTS[i % len(SPIN_ROTATION_COUNTS)])
+                    for i in range(count)]
+        return [(i % OFFSET_BUCKETS, SPIN_ROTATION_COUNTS[i // OFFSET_BUCKETS]) for i in range(count)]
+    
+    @staticmethod
+    async def prewarm_cache(config: Optional[Dict[str, Any]] = None, variants_per_selection: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Rendert eine begrenzte Auswahl an Varianten für den aktuellen Map Pool vor (Map Wheel + Side Wheels),
+        z.B. vor dem Match-Abend. Pro Wheel wird zuerst eine Variante gerendert, um die GIF-Größe zu schätzen;
+        überschreitet die Schätzung PREWARM_BUDGET_SHARE von max_mb, werden die restlichen Varianten gekürzt
+        """
+        from .render_pool import get_render_pool
+        from .gif_cache import get_gif_cache
+        from .config_loader import WheelConfigLoader
+        
+        cache = get_gif_cache(config)
+        if cache is None:
+            return {'rendered': 0, 'cached': 0, 'failed': 0, 'skipped': 0, 'error': 'wheel cache disabled'}
+        
+        pool = get_render_pool(config)
+        spin_variants = WheelGenerator.prewarm_spin_variants(variants_per_selection or PREWARM_VARIANTS_PER_SELECTION)
+        
+        # Map Wheel zuerst (jedes Match), danach die Side Wheels in Map-Reihenfolge
+        maps = WheelConfigLoader.load_maps()
+        option_sets = [tuple(maps)]
+        for map_name in maps:
+            side_options = tuple(WheelConfigLoader.load_team_sides(map_name)['team1_options'])
+            if side_options not in option_sets:
+                option_sets.append(side_options)
+        
+        variants_by_set = {
+            options: [
+                (list(options), selected_index, offset_bucket, rotation_count)
+                for selected_index in range(len(options))
+                for offset_bucket, rotation_count in spin_variants
+            ]
+            for options in option_sets
+        }
+        
+        stats = {'rendered': 0, 'cached': 0, 'failed': 0, 'skipped': 0,
+                 'variants': sum(len(variants) for variants in variants_by_set.values())}
+        # Nicht mehr Jobs als Worker gleichzeitig - sonst greift der Saturation-Fallback (PNG)
+        semaphore = asyncio.Semaphore(pool.workers)
+        
+        async def warm(options, selected_index, offset_bucket, rotation_count) -> Optional[int]:
+            """Größe der gecachten Datei in Bytes, None wenn das Rendern fehlgeschlagen ist"""
+            async with semaphore:
+                key = cache.make_key(options, selected_index, offset_bucket, rotation_count, pool.encoder)
+                cached_path = await asyncio.to_thread(cache.get_path, key, pool.encoder.get('format', 'gif'))
+                if cached_path:
+                    stats['cached'] += 1
+                    return await asyncio.to_thread(os.path.getsize, cached_path)
+                
+                result, extension = await WheelGenerator.render_variant(options, selected_index, offset_bucket, rotation_count, pool=pool, cache=cache)
+                if extension == 'png':
+                    stats['failed'] += 1
+                    return None
+                stats['rendered'] += 1
+                return len(result.getvalue())
+        
+        # Probe: erste Variante jedes Wheels -> geschätzte Größe aller Varianten dieses Wheels
+        probe_sizes = await asyncio.gather(*(warm(*variants[0]) for variants in variants_by_set.values()))
+        
+        budget = cache.max_bytes * PREWARM_BUDGET_SHARE
+        estimated_bytes = sum(size or 0 for size in probe_sizes)
+        planned = []
+        for variants, size in zip(variants_by_set.values(), probe_sizes):
+            for variant in variants[1:]:
+                if size is None or estimated_bytes + size > budget:
+                    stats['skipped'] += 1
+                    continue
+                estimated_bytes += size
+                planned.append(variant)
+        
+        stats['estimated_mb'] = round(estimated_bytes / 1024 / 1024, 1)
+        if stats['skipped']:
+            logger.warning(f"⚠️ Wheel GIF pre-warm truncated: {stats['skipped']} variants skipped "
+                           f"(budget {budget / 1024 / 1024:.0f}MB of max_mb {cache.max_bytes / 1024 / 1024:.0f}MB)")
+        
+        logger.info(f"🔥 Pre-warming wheel GIF cache: {len(planned) + len(probe_sizes)}/{stats['variants']} variants "
+                    f"for {len(option_sets)} option sets (~{stats['estimated_mb']}MB)")
+        await asyncio.gather(*(warm(*variant) for variant in planned))
+        logger.info(f"✅ Wheel GIF cache pre-warm done: {stats}")
         
-        return gif_buffer
\ No newline at end of file
+        return stats
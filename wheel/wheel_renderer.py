@@ -0,0 +1,238 @@
+"""
+Wheel Renderer - Render-once, rotate-per-frame Engine
+Speichere als: wheel/wheel_renderer.py
+
+Die Wheel-Scheibe (Hintergrund + Segmente + Texte, RGB) wird pro (Optionen, Highlight) genau
+einmal gezeichnet. Spin-Frames entstehen durch NEAREST-Rotation dieser Basis-Scheibe - es entstehen
+keine neuen Mischfarben, die Frames bleiben so palettenfreundlich wie die alten pieslice-Frames.
+Das statische Overlay (Rand, Pointer, Center) wird über seine Maske eingefügt. Identische Frames
+(gleicher quantisierter Winkel) werden wiederverwendet.
+"""
+
+from PIL import Image, ImageDraw
+from functools import lru_cache
+import io
+import math
+import logging
+from typing import Tuple, List, Dict, Any, Optional, Callable
+from .render_assets import RenderAssets
+
+logger = logging.getLogger(__name__)
+
+SIZE = 600
+CENTER = SIZE // 2
+RADIUS = 250
+BACKGROUND_COLOR = '#1a1a1a'
+HIGHLIGHT_COLOR = '#DC143C'
+SEGMENT_COLORS = (
+    '#2C3E50',
+    '#8B0000',
+    '#34495E',
+    '#722F37',
+    '#1B2631',
+    '#A93226',
+    '#273746',
+    '#6C3483'
+)
+
+# Bei jeder Änderung am Aussehen erhöhen - invalidiert den GIF Cache (wheel/gif_cache.py)
+RENDER_VERSION = 2
+
+SPIN_FRAMES = 80
+SPIN_FRAME_DURATION_MS = 40
+RESULT_FRAMES = 20
+RESULT_FRAME_DURATION_MS = 100
+
+# Winkel-Auflösung für die Frame-Wiederverwendung (Grad)
+ANGLE_STEP = 0.25
+DISC_CACHE_SIZE = 32
+
+BACKEND_PILLOW = 'pillow'
+BACKEND_NUMPY = 'numpy'
+
+_NEAREST = getattr(Image, 'Resampling', Image).NEAREST
+
+
+def quantize_angle(angle: float) -> float:
+    return round((angle % 360) / ANGLE_STEP) * ANGLE_STEP % 360
+
+
+class WheelRenderer:
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def background_layer() -> Image.Image:
+        return Image.new('RGB', (SIZE, SIZE), BACKGROUND_COLOR)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def overlay_layer() -> Image.Image:
+        """
+        Rotationsinvariante Teile: Wheel Border, Pointer und Center Circle
+        """
+        overlay = Image.new('RGBA', (SIZE, SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        # Wheel Border
+        draw.ellipse([CENTER-RADIUS-5, CENTER-RADIUS-5, CENTER+RADIUS+5, CENTER+RADIUS+5],
+                     outline='#FFFFFF', width=8)
+
+        # Pointer/Arrow
+        draw.polygon([(CENTER, CENTER-RADIUS-15), (CENTER-20, CENTER-RADIUS-40),
+                      (CENTER+20, CENTER-RADIUS-40)], fill='#FFFFFF', outline='#000000', width=2)
+
+        # Center Circle
+        draw.ellipse([CENTER-25, CENTER-25, CENTER+25, CENTER+25], fill='#FFFFFF', outline='#000000', width=3)
+        draw.ellipse([CENTER-15, CENTER-15, CENTER+15, CENTER+15], fill=BACKGROUND_COLOR)
+
+        return overlay
+
+    @staticmethod
+    @lru_cache(maxsize=DISC_CACHE_SIZE)
+    def label_layer(options: Tuple[str, ...]) -> Image.Image:
+        """
+        Nur die Segment-Texte bei Rotation 0 (transparenter Hintergrund) - gecacht, nicht verändern
+        """
+        labels = Image.new('RGBA', (SIZE, SIZE), (0, 0, 0, 0))
+
+        angle_per_option = 360 / len(options)
+
+        for i, option in enumerate(options):
+            text_angle_deg = i * angle_per_option + angle_per_option / 2
+            text_angle_rad = math.radians(text_angle_deg)
+
+            text_radius = RADIUS * 0.6
+            text_x = CENTER + text_radius * math.cos(text_angle_rad)
+            text_y = CENTER + text_radius * math.sin(text_angle_rad)
+
+            # Vorgerasterter Sprite (Text + Stroke) aus dem Asset Cache, nur noch rotieren
+            rotated_text = RenderAssets.get_label_sprite(option).rotate(-text_angle_deg, expand=True)
+
+            text_w, text_h = rotated_text.size
+            labels.alpha_composite(rotated_text, (int(text_x - text_w // 2), int(text_y - text_h // 2)))
+
+        return labels
+
+    @staticmethod
+    @lru_cache(maxsize=DISC_CACHE_SIZE)
+    def disc_layer(options: Tuple[str, ...], highlight_index: int = -1) -> Image.Image:
+        """
+        Zeichnet Hintergrund + Segmente + Texte bei Rotation 0 (RGB) - gecacht, nicht verändern
+        """
+        disc = Image.new('RGBA', (SIZE, SIZE), BACKGROUND_COLOR)
+        draw = ImageDraw.Draw(disc)
+
+        angle_per_option = 360 / len(options)
+
+        for i in range(len(options)):
+            color = HIGHLIGHT_COLOR if i == highlight_index else SEGMENT_COLORS[i % len(SEGMENT_COLORS)]
+            draw.pieslice([CENTER-RADIUS, CENTER-RADIUS, CENTER+RADIUS, CENTER+RADIUS],
+                          i * angle_per_option, (i + 1) * angle_per_option,
+                          fill=color, outline='#FFFFFF', width=3)
+
+        disc.alpha_composite(WheelRenderer.label_layer(options))
+        return disc.convert('RGB')
+
+    @staticmethod
+    def render_frame(options: Tuple[str, ...], rotation_angle: float = 0, highlight_index: int = -1) -> Image.Image:
+        """
+        Ein Frame = rotierte Basis-Scheibe + statisches Overlay (RGB)
+        """
+        disc = WheelRenderer.disc_layer(tuple(str(option) for option in options), highlight_index)
+
+        # PIL pieslice-Winkel laufen im Uhrzeigersinn, Image.rotate gegen den Uhrzeigersinn.
+        # NEAREST: keine Interpolation (schnell, keine zusätzlichen Farben für das GIF)
+        angle = quantize_angle(rotation_angle)
+        if angle:
+            frame = disc.rotate(-angle, resample=_NEAREST, center=(CENTER, CENTER), fillcolor=BACKGROUND_COLOR)
+        else:
+            frame = disc.copy()
+
+        overlay = WheelRenderer.overlay_layer()
+        frame.paste(overlay, (0, 0), overlay)
+        return frame
+
+    @staticmethod
+    def frame_renderer_for(backend: str) -> Callable[..., Image.Image]:
+        """
+        'pillow' (Default) oder 'numpy' - ohne installiertes NumPy wird auf Pillow zurückgefallen
+        """
+        if backend == BACKEND_NUMPY:
+            from .numpy_renderer import NumpyWheelRenderer, NUMPY_AVAILABLE
+            if NUMPY_AVAILABLE:
+                return NumpyWheelRenderer.render_frame
+            logger.warning("NumPy backend requested but numpy is not installed - using Pillow backend")
+        return WheelRenderer.render_frame
+
+    @staticmethod
+    def spin_angles(total_rotation: float, spin_frames: int = SPIN_FRAMES) -> List[float]:
+        angles = []
+        for i in range(spin_frames):
+            progress = i / spin_frames
+            # Ease-out Animation
+            eased_progress = 1 - (1 - progress) ** 2
+            angles.append(total_rotation * eased_progress)
+        return angles
+
+    @staticmethod
+    def render_frames(options: list, selected_index: int, total_rotation: float, final_angle: float,
+                      frame_renderer: Optional[Callable[..., Image.Image]] = None) -> Tuple[List[Image.Image], List[int]]:
+        """
+        Liefert (frames, durations). Frames mit gleichem quantisierten Winkel werden wiederverwendet,
+        die 20 identischen Result-Frames werden zu einem Frame mit summierter Dauer zusammengefasst.
+        frame_renderer erlaubt ein anderes Backend mit der Signatur von render_frame (z.B. NumPy).
+        """
+        render_frame = frame_renderer or WheelRenderer.render_frame
+        options = tuple(str(option) for option in options)
+        frames = []
+        durations = []
+        frame_cache = {}
+        last_key = None
+
+        for angle in WheelRenderer.spin_angles(total_rotation):
+            key = quantize_angle(angle)
+            if key == last_key:
+                # Identischer Folge-Frame: nur die Dauer verlängern
+                durations[-1] += SPIN_FRAME_DURATION_MS
+                continue
+
+            frame = frame_cache.get(key)
+            if frame is None:
+                frame = frame_cache[key] = render_frame(options, key)
+
+            frames.append(frame)
+            durations.append(SPIN_FRAME_DURATION_MS)
+            last_key = key
+
+        # Result Frame (Winner highlight)
+        frames.append(render_frame(options, final_angle, highlight_index=selected_index))
+        durations.append(RESULT_FRAMES * RESULT_FRAME_DURATION_MS)
+
+        logger.debug(f"🎞️ Rendered {len(frame_cache) + 1} unique frames for {SPIN_FRAMES + RESULT_FRAMES} animation steps")
+        return frames, durations
+
+    @staticmethod
+    def render_gif(options: list, selected_index: int, total_rotation: float, final_angle: float) -> io.BytesIO:
+        """
+        Synchrones Rendern + GIF Encoding (reine Funktion der Parameter, keine Zufallsquelle)
+        """
+        buffer, _ = WheelRenderer.render_animation(
+            options, selected_index, total_rotation, final_angle, {'encoder': 'pillow', 'format': 'gif'}
+        )
+        return buffer
+
+    @staticmethod
+    def render_animation(options: list, selected_index: int, total_rotation: float, final_angle: float,
+                         encoder: Optional[Dict[str, Any]] = None) -> Tuple[io.BytesIO, str]:
+        """
+        Rendern + Encoding mit den Encoder-Settings (siehe gif_encoder.py). Rückgabe: (buffer, extension)
+        """
+        from .gif_encoder import WheelEncoder, encoder_settings
+
+        settings = encoder_settings(encoder)
+        frames, durations = WheelRenderer.render_frames(
+            options, selected_index, total_rotation, final_angle,
+            frame_renderer=WheelRenderer.frame_renderer_for(settings['backend'])
+        )
+        data, extension = WheelEncoder.encode(frames, durations, settings)
+        return io.BytesIO(data), extension